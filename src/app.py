@@ -1,3 +1,5 @@
+from PyQt6.QtWidgets import QApplication
+
 from src.database._database_manager import DatabaseManager
 from src.models._model_manager import Model_Manager
 from src.repositories._repo_manager import Repository_Manager
@@ -14,5 +16,11 @@ class Application:
         self.repo_manager = Repository_Manager(db)
         self.service_manager = Service_Manager(self.repo_manager)
         self.controller_manager = Controller_Manager(self.service_manager)
+        # Tiếp tục các job ảnh còn dang dở từ lần chạy trước
+        self.controller_manager.image_job_controller.start()
+        QApplication.instance().aboutToQuit.connect(self.controller_manager.image_job_controller.wait_for_done)
+        # Snapshot CSDL định kỳ, chạy nền (không chặn ghi)
+        self.controller_manager.backup_controller.start_schedule()
+        QApplication.instance().aboutToQuit.connect(self.controller_manager.backup_controller.shutdown)
         self.main_window = MainWindow(self.controller_manager, self.model_manager)
         self.main_window.show()
\ No newline at end of file
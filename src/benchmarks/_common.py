@@ -0,0 +1,146 @@
+# src/benchmarks/_common.py
+"""
+Shared helpers for the benchmark entry points (`python -m src.benchmarks.<name>`).
+
+Benchmarks always run with QT_QPA_PLATFORM=offscreen and against their own
+database file; they never touch `bin/database.db`.
+"""
+import json
+import math
+import os
+import platform
+import subprocess
+import sys
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+# Kept alive for the whole process; QtSql objects need a running Q(Core)Application.
+_app = None
+
+
+def use_database(db_path: str):
+    """Points the QtDatabase singleton at `db_path`; must run before the first QtDatabase()."""
+    from src.database.qt_database import QtDatabase
+
+    if QtDatabase._instance is not None and QtDatabase.db_path != db_path:
+        raise RuntimeError(
+            f"QtDatabase is already open on '{QtDatabase.db_path}', cannot switch to '{db_path}'."
+        )
+    QtDatabase.db_path = db_path
+
+
+def ensure_app():
+    """Returns the running QApplication, creating one (QtSql needs it) if necessary."""
+    global _app
+    from PyQt6.QtWidgets import QApplication
+
+    if QApplication.instance() is None:
+        _app = QApplication([])
+    return QApplication.instance()
+
+
+def quiet_logs():
+    """Silences INFO/DEBUG logging so it does not skew or clutter timings."""
+    import logging
+
+    logging.disable(logging.INFO)
+
+
+class Stopwatch:
+    """Collects named wall-clock timings (milliseconds) in insertion order."""
+
+    def __init__(self):
+        self.timings: Dict[str, float] = {}
+
+    @contextmanager
+    def measure(self, name: str) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.timings[name] = (time.perf_counter() - started) * 1000
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    """Nearest-rank percentile of `samples` (pct in 0..100)."""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    rank = max(0, min(len(ordered) - 1, math.ceil(pct / 100 * len(ordered)) - 1))
+    return ordered[rank]
+
+
+def summarize(samples: List[float]) -> Dict[str, float]:
+    """min / median / max of a list of millisecond timings."""
+    if not samples:
+        return {"min": 0.0, "median": 0.0, "max": 0.0}
+    return {
+        "min": min(samples),
+        "median": percentile(samples, 50),
+        "max": max(samples),
+    }
+
+
+def peak_rss_bytes(children: bool = False) -> Optional[int]:
+    """
+    Peak resident set size of this process (or of its waited-for children),
+    or None where the `resource` module is unavailable (Windows).
+
+    On Linux the own peak is read from /proc (VmHWM): getrusage() keeps the
+    peak of the parent across fork + exec, which would hide small processes.
+    """
+    if not children:
+        try:
+            with open("/proc/self/status", encoding="ascii") as f:
+                for line in f:
+                    if line.startswith("VmHWM:"):
+                        return int(line.split()[1]) * 1024
+        except OSError:
+            pass
+    try:
+        import resource
+    except ImportError:
+        return None
+    who = resource.RUSAGE_CHILDREN if children else resource.RUSAGE_SELF
+    peak = resource.getrusage(who).ru_maxrss
+    # Linux reports KiB, macOS bytes.
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def git_revision() -> Optional[str]:
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            timeout=10,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return result.stdout.strip() or None
+
+
+def run_metadata() -> Dict[str, Any]:
+    """Environment info stored with every result file so runs can be compared."""
+    from PyQt6.QtCore import QT_VERSION_STR
+
+    return {
+        "commit": git_revision(),
+        "created_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        "python": sys.version.split()[0],
+        "qt": QT_VERSION_STR,
+        "platform": platform.platform(),
+    }
+
+
+def write_results(path: str, payload: Dict[str, Any]):
+    """Writes benchmark results as pretty-printed JSON, creating parent folders."""
+    folder = os.path.dirname(os.path.abspath(path))
+    os.makedirs(folder, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(payload, f, ensure_ascii=False, indent=2)
+
@@ -0,0 +1,125 @@
+# src/benchmarks/decode_benchmark.py
+"""
+JPEG decode benchmark: full decode vs. the reduced-resolution decode stage.
+
+    python -m src.benchmarks.decode_benchmark --megapixels 12 24 48 --repeat 5 --output decode.json
+
+For each photo size a synthetic JPEG is written once (to --images-dir, where it
+is kept for later runs, or to a temp folder removed afterwards), then every
+target size is produced both ways:
+
+  * baseline: Image.open(path).convert("RGBA") followed by thumbnail(LANCZOS)
+  * fast:     image_handlers.load_thumbnail (draft()/reduce() before LANCZOS)
+
+and the median/min/max time per image and the speedup are reported.
+"""
+import argparse
+import os
+import random
+import shutil
+import tempfile
+import time
+from typing import Any, Dict, List, Tuple
+
+from src.benchmarks._common import run_metadata, summarize, write_results
+
+DEFAULT_OUTPUT = "./bin/benchmarks/decode.json"
+# Megapixels -> 4:3 photo size, as produced by phone cameras.
+PHOTO_SIZES = {
+    12: (4000, 3000),
+    24: (5664, 4248),
+    48: (8000, 6000),
+}
+# Preview label, thumbnail grid and a typical upload max edge.
+TARGET_SIZES = [(256, 256), (640, 640), (2048, 2048)]
+
+
+def write_photo(path: str, size: Tuple[int, int], seed: int):
+    """Writes a noisy gradient JPEG so decoding cost resembles a real photo."""
+    from PIL import Image, ImageFilter
+
+    rng = random.Random(seed)
+    noise = Image.effect_noise((size[0] // 8, size[1] // 8), 64).resize(size)
+    gradient = Image.linear_gradient("L").resize(size)
+    red = Image.blend(noise, gradient, 0.5)
+    green = gradient.rotate(rng.randrange(360)).filter(ImageFilter.GaussianBlur(2))
+    photo = Image.merge("RGB", (red, green, noise))
+    photo.save(path, "JPEG", quality=90)
+
+
+def baseline_thumbnail(path: str, size: Tuple[int, int]):
+    from PIL import Image
+
+    image = Image.open(path).convert("RGBA")
+    image.thumbnail(size, Image.LANCZOS)
+    return image
+
+
+def time_case(func, path: str, size: Tuple[int, int], repeat: int) -> Dict[str, Any]:
+    samples: List[float] = []
+    result_size = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        image = func(path, size)
+        samples.append((time.perf_counter() - started) * 1000)
+        result_size = image.size
+    return {"ms": summarize(samples), "samples": samples, "result_size": list(result_size)}
+
+
+def run(megapixels: List[int], repeat: int, images_dir: str) -> Dict[str, Any]:
+    from src.utils.image_handlers import load_thumbnail
+
+    # Ảnh tạm chỉ giữ lại khi người dùng chỉ định --images-dir
+    temp_dir = None if images_dir else tempfile.mkdtemp(prefix="decode_bench_")
+    images_dir = images_dir or temp_dir
+    os.makedirs(images_dir, exist_ok=True)
+    results: Dict[str, Any] = {}
+    try:
+        for mp in megapixels:
+            size = PHOTO_SIZES[mp]
+            path = os.path.join(images_dir, f"photo_{mp}mp.jpg")
+            if not os.path.exists(path):
+                write_photo(path, size, seed=mp)
+            for target in TARGET_SIZES:
+                baseline = time_case(baseline_thumbnail, path, target, repeat)
+                fast = time_case(load_thumbnail, path, target, repeat)
+                speedup = baseline["ms"]["median"] / fast["ms"]["median"] if fast["ms"]["median"] else 0.0
+                results[f"{mp}mp->{target[0]}"] = {
+                    "source_size": list(size),
+                    "file_bytes": os.path.getsize(path),
+                    "baseline": baseline,
+                    "fast": fast,
+                    "speedup": speedup,
+                }
+    finally:
+        if temp_dir:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+    return {
+        "benchmark": "decode",
+        "meta": run_metadata(),
+        "params": {"megapixels": megapixels, "repeat": repeat, "targets": TARGET_SIZES},
+        "results": results,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark reduced-resolution JPEG decoding.")
+    parser.add_argument("--megapixels", type=int, nargs="+", default=sorted(PHOTO_SIZES), choices=sorted(PHOTO_SIZES))
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--images-dir", default="", help="where the synthetic photos are written (reused if present)")
+    parser.add_argument("--output", default=DEFAULT_OUTPUT)
+    args = parser.parse_args(argv)
+
+    results = run(args.megapixels, args.repeat, args.images_dir)
+    write_results(args.output, results)
+    print(f"{'case':<16} {'baseline ms':>12} {'fast ms':>10} {'speedup':>8}")
+    for name, stats in results["results"].items():
+        print(
+            f"{name:<16} {stats['baseline']['ms']['median']:>12.1f} "
+            f"{stats['fast']['ms']['median']:>10.1f} {stats['speedup']:>7.1f}x"
+        )
+    print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
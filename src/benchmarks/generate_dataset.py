@@ -0,0 +1,412 @@
+# src/benchmarks/generate_dataset.py
+"""
+Synthetic dataset generator for scale testing.
+
+    python -m src.benchmarks.generate_dataset ./bin/bench/database.db \
+        --profiles 100000 --products 100000 --images-dir ./bin/bench/images --images-per-product 3
+
+Fills a fresh database with profiles, property products (only valid option
+keys from my_constants), misc products, property templates and settings.
+With --images-dir it also writes synthetic JPEGs in the layout the services
+read (`<images_dir>/<id>/<id>_source/`, `<images_dir>/<id>/<id>_logo/`) and
+points the `image_container_dir` / `logo_file` settings at them.
+
+The same seed always produces the same rows (ids and timestamps included).
+"""
+import argparse
+import itertools
+import os
+import random
+import time
+import uuid
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from PyQt6.QtSql import QSqlDatabase, QSqlQuery
+
+from src.benchmarks._common import ensure_app, use_database
+from src.my_constants import (
+    DB_TABLES,
+    PROFILE__NAME_OPTIONS,
+    PROPERTY_PRODUCT__STATUS_OPTIONS,
+    PROPERTY_PRODUCT__TRANSACTION_OPTIONS,
+    PROPERTY_PRODUCT__PROVINCE_OPTIONS,
+    PROPERTY_PRODUCT__DISTRICT_OPTIONS,
+    PROPERTY_PRODUCT__WARD_OPTIONS,
+    PROPERTY_PRODUCT__CATEGORY_OPTIONS,
+    PROPERTY_PRODUCT__LEGAL_OPTIONS,
+    PROPERTY_PRODUCT__BUILDING_LINE_OPTIONS,
+    PROPERTY_PRODUCT__FURNITURE_OPTIONS,
+    PROPERTY_TEMPLATE__NAME_OPTIONS,
+)
+from src.repositories._base_repo import BaseRepository
+from src.utils.logger import Logger
+
+logger = Logger(__name__)
+
+BATCH_SIZE = 10000
+DEFAULT_BASE_DATE = "2025-01-01"
+# Rows are spread over this many days before the base date.
+CREATED_SPAN_DAYS = 365
+IMAGE_SIZE = (800, 600)
+
+# transaction_type -> units a price can be expressed in, with a (min, max) price range.
+UNITS_BY_TRANSACTION: Dict[str, List[Tuple[str, float, float]]] = {
+    "sale": [("billion", 1, 30), ("million", 300, 990)],
+    "rental": [("million_per_month", 3, 80)],
+    "transfer": [("million", 50, 900), ("billion", 1, 5)],
+}
+# Categories that make sense for each transaction type.
+CATEGORIES_BY_TRANSACTION: Dict[str, List[str]] = {
+    "sale": list(PROPERTY_PRODUCT__CATEGORY_OPTIONS),
+    "rental": [
+        "townhouse", "street_front_house", "apartment_condo", "villa",
+        "warehouse_yard", "business_premises", "hotel", "homestay",
+    ],
+    "transfer": ["business_premises", "hotel", "homestay", "warehouse_yard"],
+}
+
+PROFILE_COLUMNS = [
+    "id", "mobile_ua", "desktop_ua", "uid", "status", "username", "password", "two_fa",
+    "email", "email_password", "phone_number", "profile_note", "profile_type",
+    "profile_group", "profile_name", "created_at", "updated_at",
+]
+PROPERTY_PRODUCT_COLUMNS = [
+    "id", "pid", "status", "transaction_type", "province", "district", "ward", "street",
+    "category", "area", "price", "unit", "legal", "structure", "function", "building_line",
+    "furniture", "description", "created_at", "updated_at",
+]
+MISC_PRODUCT_COLUMNS = ["id", "status", "name", "description", "created_at", "updated_at"]
+PROPERTY_TEMPLATE_COLUMNS = [
+    "id", "transaction_type", "name", "category", "value", "is_default", "created_at", "updated_at",
+]
+SETTING_COLUMNS = ["id", "name", "value", "is_selected", "created_at", "updated_at"]
+
+MOBILE_UA = (
+    "Mozilla/5.0 (iPhone; CPU iPhone OS 17_{minor} like Mac OS X) AppleWebKit/605.1.15 "
+    "(KHTML, like Gecko) Version/17.{minor} Mobile/15E148 Safari/604.1"
+)
+DESKTOP_UA = (
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_{minor}) AppleWebKit/605.1.15 "
+    "(KHTML, like Gecko) Version/17.{minor} Safari/605.1.15"
+)
+STREETS = [
+    "Phan Đình Phùng", "Hai Bà Trưng", "Trần Phú", "Bùi Thị Xuân", "Nguyễn Văn Cừ",
+    "Mai Anh Đào", "Hoàng Văn Thụ", "Ba Tháng Tư", "Yersin", "Khe Sanh",
+]
+
+
+class _RowClock:
+    """Deterministic created_at / updated_at pairs spread before a base date."""
+
+    def __init__(self, rng: random.Random, base_date: datetime):
+        self.rng = rng
+        self.base_date = base_date
+
+    def __call__(self) -> Tuple[str, str]:
+        created = self.base_date - timedelta(seconds=self.rng.randrange(CREATED_SPAN_DAYS * 86400))
+        updated = created + timedelta(seconds=self.rng.randrange(30 * 86400))
+        return (
+            created.strftime("%Y-%m-%d %H:%M:%S"),
+            min(updated, self.base_date).strftime("%Y-%m-%d %H:%M:%S"),
+        )
+
+
+def _seeded_id(rng: random.Random) -> str:
+    return str(uuid.UUID(int=rng.getrandbits(128), version=4))
+
+
+def _profile_rows(count: int, rng: random.Random, clock: _RowClock) -> Iterator[tuple]:
+    profile_names = list(PROFILE__NAME_OPTIONS)
+    for i in range(count):
+        created_at, updated_at = clock()
+        minor = rng.randrange(7)
+        yield (
+            _seeded_id(rng), MOBILE_UA.format(minor=minor), DESKTOP_UA.format(minor=minor),
+            str(100000000000000 + i), 1 if rng.random() < 0.8 else 0, f"user{i:07d}",
+            f"pw{rng.getrandbits(40):010x}", f"{rng.getrandbits(80):020X}",
+            f"user{i:07d}@mail.test", f"epw{rng.getrandbits(32):08x}",
+            f"09{rng.randrange(10 ** 8):08d}", "", f"type_{rng.randrange(4)}",
+            rng.randrange(1, 21), rng.choice(profile_names), created_at, updated_at,
+        )
+
+
+def _property_product_rows(count: int, rng: random.Random, clock: _RowClock) -> Iterator[tuple]:
+    statuses = list(PROPERTY_PRODUCT__STATUS_OPTIONS)
+    transactions = list(PROPERTY_PRODUCT__TRANSACTION_OPTIONS)
+    province = next(iter(PROPERTY_PRODUCT__PROVINCE_OPTIONS))
+    district = next(iter(PROPERTY_PRODUCT__DISTRICT_OPTIONS))
+    wards = list(PROPERTY_PRODUCT__WARD_OPTIONS)
+    legals = list(PROPERTY_PRODUCT__LEGAL_OPTIONS)
+    building_lines = list(PROPERTY_PRODUCT__BUILDING_LINE_OPTIONS)
+    furnitures = list(PROPERTY_PRODUCT__FURNITURE_OPTIONS)
+    for i in range(count):
+        created_at, updated_at = clock()
+        transaction = rng.choice(transactions)
+        category = rng.choice(CATEGORIES_BY_TRANSACTION[transaction])
+        unit, price_min, price_max = rng.choice(UNITS_BY_TRANSACTION[transaction])
+        ward = rng.choice(wards)
+        yield (
+            _seeded_id(rng), f"P{i:07d}", rng.choice(statuses), transaction, province, district,
+            ward, f"{rng.randrange(1, 300)} {rng.choice(STREETS)}", category,
+            round(rng.uniform(40, 1000), 1), round(rng.uniform(price_min, price_max), 1), unit,
+            rng.choice(legals), float(rng.randrange(0, 5)), f"{rng.randrange(1, 8)}pn",
+            rng.choice(building_lines), rng.choice(furnitures),
+            f"{PROPERTY_PRODUCT__CATEGORY_OPTIONS[category]} {PROPERTY_PRODUCT__WARD_OPTIONS[ward]} "
+            f"- mô tả mẫu số {i}",
+            created_at, updated_at,
+        )
+
+
+def _misc_product_rows(count: int, rng: random.Random, clock: _RowClock) -> Iterator[tuple]:
+    names = [name for name in PROFILE__NAME_OPTIONS if name != "real_estate"]
+    for i in range(count):
+        created_at, updated_at = clock()
+        name = rng.choice(names)
+        yield (
+            _seeded_id(rng), 1 if rng.random() < 0.9 else 0, name,
+            f"{PROFILE__NAME_OPTIONS[name]} sample #{i}", created_at, updated_at,
+        )
+
+
+def _property_template_rows(per_combo: int, rng: random.Random, clock: _RowClock) -> Iterator[tuple]:
+    for transaction, categories in CATEGORIES_BY_TRANSACTION.items():
+        for category in categories:
+            for part in PROPERTY_TEMPLATE__NAME_OPTIONS:
+                for n in range(per_combo):
+                    created_at, updated_at = clock()
+                    yield (
+                        _seeded_id(rng), transaction, part, category,
+                        f"<{part}> {transaction} {category} #{n}", 1 if n == 0 else 0,
+                        created_at, updated_at,
+                    )
+
+
+def _setting_rows(
+    rng: random.Random, clock: _RowClock, settings: Dict[str, Optional[str]], proxies: int
+) -> Iterator[tuple]:
+    for name, value in settings.items():
+        if value is None:
+            continue
+        created_at, updated_at = clock()
+        yield (_seeded_id(rng), name, value, 1, created_at, updated_at)
+    for i in range(proxies):
+        created_at, updated_at = clock()
+        yield (
+            _seeded_id(rng), "proxy", f"http://proxy.test/api?key={rng.getrandbits(64):016x}",
+            1 if i % 2 == 0 else 0, created_at, updated_at,
+        )
+
+
+def bulk_insert(
+    db: QSqlDatabase,
+    table: str,
+    columns: Sequence[str],
+    rows: Iterable[tuple],
+    batch_size: int = BATCH_SIZE,
+) -> int:
+    """
+    Inserts `rows` (tuples ordered like `columns`) with one prepared statement
+    and QSqlQuery.execBatch(), committing every `batch_size` rows.
+    """
+    repo = BaseRepository(db)
+    sql = (
+        f"INSERT INTO {table} ({', '.join(columns)}) "
+        f"VALUES ({', '.join(':' + column for column in columns)})"
+    )
+    inserted = 0
+    rows = iter(rows)
+    while True:
+        chunk = list(itertools.islice(rows, batch_size))
+        if not chunk:
+            break
+
+        def insert_chunk() -> Tuple[bool, Any]:
+            query = QSqlQuery(db)
+            query.prepare(sql)
+            for index, column in enumerate(columns):
+                query.bindValue(f":{column}", [row[index] for row in chunk])
+            if not query.execBatch():
+                logger.error(f"Bulk insert into {table} failed: {query.lastError().text()}")
+                return False, None
+            return True, len(chunk)
+
+        success, count = repo.execute_in_transaction(insert_chunk)
+        if not success:
+            raise RuntimeError(f"Bulk insert into {table} failed after {inserted} rows.")
+        inserted += count
+    return inserted
+
+
+def _draw_image(path: str, rng: random.Random, size: Tuple[int, int], label: str):
+    from PIL import Image, ImageDraw
+
+    width, height = size
+    image = Image.new("RGB", size, tuple(rng.randrange(256) for _ in range(3)))
+    draw = ImageDraw.Draw(image)
+    for _ in range(6):
+        x0, y0 = rng.randrange(width), rng.randrange(height)
+        x1 = x0 + rng.randrange(width // 8 + 1, width // 2 + 2)
+        y1 = y0 + rng.randrange(height // 8 + 1, height // 2 + 2)
+        draw.rectangle((x0, y0, x1, y1), fill=tuple(rng.randrange(256) for _ in range(3)))
+    draw.text((10, 10), label, fill=(255, 255, 255))
+    image.save(path, "JPEG", quality=85)
+
+
+def _write_logo(path: str):
+    from PIL import Image, ImageDraw
+
+    logo = Image.new("RGBA", (400, 160), (0, 0, 0, 0))
+    ImageDraw.Draw(logo).rounded_rectangle((0, 0, 399, 159), radius=24, fill=(200, 30, 30, 220))
+    logo.save(path, "PNG")
+
+
+def write_product_images(
+    images_dir: str,
+    product_ids: Iterable[str],
+    images_per_product: int,
+    rng: random.Random,
+    size: Tuple[int, int] = IMAGE_SIZE,
+) -> int:
+    """Writes `<id>/<id>_source/<id>_<i>.jpg` and `<id>/<id>_logo/<id>_<i>.jpg` per product."""
+    written = 0
+    for product_id in product_ids:
+        product_dir = os.path.join(images_dir, product_id)
+        source_dir = os.path.join(product_dir, f"{product_id}_source")
+        logo_dir = os.path.join(product_dir, f"{product_id}_logo")
+        os.makedirs(source_dir, exist_ok=True)
+        os.makedirs(logo_dir, exist_ok=True)
+        for i in range(images_per_product):
+            name = f"{product_id}_{i}.jpg"
+            _draw_image(os.path.join(source_dir, name), rng, size, f"{product_id} #{i}")
+            _draw_image(os.path.join(logo_dir, name), rng, size, f"{product_id} #{i} logo")
+            written += 2
+    return written
+
+
+def generate_dataset(
+    db_path: str,
+    profiles: int = 1000,
+    products: int = 1000,
+    misc_products: int = 0,
+    templates_per_combo: int = 2,
+    proxies: int = 10,
+    images_dir: Optional[str] = None,
+    images_per_product: int = 0,
+    image_size: Tuple[int, int] = IMAGE_SIZE,
+    seed: int = 0,
+    base_date: str = DEFAULT_BASE_DATE,
+    overwrite: bool = False,
+) -> Dict[str, int]:
+    """
+    Creates `db_path` and fills it with synthetic rows. Returns the number of
+    rows per table (plus "images" if image folders were written).
+    """
+    if os.path.exists(db_path):
+        if not overwrite:
+            raise FileExistsError(f"'{db_path}' already exists; pass overwrite=True to replace it.")
+        os.remove(db_path)
+    os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+
+    ensure_app()
+    use_database(db_path)
+    from src.database._database_manager import DatabaseManager
+
+    db = DatabaseManager().get_db()
+    base = datetime.strptime(base_date, "%Y-%m-%d")
+
+    def rng_for(name: str) -> random.Random:
+        # One stream per table: changing one count does not reshuffle the others.
+        return random.Random(f"{seed}:{name}")
+
+    logo_file = None
+    if images_dir:
+        os.makedirs(images_dir, exist_ok=True)
+        logo_file = os.path.abspath(os.path.join(images_dir, "logo.png"))
+        _write_logo(logo_file)
+    settings = {
+        "image_container_dir": os.path.abspath(images_dir) if images_dir else None,
+        "logo_file": logo_file,
+        "profile_container_dir": os.path.abspath(os.path.join(os.path.dirname(db_path), "profiles")),
+    }
+
+    counts: Dict[str, int] = {}
+    rng = rng_for("profile")
+    counts["profile"] = bulk_insert(
+        db, DB_TABLES["profile"], PROFILE_COLUMNS,
+        _profile_rows(profiles, rng, _RowClock(rng, base)),
+    )
+    rng = rng_for("property_product")
+    product_ids: List[str] = []
+
+    def tracked_products() -> Iterator[tuple]:
+        for row in _property_product_rows(products, rng, _RowClock(rng, base)):
+            if images_dir and images_per_product:
+                product_ids.append(row[0])
+            yield row
+
+    counts["property_product"] = bulk_insert(
+        db, DB_TABLES["property_product"], PROPERTY_PRODUCT_COLUMNS, tracked_products()
+    )
+    rng = rng_for("misc_product")
+    counts["misc_product"] = bulk_insert(
+        db, DB_TABLES["misc_product"], MISC_PRODUCT_COLUMNS,
+        _misc_product_rows(misc_products, rng, _RowClock(rng, base)),
+    )
+    rng = rng_for("property_template")
+    counts["property_template"] = bulk_insert(
+        db, DB_TABLES["property_template"], PROPERTY_TEMPLATE_COLUMNS,
+        _property_template_rows(templates_per_combo, rng, _RowClock(rng, base)),
+    )
+    rng = rng_for("setting")
+    counts["setting"] = bulk_insert(
+        db, DB_TABLES["setting"], SETTING_COLUMNS,
+        _setting_rows(rng, _RowClock(rng, base), settings, proxies),
+    )
+
+    if product_ids:
+        counts["images"] = write_product_images(
+            images_dir, product_ids, images_per_product, rng_for("images"), image_size
+        )
+    return counts
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate a synthetic database for scale testing.")
+    parser.add_argument("db_path", help="database file to create")
+    parser.add_argument("--profiles", type=int, default=1000)
+    parser.add_argument("--products", type=int, default=1000, help="property products")
+    parser.add_argument("--misc-products", type=int, default=0)
+    parser.add_argument("--templates-per-combo", type=int, default=2,
+                        help="templates per (transaction, category, part)")
+    parser.add_argument("--proxies", type=int, default=10)
+    parser.add_argument("--images-dir", default=None, help="also write image folders here")
+    parser.add_argument("--images-per-product", type=int, default=3)
+    parser.add_argument("--image-size", default=f"{IMAGE_SIZE[0]}x{IMAGE_SIZE[1]}", help="WIDTHxHEIGHT")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--base-date", default=DEFAULT_BASE_DATE, help="newest timestamp (YYYY-MM-DD)")
+    parser.add_argument("--overwrite", action="store_true")
+    args = parser.parse_args(argv)
+
+    width, height = (int(v) for v in args.image_size.lower().split("x"))
+    started = time.perf_counter()
+    counts = generate_dataset(
+        db_path=args.db_path,
+        profiles=args.profiles,
+        products=args.products,
+        misc_products=args.misc_products,
+        templates_per_combo=args.templates_per_combo,
+        proxies=args.proxies,
+        images_dir=args.images_dir,
+        images_per_product=args.images_per_product if args.images_dir else 0,
+        image_size=(width, height),
+        seed=args.seed,
+        base_date=args.base_date,
+        overwrite=args.overwrite,
+    )
+    elapsed = time.perf_counter() - started
+    logger.info(f"Generated {counts} in {elapsed:.1f}s -> {args.db_path}")
+
+
+if __name__ == "__main__":
+    main()
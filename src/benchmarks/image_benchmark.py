@@ -0,0 +1,307 @@
+# src/benchmarks/image_benchmark.py
+"""
+Image pipeline benchmark for `src/utils/image_handlers.py`.
+
+    python -m src.benchmarks.image_benchmark --megapixels 12 24 --images 8 --workers 1 4 --output images.json
+    python -m src.benchmarks.image_benchmark --compare images.json   # print the change against an earlier run
+
+Cases (one per configuration):
+
+  * insert_logo_to_images     per photo size x output profile x worker count
+  * copy_source_images        per photo size
+  * get_images                a folder of --list-files images, listed repeatedly
+  * process_images_with_logo  per photo size (default workers and output profile)
+
+Synthetic photos and the logo are written once with fixed seeds (to
+--images-dir or a temp folder) and reused, so runs on the same machine are
+comparable. Every case runs in a fresh interpreter: after --warmup untimed
+rounds (which also fill the prepared-logo cache and start the process pool)
+it is timed --repeat times. Reported per case: images/sec (median round),
+bytes written per round and the peak RSS of the main process and of the
+pool worker processes.
+"""
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Any, Dict, List, Optional
+
+from src.benchmarks._common import peak_rss_bytes, quiet_logs, run_metadata, summarize, write_results
+from src.benchmarks.decode_benchmark import PHOTO_SIZES, write_photo
+
+DEFAULT_OUTPUT = "./bin/benchmarks/images.json"
+CASE_FUNCTIONS = ["insert_logo_to_images", "copy_source_images", "get_images", "process_images_with_logo"]
+# name -> ImageOutputProfile arguments
+OUTPUT_PROFILES = {
+    "png": {},
+    "jpeg-2048": {"format": "JPEG", "quality": 85, "max_edge": 2048},
+    "webp-2048": {"format": "WEBP", "quality": 80, "max_edge": 2048},
+}
+LOGO_SIZE = (600, 240)
+# get_images is fast; each timed round lists the folder this many times.
+LIST_ROUNDS = 20
+
+
+def write_logo(path: str):
+    """Writes a semi-transparent logo with antialiased edges, like a real watermark."""
+    from PIL import Image, ImageDraw, ImageFilter
+
+    logo = Image.new("RGBA", LOGO_SIZE, (0, 0, 0, 0))
+    draw = ImageDraw.Draw(logo)
+    draw.rounded_rectangle((8, 8, LOGO_SIZE[0] - 9, LOGO_SIZE[1] - 9), radius=40, fill=(200, 30, 30, 220))
+    draw.ellipse((40, 40, 200, 200), fill=(255, 255, 255, 255))
+    logo.putalpha(logo.getchannel("A").filter(ImageFilter.GaussianBlur(2)))
+    logo.save(path, "PNG")
+
+
+def prepare_inputs(images_dir: str, megapixels: List[int], images: int) -> Dict[str, Any]:
+    """Writes (or reuses) the seeded photos and the logo; returns their paths."""
+    os.makedirs(images_dir, exist_ok=True)
+    photos: Dict[str, List[str]] = {}
+    for mp in megapixels:
+        paths = []
+        for i in range(images):
+            path = os.path.join(images_dir, f"photo_{mp}mp_{i}.jpg")
+            if not os.path.exists(path):
+                write_photo(path, PHOTO_SIZES[mp], seed=mp * 1000 + i)
+            paths.append(path)
+        photos[str(mp)] = paths
+    logo_path = os.path.join(images_dir, "logo.png")
+    if not os.path.exists(logo_path):
+        write_logo(logo_path)
+    return {"photos": photos, "logo": logo_path}
+
+
+def build_cases(
+    functions: List[str], megapixels: List[int], profiles: List[str], workers: List[int]
+) -> List[Dict[str, Any]]:
+    cases = []
+    for function in functions:
+        if function == "get_images":
+            cases.append({"name": function, "function": function, "megapixels": megapixels[0]})
+            continue
+        for mp in megapixels:
+            if function == "insert_logo_to_images":
+                for profile in profiles:
+                    for worker_count in workers:
+                        cases.append({
+                            "name": f"{function}:{mp}mp:{profile}:w{worker_count}",
+                            "function": function,
+                            "megapixels": mp,
+                            "profile": profile,
+                            "workers": worker_count,
+                        })
+            else:
+                cases.append({"name": f"{function}:{mp}mp", "function": function, "megapixels": mp})
+    return cases
+
+
+def _folder_bytes(folder: str) -> int:
+    total = 0
+    for root, _, files in os.walk(folder):
+        for name in files:
+            total += os.path.getsize(os.path.join(root, name))
+    return total
+
+
+def _make_listing_folder(folder: str, source: str, count: int):
+    """Fills `folder` with `count` image names (hard links to one photo when possible)."""
+    os.makedirs(folder, exist_ok=True)
+    for i in range(count):
+        path = os.path.join(folder, f"img_{i:05d}.jpg")
+        try:
+            os.link(source, path)
+        except OSError:
+            shutil.copyfile(source, path)
+
+
+def measure_case(case: Dict[str, Any], inputs: Dict[str, Any], params: Dict[str, Any]) -> Dict[str, Any]:
+    """Runs one case in the current (fresh) process."""
+    from src.utils import image_handlers
+    from src.utils.image_handlers import ImageOutputProfile
+
+    sources = inputs["photos"][str(case["megapixels"])]
+    logo_path = inputs["logo"]
+    work_dir = tempfile.mkdtemp(prefix="image_bench_")
+    function = case["function"]
+    items_per_round = len(sources)
+    list_folder = os.path.join(work_dir, "listing")
+    if function == "get_images":
+        _make_listing_folder(list_folder, sources[0], params["list_files"])
+        items_per_round = params["list_files"] * LIST_ROUNDS
+
+    def run_round(out_dir: str):
+        if function == "insert_logo_to_images":
+            written = image_handlers.insert_logo_to_images(
+                sources,
+                logo_path,
+                out_dir,
+                "bench",
+                opacity=0.7,
+                max_workers=case["workers"],
+                output_profile=ImageOutputProfile(**OUTPUT_PROFILES[case["profile"]]),
+            )
+            if len(written) != len(sources):
+                raise RuntimeError(f"{len(sources) - len(written)} image(s) failed")
+        elif function == "copy_source_images":
+            image_handlers.copy_source_images(sources, out_dir, "bench")
+        elif function == "get_images":
+            for _ in range(LIST_ROUNDS):
+                image_handlers.get_images(list_folder)
+        elif function == "process_images_with_logo":
+            if image_handlers.process_images_with_logo(sources, out_dir, logo_path, "bench", 0.7) is False:
+                raise RuntimeError("process_images_with_logo failed")
+
+    samples: List[float] = []
+    bytes_written: List[int] = []
+    rss_before = peak_rss_bytes()
+    try:
+        for round_index in range(params["warmup"] + params["repeat"]):
+            out_dir = os.path.join(work_dir, f"round_{round_index}")
+            started = time.perf_counter()
+            run_round(out_dir)
+            elapsed = (time.perf_counter() - started) * 1000
+            if round_index >= params["warmup"]:
+                samples.append(elapsed)
+                bytes_written.append(_folder_bytes(out_dir) if os.path.isdir(out_dir) else 0)
+            shutil.rmtree(out_dir, ignore_errors=True)
+        # Đợi các worker process thoát hẳn để RUSAGE_CHILDREN tính cả chúng
+        image_handlers.shutdown_image_pool(wait=True)
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    ms = summarize(samples)
+    return {
+        "case": case,
+        "items_per_round": items_per_round,
+        "ms": ms,
+        "samples_ms": samples,
+        "images_per_sec": items_per_round / (ms["median"] / 1000) if ms["median"] else 0.0,
+        "bytes_written": max(bytes_written) if bytes_written else 0,
+        "peak_rss_bytes": peak_rss_bytes(),
+        "startup_rss_bytes": rss_before,
+        "workers_peak_rss_bytes": peak_rss_bytes(children=True),
+    }
+
+
+def run_child(spec: Dict[str, Any]) -> Dict[str, Any]:
+    """Runs a `--child` spec (a case, or preparing the inputs) in a new interpreter and returns its result."""
+    with tempfile.NamedTemporaryFile("r", suffix=".json", delete=False) as f:
+        result_path = f.name
+    try:
+        subprocess.run(
+            [sys.executable, "-m", "src.benchmarks.image_benchmark", "--child",
+             json.dumps(spec), "--output", result_path],
+            check=True,
+        )
+        with open(result_path, encoding="utf-8") as f:
+            return json.load(f)
+    finally:
+        os.remove(result_path)
+
+
+def run(
+    functions: List[str],
+    megapixels: List[int],
+    images: int,
+    profiles: List[str],
+    workers: List[int],
+    list_files: int,
+    repeat: int,
+    warmup: int,
+    images_dir: str,
+) -> Dict[str, Any]:
+    import PIL
+
+    images_dir = images_dir or os.path.join(tempfile.gettempdir(), "image_bench_inputs")
+    # Ghi ảnh trong process riêng: peak RSS của process cha được kế thừa qua fork
+    inputs = run_child({"prepare": {"images_dir": images_dir, "megapixels": megapixels, "images": images}})
+    params = {"repeat": repeat, "warmup": warmup, "list_files": list_files}
+    results = {}
+    for case in build_cases(functions, megapixels, profiles, workers):
+        print(f"running {case['name']} ...", flush=True)
+        results[case["name"]] = run_child({"case": case, "inputs": inputs, "params": params})
+    meta = run_metadata()
+    meta.update({"pillow": PIL.__version__, "cpu_count": os.cpu_count()})
+    return {
+        "benchmark": "images",
+        "meta": meta,
+        "params": dict(params, megapixels=megapixels, images=images, profiles=profiles, workers=workers),
+        "results": results,
+    }
+
+
+def _mb(value: Optional[int]) -> str:
+    return "n/a" if value is None else f"{value / (1024 * 1024):.1f}"
+
+
+def print_results(results: Dict[str, Any], previous: Optional[Dict[str, Any]] = None):
+    header = f"{'case':<46} {'img/s':>11} {'MB written':>11} {'RSS MB':>8} {'workers RSS':>12}"
+    if previous:
+        header += f" {'vs prev':>8}"
+    print(header)
+    previous_results = (previous or {}).get("results", {})
+    for name, stats in results["results"].items():
+        # Không có process con (chạy trong process chính): để trống
+        workers_rss = _mb(stats["workers_peak_rss_bytes"]) if stats["workers_peak_rss_bytes"] else "-"
+        line = (
+            f"{name:<46} {stats['images_per_sec']:>11.2f} {_mb(stats['bytes_written']):>11} "
+            f"{_mb(stats['peak_rss_bytes']):>8} {workers_rss:>12}"
+        )
+        before = previous_results.get(name)
+        if previous is not None:
+            if before and before.get("images_per_sec"):
+                change = (stats["images_per_sec"] / before["images_per_sec"] - 1) * 100
+                line += f" {change:>+7.1f}%"
+            else:
+                line += f" {'-':>8}"
+        print(line)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the image pipeline (throughput, bytes written, peak RSS).")
+    parser.add_argument("--cases", nargs="+", default=CASE_FUNCTIONS, choices=CASE_FUNCTIONS)
+    parser.add_argument("--megapixels", type=int, nargs="+", default=[12], choices=sorted(PHOTO_SIZES))
+    parser.add_argument("--images", type=int, default=6, help="photos per batch")
+    parser.add_argument("--profiles", nargs="+", default=["png", "jpeg-2048"], choices=sorted(OUTPUT_PROFILES))
+    parser.add_argument(
+        "--workers", type=int, nargs="+", default=sorted({1, os.cpu_count() or 1}),
+        help="worker process counts for insert_logo_to_images",
+    )
+    parser.add_argument("--list-files", type=int, default=2000, help="folder size for the get_images case")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--warmup", type=int, default=1)
+    parser.add_argument("--images-dir", default="", help="where the synthetic photos are written (reused if present)")
+    parser.add_argument("--output", default=DEFAULT_OUTPUT)
+    parser.add_argument("--compare", default="", help="earlier results file to compare against")
+    parser.add_argument("--child", default="", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.child:
+        quiet_logs()
+        spec = json.loads(args.child)
+        if "prepare" in spec:
+            write_results(args.output, prepare_inputs(**spec["prepare"]))
+        else:
+            write_results(args.output, measure_case(spec["case"], spec["inputs"], spec["params"]))
+        return
+
+    previous = None
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            previous = json.load(f)
+    results = run(
+        args.cases, args.megapixels, args.images, args.profiles, args.workers,
+        args.list_files, args.repeat, args.warmup, args.images_dir,
+    )
+    write_results(args.output, results)
+    print_results(results, previous)
+    print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,260 @@
+# src/benchmarks/repository_benchmark.py
+"""
+Repository-layer micro-benchmarks.
+
+    python -m src.benchmarks.repository_benchmark --rows 100000 --iterations 2000 --output repo.json
+
+Runs against a generated database, or a temporary copy of --db (the write
+cases never touch the original file). Every case reports ops/sec plus p50/p99/mean latency per
+operation; write and point-read cases run both in autocommit mode and inside
+one explicit transaction.
+"""
+import argparse
+import os
+import random
+import shutil
+import tempfile
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from PyQt6.QtSql import QSqlQuery
+
+from src.benchmarks._common import (
+    ensure_app,
+    percentile,
+    quiet_logs,
+    run_metadata,
+    use_database,
+    write_results,
+)
+from src.benchmarks.generate_dataset import generate_dataset
+from src.my_constants import DB_TABLES
+from src.my_types import Profile_Type, PropertyProduct_Type
+from src.utils.db_backup import backup_database
+
+DEFAULT_OUTPUT = "./bin/benchmarks/repository.json"
+BULK_BATCH_SIZES = [100, 1000, 10000]
+
+
+def _profile_payload(i: int) -> Profile_Type:
+    return Profile_Type(
+        None, "ua-mobile", "ua-desktop", f"bench{i}", 1, f"bench_user{i}", "pw", "", f"bench{i}@mail.test",
+        "", "", "", "", 1, "real_estate", None, None,
+    )
+
+
+def _product_payload(i: int) -> PropertyProduct_Type:
+    return PropertyProduct_Type(
+        None, f"B{i:07d}", "selling", "sale", "lam_dong", "da_lat", "phuong_1_xuan_huong",
+        f"{i} Trần Phú", "townhouse", 120.0, 5.5, "billion", "private_construction_deed",
+        2.0, "3pn", "car_access_road", "basic_furniture", "bench", None, None,
+    )
+
+
+class RepositoryBenchmark:
+    def __init__(self, repo_manager, iterations: int, seed: int):
+        self.repo_manager = repo_manager
+        self.db = repo_manager.profile_repo.db
+        self.iterations = iterations
+        self.rng = random.Random(seed)
+        self.results: Dict[str, Dict[str, Any]] = {}
+        self._counter = 0
+
+    def _ids(self, table: str) -> List[str]:
+        query = QSqlQuery(self.db)
+        query.exec(f"SELECT id FROM {table}")
+        ids = []
+        while query.next():
+            ids.append(query.value(0))
+        return ids
+
+    def _next(self) -> int:
+        self._counter += 1
+        return self._counter
+
+    def measure(
+        self,
+        name: str,
+        operation: Callable[[], Any],
+        iterations: Optional[int] = None,
+        in_transaction: bool = False,
+        items_per_op: int = 1,
+    ):
+        """Times `operation` `iterations` times and stores ops/sec and latency percentiles."""
+        iterations = iterations or self.iterations
+        latencies: List[float] = []
+        if in_transaction:
+            self.db.transaction()
+        started = time.perf_counter()
+        try:
+            for _ in range(iterations):
+                op_started = time.perf_counter()
+                operation()
+                latencies.append((time.perf_counter() - op_started) * 1000)
+        finally:
+            if in_transaction:
+                self.db.commit()
+        total = time.perf_counter() - started
+        label = f"{name}[tx]" if in_transaction else name
+        self.results[label] = {
+            "ops": iterations,
+            "total_s": total,
+            "ops_per_sec": iterations / total if total else 0.0,
+            "items_per_sec": iterations * items_per_op / total if total else 0.0,
+            "p50_ms": percentile(latencies, 50),
+            "p99_ms": percentile(latencies, 99),
+            "mean_ms": sum(latencies) / len(latencies) if latencies else 0.0,
+        }
+
+    def run(self) -> Dict[str, Dict[str, Any]]:
+        profile_repo = self.repo_manager.profile_repo
+        product_repo = self.repo_manager.property_product_repo
+        misc_repo = self.repo_manager.misc_product_repo
+        template_repo = self.repo_manager.property_template_repo
+        profile_ids = self._ids(DB_TABLES["profile"])
+        product_ids = self._ids(DB_TABLES["property_product"])
+
+        for in_transaction in (False, True):
+            self.measure(
+                "profile.insert",
+                lambda: profile_repo.insert(_profile_payload(self._next())),
+                in_transaction=in_transaction,
+            )
+            self.measure(
+                "property_product.insert",
+                lambda: product_repo.insert(_product_payload(self._next())),
+                in_transaction=in_transaction,
+            )
+            self.measure(
+                "profile.get_by_id",
+                lambda: profile_repo.get_profile_by_id(self.rng.choice(profile_ids)),
+                in_transaction=in_transaction,
+            )
+            self.measure(
+                "property_product.get_by_id",
+                lambda: product_repo.get_product_by_id(self.rng.choice(product_ids)),
+                in_transaction=in_transaction,
+            )
+            self.measure(
+                "profile.change_status",
+                lambda: profile_repo.change_status(self.rng.choice(profile_ids), self.rng.randrange(2)),
+                in_transaction=in_transaction,
+            )
+            self.measure(
+                "property_product.change_status",
+                lambda: product_repo.change_status(self.rng.choice(product_ids), "selling"),
+                in_transaction=in_transaction,
+            )
+
+        # insert_bulk always runs in its own transaction.
+        for batch_size in BULK_BATCH_SIZES:
+            repeats = max(1, min(20, self.iterations * 10 // batch_size))
+            self.measure(
+                f"profile.insert_bulk({batch_size})",
+                lambda: profile_repo.insert_bulk(
+                    [_profile_payload(self._next()) for _ in range(batch_size)]
+                ),
+                iterations=repeats,
+                items_per_op=batch_size,
+            )
+            self.measure(
+                f"property_product.insert_bulk({batch_size})",
+                lambda: product_repo.insert_bulk(
+                    [_product_payload(self._next()) for _ in range(batch_size)]
+                ),
+                iterations=repeats,
+                items_per_op=batch_size,
+            )
+
+        # Random picks (ORDER BY RANDOM() LIMIT 1).
+        random_iterations = max(1, self.iterations // 10)
+        self.measure(
+            "property_product.get_random_by_transaction_and_days",
+            lambda: product_repo.get_random_product_by_transaction_and_update_days(
+                self.rng.choice(["sale", "rental", "transfer"]), self.rng.randrange(1, 30)
+            ),
+            iterations=random_iterations,
+        )
+        self.measure(
+            "misc_product.get_random_by_name_and_days",
+            lambda: misc_repo.get_random_product_by_name_and_update_days(
+                self.rng.choice(["tire", "fashion"]), self.rng.randrange(1, 30)
+            ),
+            iterations=random_iterations,
+        )
+        self.measure(
+            "property_template.get_random_by_filters",
+            lambda: template_repo.get_random_template_by_filters(
+                "sale", self.rng.choice(["title", "description"]), "townhouse", True
+            ),
+            iterations=random_iterations,
+        )
+
+        # Full scans, measured last since they include the rows inserted above.
+        self.measure(
+            "profile.get_all",
+            profile_repo.get_all_profiles,
+            iterations=3,
+            items_per_op=len(self._ids(DB_TABLES["profile"])),
+        )
+        self.measure(
+            "property_product.get_all",
+            product_repo.get_all_products,
+            iterations=3,
+            items_per_op=len(self._ids(DB_TABLES["property_product"])),
+        )
+        return self.results
+
+
+def run(rows: int, iterations: int, db_path: str, seed: int) -> Dict[str, Any]:
+    workdir = tempfile.mkdtemp(prefix="repo_bench_")
+    bench_db = os.path.join(workdir, "database.db")
+    try:
+        if db_path:
+            # API backup: bản sao gồm cả phần còn trong file -wal của database đang mở
+            backup_database(db_path, bench_db, step_pages=-1)
+        else:
+            generate_dataset(bench_db, profiles=rows, products=rows, misc_products=rows, seed=seed)
+
+        ensure_app()
+        use_database(bench_db)
+        from src.database._database_manager import DatabaseManager
+        from src.database.qt_database import QtDatabase
+        from src.repositories._repo_manager import Repository_Manager
+
+        repo_manager = Repository_Manager(DatabaseManager().get_db())
+        results = RepositoryBenchmark(repo_manager, iterations, seed).run()
+        QtDatabase().close_connection()
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+    return {
+        "benchmark": "repository",
+        "meta": run_metadata(),
+        "params": {"rows": rows, "iterations": iterations, "db": db_path or None, "seed": seed},
+        "results": results,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the repository layer.")
+    parser.add_argument("--rows", type=int, default=10000, help="rows per main table in the generated DB")
+    parser.add_argument("--iterations", type=int, default=1000, help="operations per case")
+    parser.add_argument("--db", default="", help="benchmark a copy of an existing database")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default=DEFAULT_OUTPUT)
+    args = parser.parse_args(argv)
+
+    quiet_logs()
+    results = run(args.rows, args.iterations, args.db, args.seed)
+    write_results(args.output, results)
+    print(f"{'case':<56} {'ops/s':>10} {'items/s':>10} {'p50 ms':>9} {'p99 ms':>9}")
+    for name, stats in results["results"].items():
+        print(
+            f"{name:<56} {stats['ops_per_sec']:>10.1f} {stats['items_per_sec']:>10.1f} "
+            f"{stats['p50_ms']:>9.3f} {stats['p99_ms']:>9.3f}"
+        )
+    print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
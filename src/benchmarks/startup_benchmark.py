@@ -0,0 +1,162 @@
+# src/benchmarks/startup_benchmark.py
+"""
+Startup benchmark: how long it takes to get from `import src.app` to a built window.
+
+    python -m src.benchmarks.startup_benchmark --rows 10000 --repeat 5 --output startup.json
+
+Every repeat runs in a fresh interpreter (cold imports, new connection) and
+times DB open, `_init_tables`, each manager, the first load of each model and
+the construction of each page. The JSON output holds every sample plus
+min/median/max per step so two commits can be compared.
+"""
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+from importlib import import_module
+from typing import Any, Dict, List
+
+from src.benchmarks._common import (
+    Stopwatch,
+    ensure_app,
+    quiet_logs,
+    run_metadata,
+    summarize,
+    use_database,
+    write_results,
+)
+from src.benchmarks.generate_dataset import generate_dataset
+from src.utils.db_backup import backup_database
+
+DEFAULT_OUTPUT = "./bin/benchmarks/startup.json"
+MODEL_ACCESSORS = ["profile", "property_product", "misc_product", "property_template", "setting"]
+
+
+def measure_startup(db_path: str) -> Dict[str, Any]:
+    """Runs one startup in the current (fresh) process and returns the timings in ms."""
+    stopwatch = Stopwatch()
+    with stopwatch.measure("import:src.app"):
+        import_module("src.app")
+
+    with stopwatch.measure("qapplication"):
+        app = ensure_app()
+
+    use_database(db_path)
+    from src.database.qt_database import QtDatabase
+    from src.database._database_manager import DatabaseManager
+    from src.models._model_manager import Model_Manager
+    from src.repositories._repo_manager import Repository_Manager
+    from src.services._service_manager import Service_Manager
+    from src.controllers._controller_manager import Controller_Manager
+    from src.main_window import MainWindow, PAGE_CLASSES
+
+    with stopwatch.measure("db:open"):
+        QtDatabase().connect()
+    # The connection is already open, so this is dominated by _init_tables().
+    with stopwatch.measure("db:init_tables"):
+        db_manager = DatabaseManager()
+    db = db_manager.get_db()
+
+    with stopwatch.measure("manager:model"):
+        model_manager = Model_Manager(db)
+    with stopwatch.measure("manager:repository"):
+        repo_manager = Repository_Manager(db)
+    with stopwatch.measure("manager:service"):
+        service_manager = Service_Manager(repo_manager)
+    with stopwatch.measure("manager:controller"):
+        controller_manager = Controller_Manager(service_manager)
+
+    row_counts: Dict[str, int] = {}
+    for accessor in MODEL_ACCESSORS:
+        with stopwatch.measure(f"model:{accessor}:construct"):
+            proxy_model = getattr(model_manager, accessor)()
+        with stopwatch.measure(f"model:{accessor}:first_load"):
+            proxy_model.get_source_model().reload_db()
+        row_counts[accessor] = proxy_model.get_source_model().rowCount()
+
+    pages = []
+    for name, target in PAGE_CLASSES.items():
+        module_name, _, class_name = target.partition(":")
+        with stopwatch.measure(f"page:{name}:import"):
+            page_class = getattr(import_module(module_name), class_name)
+        with stopwatch.measure(f"page:{name}:construct"):
+            pages.append(page_class(controller_manager, model_manager))
+
+    with stopwatch.measure("main_window:construct"):
+        main_window = MainWindow(controller_manager, model_manager)
+    app.processEvents()
+    main_window.close()
+    return {"timings_ms": stopwatch.timings, "loaded_rows": row_counts}
+
+
+def run_child(db_path: str) -> Dict[str, Any]:
+    """Runs `measure_startup` in a new interpreter and returns its result."""
+    with tempfile.NamedTemporaryFile("r", suffix=".json", delete=False) as f:
+        result_path = f.name
+    try:
+        subprocess.run(
+            [sys.executable, "-m", "src.benchmarks.startup_benchmark",
+             "--child", "--db", db_path, "--output", result_path],
+            check=True,
+        )
+        with open(result_path, encoding="utf-8") as f:
+            return json.load(f)
+    finally:
+        os.remove(result_path)
+
+
+def run(rows: int, repeat: int, db_path: str, seed: int) -> Dict[str, Any]:
+    workdir = tempfile.mkdtemp(prefix="startup_bench_")
+    bench_db = os.path.join(workdir, "database.db")
+    try:
+        # Startup tạo bảng/index/trigger còn thiếu: chạy trên bản sao, không sửa database của người dùng
+        if db_path:
+            # API backup: bản sao gồm cả phần còn trong file -wal của database đang mở
+            backup_database(db_path, bench_db, step_pages=-1)
+        else:
+            generate_dataset(bench_db, profiles=rows, products=rows, misc_products=rows, seed=seed)
+        samples: List[Dict[str, Any]] = [run_child(bench_db) for _ in range(repeat)]
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    steps: Dict[str, List[float]] = {}
+    for sample in samples:
+        for step, elapsed in sample["timings_ms"].items():
+            steps.setdefault(step, []).append(elapsed)
+    return {
+        "benchmark": "startup",
+        "meta": run_metadata(),
+        "params": {"rows": rows, "repeat": repeat, "db": db_path or None, "seed": seed},
+        "loaded_rows": samples[-1]["loaded_rows"] if samples else {},
+        "summary_ms": {step: summarize(values) for step, values in steps.items()},
+        "samples": samples,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Measure application startup steps.")
+    parser.add_argument("--rows", type=int, default=1000, help="rows per main table in the generated DB")
+    parser.add_argument("--repeat", type=int, default=3, help="number of fresh-process runs")
+    parser.add_argument("--db", default="", help="benchmark a copy of an existing database instead of generating one")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default=DEFAULT_OUTPUT)
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.child:
+        quiet_logs()
+        write_results(args.output, measure_startup(args.db))
+        return
+
+    results = run(args.rows, args.repeat, args.db, args.seed)
+    write_results(args.output, results)
+    for step, summary in results["summary_ms"].items():
+        print(f"{step:<36} {summary['median']:>10.2f} ms  (min {summary['min']:.2f}, max {summary['max']:.2f})")
+    print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
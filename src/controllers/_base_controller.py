@@ -3,14 +3,20 @@
 from src.utils.logger import Logger
 from src.services._service_manager import Service_Manager
 import os
-from typing import Tuple, Optional
+from typing import List, Tuple, Optional
+from PyQt6.QtCore import QThreadPool
 from src.utils.exception_handler import log_exception
+from src.utils.export_writers import EXPORT_FORMATS
+from src.services._base_service import IMPORT_CHUNK_SIZE
+from src.controllers.import_task import ImportWorker
 
 
 class BaseController:
     def __init__(self, service_manager: Service_Manager):
         self.service_manager = service_manager
         self.logger = Logger(self.__class__.__name__)
+        # Giữ tham chiếu tới các import đang chạy (và signals của chúng)
+        self._import_workers: List[ImportWorker] = []
 
     def export_data(
         self, service_name: str, file_path: str, data_format: str = "json"
@@ -22,27 +28,25 @@ class BaseController:
                 self.logger.error(error_msg)
                 return False, error_msg
 
-            data_to_export = service.read_all_for_export()
-
-            if not data_to_export:
-                warning_msg = f"Warning: No data available to export from {service_name}."
-                self.logger.warning(warning_msg)
-                return True, warning_msg
-
             data_format = data_format.lower()
-            if data_format not in ["json", "csv"]:
-                error_msg = f"Error: Unsupported data format '{data_format}'. Supported formats are 'json' and 'csv'."
+            if data_format not in EXPORT_FORMATS:
+                error_msg = f"Error: Unsupported data format '{data_format}'. Supported formats are {', '.join(EXPORT_FORMATS)}."
                 self.logger.error(error_msg)
                 return False, error_msg
 
-            success = service.export_data(
+            # Đọc theo lô từ cursor và ghi dần ra file: bộ nhớ không phụ thuộc số dòng
+            rows_written = service.export_stream(
                 file_path=file_path,
-                data_to_export=data_to_export,
+                batches=service.iter_all_for_export(),
                 data_format=data_format,
             )
 
-            if success:
+            if rows_written > 0:
                 return True, None
+            elif rows_written == 0:
+                warning_msg = f"Warning: No data available to export from {service_name}."
+                self.logger.warning(warning_msg)
+                return True, warning_msg
             else:
                 error_msg = f"Export failed in Service Layer for {service_name}. Check service logs for details."
                 self.logger.error(error_msg)
@@ -53,44 +57,30 @@ class BaseController:
             log_exception(e)
             return False, error_msg
 
-    def import_data(
-        self, service_name: str, file_path: str, data_format: str = "json"
-    ) -> Tuple[bool, Optional[str]]:
+    def start_import(
+        self, service_name: str, file_path: str, data_format: str = "json", chunk_size: int = IMPORT_CHUNK_SIZE
+    ) -> Tuple[Optional[ImportWorker], Optional[str]]:
+        """
+        Starts a streaming import on a worker thread and returns the worker
+        (connect to `worker.signals.progress` / `finished`, call `cancel()`),
+        or (None, error message) if it cannot start.
+        """
         if not os.path.exists(file_path):
             error_msg = f"Import failed: File not found at {file_path}"
             self.logger.error(error_msg)
-            return False, error_msg
-
-        try:
-            service = getattr(self.service_manager, service_name, None)
-            if not service:
-                error_msg = f"Error: Service not found: {service_name}"
-                self.logger.error(error_msg)
-                return False, error_msg
-
-            data_format = data_format.lower()
-            if data_format not in ["json", "csv"]:
-                error_msg = f"Error: Unsupported data format '{data_format}'. Supported formats are 'json' and 'csv'."
-                self.logger.error(error_msg)
-                return False, error_msg
-
-            raw_data = service.import_data(file_path=file_path, data_format=data_format)
-            if not raw_data:
-                warning_msg = f"Import process returned no data from file: {file_path}. Check service logs for file read error."
-                self.logger.warning(warning_msg)
-                return False, warning_msg
-            
-            data = [service._dict_to_data_type(_) for _ in raw_data]
-            success = service.create_bulk(data)
-
-            if success:
-                return True, None
-            else:
-                error_msg = f"Data insertion failed in Service Layer for {service_name}. Check service logs for DB error."
-                self.logger.error(error_msg)
-                return False, error_msg
+            return None, error_msg
+        if not hasattr(self.service_manager, service_name):
+            error_msg = f"Error: Service not found: {service_name}"
+            self.logger.error(error_msg)
+            return None, error_msg
+        data_format = data_format.lower()
+        if data_format not in EXPORT_FORMATS:
+            error_msg = f"Error: Unsupported data format '{data_format}'. Supported formats are {', '.join(EXPORT_FORMATS)}."
+            self.logger.error(error_msg)
+            return None, error_msg
 
-        except Exception as e:
-            error_msg = f"Unexpected error during import in Controller: {e}"
-            log_exception(e)
-            return False, error_msg
\ No newline at end of file
+        worker = ImportWorker(service_name, file_path, data_format, chunk_size)
+        worker.signals.finished.connect(lambda _result, worker=worker: self._import_workers.remove(worker))
+        self._import_workers.append(worker)
+        QThreadPool.globalInstance().start(worker)
+        return worker, None
@@ -8,16 +8,20 @@ from src.controllers.misc_product_controller import MiscProduct_Controller
 from src.controllers.property_template_controller import PropertyTemplate_Controller
 from src.controllers.setting_controller import Setting_Controller
 from src.controllers.robot_controller import Robot_Controller
+from src.controllers.image_job_controller import ImageJob_Controller
+from src.controllers.backup_controller import Backup_Controller
 
 
 class Controller_Manager:
     def __init__(self, service_manager: Service_Manager):
         self.service_manager = service_manager
         
+        self.image_job_controller = ImageJob_Controller(service_manager)
         self.profile_controller = Profile_Controller(service_manager)
-        self.property_product_controller = PropertyProduct_Controller(service_manager)
-        self.misc_product_controller = MiscProduct_Controller(service_manager)
+        self.property_product_controller = PropertyProduct_Controller(service_manager, self.image_job_controller)
+        self.misc_product_controller = MiscProduct_Controller(service_manager, self.image_job_controller)
         self.property_template_controller = PropertyTemplate_Controller(service_manager)
         self.setting_controller = Setting_Controller(service_manager)
         self.robot_controller = Robot_Controller(service_manager)
-        self.base_controller = BaseController(service_manager)
\ No newline at end of file
+        self.base_controller = BaseController(service_manager)
+        self.backup_controller = Backup_Controller(service_manager)
\ No newline at end of file
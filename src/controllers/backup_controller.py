@@ -0,0 +1,115 @@
+# src/controllers/backup_controller.py
+
+import threading
+from typing import Optional
+
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, QTimer, pyqtSignal, pyqtSlot
+
+from src.my_types import BackupResult_Type
+from src.services._service_manager import Service_Manager
+from src.services.backup_service import PreparedBackup
+from src.utils.logger import Logger
+
+# Backup tự động: chờ app khởi động xong rồi mới kiểm tra, sau đó kiểm tra lại mỗi giờ
+BACKUP_START_DELAY_MS = 60 * 1000
+BACKUP_CHECK_INTERVAL_MS = 60 * 60 * 1000
+
+
+class BackupWorkerSignals(QObject):
+    """
+    progress: Emits pages_copied, total_pages.
+    finished: Emits the BackupResult_Type.
+    """
+
+    progress = pyqtSignal(int, int)
+    finished = pyqtSignal(object)
+
+
+class BackupWorker(QRunnable):
+    """Writes one snapshot off the GUI thread (through its own sqlite3 connection)."""
+
+    def __init__(self, backup_service, prepared: PreparedBackup):
+        super().__init__()
+        self.backup_service = backup_service
+        self.prepared = prepared
+        self.signals = BackupWorkerSignals()
+        self._cancel_event = threading.Event()
+        self.setAutoDelete(True)
+
+    def cancel(self):
+        self._cancel_event.set()
+
+    @pyqtSlot()
+    def run(self):
+        try:
+            result = self.backup_service.create_snapshot(
+                self.prepared,
+                progress_callback=self.signals.progress.emit,
+                is_cancelled=self._cancel_event.is_set,
+            )
+        except Exception as e:
+            result = BackupResult_Type(error=str(e))
+        self.signals.finished.emit(result)
+
+
+class Backup_Controller(QObject):
+    """
+    Takes database snapshots in the background: on demand, and automatically
+    once BACKUP_INTERVAL_HOURS have passed since the newest snapshot.
+
+    backup_finished: Emits the BackupResult_Type of each snapshot.
+    """
+
+    backup_finished = pyqtSignal(object)
+
+    def __init__(self, service_manager: Service_Manager, parent=None):
+        super().__init__(parent)
+        self.logger = Logger(self.__class__.__name__)
+        self.service_manager = service_manager
+        self.threadpool = QThreadPool(self)
+        self.threadpool.setMaxThreadCount(1)
+        # Giữ tham chiếu tới worker (và signals của nó) cho tới khi xong
+        self._worker: Optional[BackupWorker] = None
+        self._timer = QTimer(self)
+        self._timer.timeout.connect(self.backup_if_due)
+
+    @property
+    def is_busy(self) -> bool:
+        return self._worker is not None
+
+    def start_schedule(self):
+        """Starts the automatic backups."""
+        QTimer.singleShot(BACKUP_START_DELAY_MS, self.backup_if_due)
+        self._timer.start(BACKUP_CHECK_INTERVAL_MS)
+
+    @pyqtSlot()
+    def backup_if_due(self) -> bool:
+        if self.service_manager.backup_service.is_backup_due():
+            return self.start_backup()
+        return False
+
+    def start_backup(self, include_manifest: bool = True) -> bool:
+        """Starts a snapshot unless one is already running."""
+        if self._worker is not None:
+            return False
+        prepared = self.service_manager.backup_service.prepare(include_manifest=include_manifest)
+        worker = BackupWorker(self.service_manager.backup_service, prepared)
+        worker.signals.finished.connect(self._on_finished)
+        self._worker = worker
+        self.threadpool.start(worker)
+        return True
+
+    @pyqtSlot(object)
+    def _on_finished(self, result: BackupResult_Type):
+        self._worker = None
+        if result.error:
+            self.logger.error(result.error)
+        self.backup_finished.emit(result)
+
+    def shutdown(self):
+        """Cancels a running snapshot and waits for its worker (used on shutdown)."""
+        self._timer.stop()
+        if self._worker is not None:
+            self._worker.cancel()
+        self.threadpool.waitForDone()
+        self._worker = None
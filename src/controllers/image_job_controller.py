@@ -0,0 +1,110 @@
+# src/controllers/image_job_controller.py
+
+from typing import List, Optional
+
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal, pyqtSlot
+
+from src.my_constants import IMAGE_JOB_STATE_FAILED, IMAGE_JOB_STATE_PROCESSING, IMAGE_JOB_STATE_READY
+from src.services._service_manager import Service_Manager
+from src.services.image_job_service import PreparedImageJob
+from src.utils.logger import Logger
+
+
+class ImageJobWorkerSignals(QObject):
+    """
+    finished: Emits the prepared job, the stored files (None on failure) and an error message.
+    """
+
+    finished = pyqtSignal(object, object, str)
+
+
+class ImageJobWorker(QRunnable):
+    """Copies and watermarks the images of one product off the GUI thread."""
+
+    def __init__(self, image_job_service, prepared: PreparedImageJob):
+        super().__init__()
+        self.image_job_service = image_job_service
+        self.prepared = prepared
+        self.signals = ImageJobWorkerSignals()
+        self.setAutoDelete(True)
+
+    @pyqtSlot()
+    def run(self):
+        try:
+            stored = self.image_job_service.process(self.prepared)
+            self.signals.finished.emit(self.prepared, stored, "")
+        except Exception as e:
+            self.signals.finished.emit(self.prepared, None, str(e))
+
+
+class ImageJob_Controller(QObject):
+    """
+    Drains the IMAGE_JOB queue one product at a time. Claiming and indexing run
+    on the GUI thread (the QtSql connection belongs to it); only the file work
+    runs on the worker.
+
+    job_state_changed: Emits product_id, state.
+    queue_idle: Emitted when no pending job is left.
+    """
+
+    job_state_changed = pyqtSignal(str, str)
+    queue_idle = pyqtSignal()
+
+    def __init__(self, service_manager: Service_Manager, parent=None):
+        super().__init__(parent)
+        self.logger = Logger(self.__class__.__name__)
+        self.service_manager = service_manager
+        self.threadpool = QThreadPool(self)
+        # Một job tại một thời điểm: watermark đã tự song song hoá bên trong
+        self.threadpool.setMaxThreadCount(1)
+        self._current: Optional[PreparedImageJob] = None
+        # Giữ tham chiếu tới worker (và signals của nó) cho tới khi xong
+        self._worker: Optional[ImageJobWorker] = None
+
+    @property
+    def is_busy(self) -> bool:
+        return self._current is not None
+
+    def start(self):
+        """Resumes jobs interrupted by the previous run, then starts draining the queue."""
+        self.service_manager.image_job_service.resume_interrupted()
+        self.kick()
+
+    def kick(self):
+        """Starts the next pending job unless one is already running."""
+        if self._current is not None:
+            return
+        prepared = self.service_manager.image_job_service.claim_next()
+        if prepared is None:
+            self.queue_idle.emit()
+            return
+        self._current = prepared
+        self.job_state_changed.emit(prepared.job.product_id, IMAGE_JOB_STATE_PROCESSING)
+        worker = ImageJobWorker(self.service_manager.image_job_service, prepared)
+        worker.signals.finished.connect(self._on_finished)
+        self._worker = worker
+        self.threadpool.start(worker)
+
+    def retry_failed(self) -> int:
+        retried = self.service_manager.image_job_service.retry_failed()
+        if retried:
+            self.kick()
+        return retried
+
+    @pyqtSlot(object, object, str)
+    def _on_finished(self, prepared: PreparedImageJob, stored: Optional[List], error_message: str):
+        service = self.service_manager.image_job_service
+        product_id = prepared.job.product_id
+        if stored is None:
+            service.fail(prepared.job, error_message)
+            state = IMAGE_JOB_STATE_FAILED
+        else:
+            state = IMAGE_JOB_STATE_READY if service.complete(prepared, stored) else IMAGE_JOB_STATE_FAILED
+        self._current = None
+        self._worker = None
+        self.job_state_changed.emit(product_id, state)
+        self.kick()
+
+    def wait_for_done(self, msecs: int = -1) -> bool:
+        """Blocks until the running worker returns (used on shutdown)."""
+        return self.threadpool.waitForDone(msecs)
@@ -0,0 +1,75 @@
+# src/controllers/import_task.py
+
+import threading
+
+from PyQt6.QtCore import QObject, QRunnable, pyqtSignal, pyqtSlot
+
+from src.my_types import ImportResult_Type
+from src.utils.logger import Logger
+
+
+class ImportWorkerSignals(QObject):
+    """
+    progress: Emits rows_imported, bytes_read, total_bytes after each committed chunk.
+    finished: Emits the ImportResult_Type.
+    """
+
+    progress = pyqtSignal(int, int, int)
+    finished = pyqtSignal(object)
+
+
+class ImportWorker(QRunnable):
+    """
+    Runs `BaseService.import_stream` on a worker thread.
+
+    The worker opens its own database connection and builds its own
+    repositories/services on it, since QtSql connections cannot be shared
+    between threads; every chunk is committed on that connection, so the
+    GUI connection sees the rows as they arrive.
+    """
+
+    def __init__(self, service_name: str, file_path: str, data_format: str, chunk_size: int):
+        super().__init__()
+        self.logger = Logger(self.__class__.__name__)
+        self.service_name = service_name
+        self.file_path = file_path
+        self.data_format = data_format
+        self.chunk_size = chunk_size
+        self.signals = ImportWorkerSignals()
+        self._cancel_event = threading.Event()
+        self.setAutoDelete(True)
+
+    def cancel(self):
+        """Stops the import before its next chunk (committed chunks are kept)."""
+        self._cancel_event.set()
+
+    def is_cancelled(self) -> bool:
+        return self._cancel_event.is_set()
+
+    @pyqtSlot()
+    def run(self):
+        from src.database.qt_database import QtDatabase
+
+        connection_name = f"import_{id(self)}"
+        try:
+            result = self._import(QtDatabase.open_thread_connection(connection_name))
+        except Exception as e:
+            self.logger.error(f"Import of {self.file_path} failed: {e}")
+            result = ImportResult_Type(error=str(e))
+        finally:
+            QtDatabase.close_thread_connection(connection_name)
+        self.signals.finished.emit(result)
+
+    def _import(self, db) -> ImportResult_Type:
+        # Repository/service chỉ sống trong hàm này để kết nối có thể đóng sạch sau đó
+        from src.repositories._repo_manager import Repository_Manager
+        from src.services._service_manager import Service_Manager
+
+        service = getattr(Service_Manager(Repository_Manager(db)), self.service_name)
+        return service.import_stream(
+            self.file_path,
+            self.data_format,
+            chunk_size=self.chunk_size,
+            progress_callback=self.signals.progress.emit,
+            is_cancelled=self.is_cancelled,
+        )
@@ -1,6 +1,6 @@
 # src/controllers/misc_product_controller.py
 
-from typing import Dict, Any, Union, Optional, List, Tuple
+from typing import TYPE_CHECKING, Dict, Any, Union, Optional, List, Tuple
 
 from src.controllers._base_controller import BaseController
 from src.services._service_manager import Service_Manager
@@ -8,14 +8,18 @@ from src.my_types import MiscProduct_Type
 from dataclasses import asdict
 from src.utils.exception_handler import log_exception
 
+if TYPE_CHECKING:
+    from src.controllers.image_job_controller import ImageJob_Controller
+
 
 class InvalidInputError(Exception): pass
 class ProductNotFoundError(Exception): pass
 
 
 class MiscProduct_Controller(BaseController):
-    def __init__(self, service_manager:Service_Manager):
+    def __init__(self, service_manager:Service_Manager, image_job_controller: Optional["ImageJob_Controller"] = None):
         super().__init__(service_manager)
+        self.image_job_controller = image_job_controller
 
     def create(self, request_data: Dict[str, Any]) -> Union[MiscProduct_Type, Tuple[bool, str]]:
         try:
@@ -29,9 +33,14 @@ class MiscProduct_Controller(BaseController):
                 description=request_data.get("description"),
             )
             
-            new_product = self.service_manager.misc_product_service.create(payload)
+            new_product = self.service_manager.misc_product_service.create(
+                payload, request_data.get("image_paths", [])
+            )
             
             if isinstance(new_product, MiscProduct_Type):
+                # Ảnh được xử lý nền; đánh thức hàng đợi
+                if self.image_job_controller:
+                    self.image_job_controller.kick()
                 return new_product 
             else:
                 self.logger.error("Service failed to create misc product.")
@@ -142,7 +151,7 @@ class MiscProduct_Controller(BaseController):
     def get_random(self, name: str, days: int) -> Dict[str, Any]:
         return self.service_manager.misc_product_service.get_random(name, days)
     
-    def import_data(self,file_path: str, data_format: str) -> Tuple[bool, Optional[str]]:
-        return super().import_data("misc_product_service", file_path, data_format)
     def export_data(self, file_path, data_format = "json"):
-        return super().export_data("misc_product_service", file_path, data_format)
\ No newline at end of file
+        return super().export_data("misc_product_service", file_path, data_format)
+    def start_import(self, file_path: str, data_format: str):
+        return super().start_import("misc_product_service", file_path, data_format)
@@ -141,8 +141,8 @@ class Profile_Controller(BaseController):
     def read_all(self) -> List[Dict[str, Any]]:
         return self.service_manager.profile_service.read_all()
     
-    def import_data(self,file_path: str, data_format: str) -> Tuple[bool, Optional[str]]:
-        return super().import_data("profile_service", file_path, data_format)
 
     def export_data(self, file_path, data_format = "json"):
-        return super().export_data("profile_service", file_path, data_format)
\ No newline at end of file
+        return super().export_data("profile_service", file_path, data_format)
+    def start_import(self, file_path: str, data_format: str):
+        return super().start_import("profile_service", file_path, data_format)
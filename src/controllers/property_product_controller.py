@@ -1,20 +1,24 @@
 # src/controllers/property_product_controller.py
 
-from typing import Dict, Any, Union, Optional, List, Tuple
+from typing import TYPE_CHECKING, Dict, Any, Union, Optional, List, Tuple
 from src.controllers._base_controller import BaseController
 from src.services._service_manager import Service_Manager
 from src.my_types import PropertyProduct_Type
 from dataclasses import asdict
 from src.utils.exception_handler import log_exception
 
+if TYPE_CHECKING:
+    from src.controllers.image_job_controller import ImageJob_Controller
+
 
 class InvalidInputError(Exception): pass
 class ProductNotFoundError(Exception): pass
 
 
 class PropertyProduct_Controller(BaseController):
-    def __init__(self, service_manager:Service_Manager):
+    def __init__(self, service_manager:Service_Manager, image_job_controller: Optional["ImageJob_Controller"] = None):
         super().__init__(service_manager)
+        self.image_job_controller = image_job_controller
 
     def create(self, request_data: Dict[str, Any]) -> Union[PropertyProduct_Type, Tuple[bool, str]]:
         try:
@@ -44,9 +48,14 @@ class PropertyProduct_Controller(BaseController):
                 description=request_data.get("description"),
             )
             
-            new_product = self.service_manager.property_product_service.create(payload)
+            new_product = self.service_manager.property_product_service.create(
+                payload, request_data.get("image_paths", [])
+            )
             
             if isinstance(new_product, PropertyProduct_Type):
+                # Ảnh được xử lý nền; đánh thức hàng đợi
+                if self.image_job_controller:
+                    self.image_job_controller.kick()
                 return new_product 
             else:
                 self.logger.error("Service failed to create property product.")
@@ -155,7 +164,7 @@ class PropertyProduct_Controller(BaseController):
     def get_random(self, transaction_type: str, days: int) -> Optional[Dict[str, Any]]:
         return self.service_manager.property_product_service.get_random(transaction_type, days)
     
-    def import_data(self,file_path: str, data_format: str) -> Tuple[bool, Optional[str]]:
-        return super().import_data("property_product_service", file_path, data_format)
     def export_data(self, file_path, data_format = "json"):
-        return super().export_data("property_product_service", file_path, data_format)
\ No newline at end of file
+        return super().export_data("property_product_service", file_path, data_format)
+    def start_import(self, file_path: str, data_format: str):
+        return super().start_import("property_product_service", file_path, data_format)
@@ -144,7 +144,7 @@ class PropertyTemplate_Controller(BaseController):
     def get_random(self, transaction_type: str, name: str, category: str, is_default = True) :
         return self.service_manager.property_template_service.get_random(transaction_type, name, category, is_default)
     
-    def import_data(self,file_path: str, data_format: str) -> Tuple[bool, Optional[str]]:
-        return super().import_data("property_template_service", file_path, data_format)
     def export_data(self, file_path, data_format = "json"):
-        return super().export_data("property_template_service", file_path, data_format)
\ No newline at end of file
+        return super().export_data("property_template_service", file_path, data_format)
+    def start_import(self, file_path: str, data_format: str):
+        return super().start_import("property_template_service", file_path, data_format)
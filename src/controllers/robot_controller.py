@@ -1,11 +1,9 @@
 # src/controllers/robot_controller.py
 
-from typing import Optional, Dict, Any, List
+from typing import TYPE_CHECKING, Optional, Dict, Any, List
 from PyQt6.QtCore import pyqtSlot, QObject, pyqtSignal
 
 from src.services._service_manager import Service_Manager
-from src.robot.check_fb_live import CheckLive
-from src.robot.playwright_manager import PlaywrightManager
 from src.utils.logger import Logger
 from src.my_constants import (
     ROBOT_ACTION_OPTIONS,
@@ -25,13 +23,18 @@ from src.my_constants import (
 )
 from src.my_types import Profile_Type
 
+if TYPE_CHECKING:
+    # pycurl / playwright are only imported when a robot task actually starts.
+    from src.robot.check_fb_live import CheckLive
+    from src.robot.playwright_manager import PlaywrightManager
+
 class Robot_Controller(QObject):
     def __init__(self, service_manager: Service_Manager, parent=None):
         super().__init__(parent)
         self.logger = Logger(self.__class__.__name__)
         self.service_manager = service_manager
-        self.check_live_manager: Optional[CheckLive] = None
-        self.playwright_manager: Optional[PlaywrightManager] = None
+        self.check_live_manager: Optional["CheckLive"] = None
+        self.playwright_manager: Optional["PlaywrightManager"] = None
 
     def init_robot_tasks(self, data):
         flattened_list = []
@@ -117,6 +120,7 @@ class Robot_Controller(QObject):
         if self.check_live_manager and not self.check_live_manager._check_if_done()[0]:
             self.check_live_manager.add_tasks(list_id_uids)
         else:
+            from src.robot.check_fb_live import CheckLive
             self.check_live_manager = CheckLive()
             self.check_live_manager.task_succeeded.connect(
                 self.__on_check_live_task_succeeded
@@ -158,6 +162,7 @@ class Robot_Controller(QObject):
             self.playwright_manager.add_task(tasks, settings)
         else:
             self.logger.warning("Starting new bot tasks.")
+            from src.robot.playwright_manager import PlaywrightManager
             self.playwright_manager = PlaywrightManager(
                 service_manager=self.service_manager)
             self.playwright_manager.add_task(tasks, settings)
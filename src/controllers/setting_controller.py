@@ -210,7 +210,7 @@ class Setting_Controller(BaseController):
             log_exception(e)
             return False, error_msg
     
-    def import_data(self,file_path: str, data_format: str) -> Tuple[bool, Optional[str]]:
-        return super().import_data("setting_service", file_path, data_format)
     def export_data(self, file_path, data_format = "json"):
-        return super().export_data("setting_service", file_path, data_format)
\ No newline at end of file
+        return super().export_data("setting_service", file_path, data_format)
+    def start_import(self, file_path: str, data_format: str):
+        return super().start_import("setting_service", file_path, data_format)
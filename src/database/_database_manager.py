@@ -2,7 +2,7 @@
 from PyQt6.QtSql import QSqlDatabase, QSqlQuery
 from src.database.qt_database import QtDatabase
 from src.utils.logger import Logger
-from src.database.sql_commands import CREATE_TABLE_SQL
+from src.database.sql_commands import CREATE_TABLE_SQL, CREATE_TRIGGER_SQL
 
 
 class DatabaseManager:
@@ -25,6 +25,9 @@ class DatabaseManager:
                 self.logger.error(f"Error creating tables: {query.lastError().text()}.")
         else:
             self.logger.info("All tables have been created or already exist.")
+        for sql in CREATE_TRIGGER_SQL:
+            if not query.exec(sql.strip()):
+                self.logger.error(f"Error creating triggers: {query.lastError().text()}.")
 
     def get_db(self) -> QSqlDatabase:
         return self.db_instance.get_db()
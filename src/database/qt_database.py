@@ -1,6 +1,6 @@
 # src/database/qt_database.py
 
-from PyQt6.QtSql import QSqlDatabase
+from PyQt6.QtSql import QSqlDatabase, QSqlQuery
 from src.utils.logger import Logger
 from src.my_constants import DB_PATH
 
@@ -21,6 +21,7 @@ class QtDatabase:
         if not self._db.isOpen():
             if self._db.open():
                 self.logger.info("Database connection succeeded.")
+                self.enable_wal(self._db)
                 return True
             else:
                 self.logger.error(
@@ -43,6 +44,46 @@ class QtDatabase:
     def is_connected(self) -> bool:
         return self._db and self._db.isOpen()
 
+    @classmethod
+    def open_thread_connection(cls, connection_name: str) -> QSqlDatabase:
+        """
+        Opens a separate connection to the application database for a worker
+        thread (a QSqlDatabase may only be used by the thread that opened it).
+        Close it with `close_thread_connection` from the same thread once every
+        object using it is gone.
+        """
+        db = QSqlDatabase.addDatabase("QSQLITE", connection_name)
+        db.setDatabaseName(cls.db_path)
+        if not db.open():
+            error = db.lastError().text()
+            QSqlDatabase.removeDatabase(connection_name)
+            raise ConnectionError(f"Could not open database connection '{connection_name}': {error}")
+        cls.enable_wal(db)
+        return db
+
+    @staticmethod
+    def enable_wal(db: QSqlDatabase) -> bool:
+        """
+        Switches the database file to WAL journaling (persistent, so every
+        later connection uses it too). Without it a SELECT the GUI has only
+        partly fetched (lazy models) holds a shared lock that makes every
+        COMMIT of a worker connection wait out the busy timeout and fail.
+        """
+        query = QSqlQuery(db)
+        if query.exec("PRAGMA journal_mode=WAL") and query.next() and str(query.value(0)).lower() == "wal":
+            return True
+        # Ví dụ: database ":memory:" không hỗ trợ WAL; vẫn dùng được với journal mặc định
+        Logger(QtDatabase.__name__).warning(f"WAL journaling is not available for {db.databaseName()}.")
+        return False
+
+    @staticmethod
+    def close_thread_connection(connection_name: str):
+        db = QSqlDatabase.database(connection_name, False)
+        if db.isValid():
+            db.close()
+        del db
+        QSqlDatabase.removeDatabase(connection_name)
+
     def get_error(self):
         if self._db:
             return self._db.lastError()
@@ -1,5 +1,5 @@
 # src/database/sql_commands.py
-from src.my_constants import DB_TABLES
+from src.my_constants import DB_TABLES, SYNC_TABLES
 
 CREATE_TABLE_SQL = f"""
 CREATE TABLE IF NOT EXISTS {DB_TABLES["profile"]} (
@@ -69,4 +69,80 @@ CREATE TABLE IF NOT EXISTS {DB_TABLES["setting"]} (
     created_at TEXT,
     updated_at TEXT
 );
+CREATE TABLE IF NOT EXISTS {DB_TABLES["image_folder"]} (
+    folder TEXT PRIMARY KEY,
+    owner_id TEXT,
+    kind TEXT,
+    mtime_ns INTEGER,
+    updated_at TEXT
+);
+CREATE TABLE IF NOT EXISTS {DB_TABLES["image_manifest"]} (
+    folder TEXT NOT NULL,
+    file_name TEXT NOT NULL,
+    size INTEGER,
+    hash TEXT,
+    PRIMARY KEY (folder, file_name)
+);
+CREATE TABLE IF NOT EXISTS {DB_TABLES["image_blob"]} (
+    hash TEXT PRIMARY KEY,
+    size INTEGER,
+    ref_count INTEGER NOT NULL DEFAULT 0,
+    created_at TEXT,
+    updated_at TEXT
+);
+CREATE TABLE IF NOT EXISTS {DB_TABLES["image_job"]} (
+    product_id TEXT PRIMARY KEY,
+    product_table TEXT NOT NULL,
+    state TEXT NOT NULL,
+    image_paths TEXT,
+    error TEXT,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    created_at TEXT,
+    updated_at TEXT
+);
+CREATE TABLE IF NOT EXISTS {DB_TABLES["sync_tombstone"]} (
+    table_key TEXT NOT NULL,
+    row_id TEXT NOT NULL,
+    deleted_at TEXT,
+    PRIMARY KEY (table_key, row_id)
+);
+CREATE TABLE IF NOT EXISTS {DB_TABLES["sync_peer"]} (
+    peer_id TEXT PRIMARY KEY,
+    exported_until TEXT,
+    imported_until TEXT,
+    created_at TEXT,
+    updated_at TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_profile_created_at ON {DB_TABLES["profile"]} (created_at);
+CREATE INDEX IF NOT EXISTS idx_profile_uid ON {DB_TABLES["profile"]} (uid);
+CREATE INDEX IF NOT EXISTS idx_profile_username ON {DB_TABLES["profile"]} (username);
+CREATE INDEX IF NOT EXISTS idx_profile_status ON {DB_TABLES["profile"]} (status);
+CREATE INDEX IF NOT EXISTS idx_property_product_created_at ON {DB_TABLES["property_product"]} (created_at);
+CREATE INDEX IF NOT EXISTS idx_property_product_pid ON {DB_TABLES["property_product"]} (pid);
+CREATE INDEX IF NOT EXISTS idx_property_product_transaction_updated ON {DB_TABLES["property_product"]} (transaction_type, updated_at);
+CREATE INDEX IF NOT EXISTS idx_misc_product_created_at ON {DB_TABLES["misc_product"]} (created_at);
+CREATE INDEX IF NOT EXISTS idx_misc_product_name_updated ON {DB_TABLES["misc_product"]} (name, updated_at);
+CREATE INDEX IF NOT EXISTS idx_setting_name ON {DB_TABLES["setting"]} (name);
+CREATE INDEX IF NOT EXISTS idx_image_folder_owner ON {DB_TABLES["image_folder"]} (owner_id, kind);
+CREATE INDEX IF NOT EXISTS idx_image_blob_ref_count ON {DB_TABLES["image_blob"]} (ref_count);
+CREATE INDEX IF NOT EXISTS idx_image_job_state ON {DB_TABLES["image_job"]} (state, created_at);
+CREATE INDEX IF NOT EXISTS idx_profile_updated_at ON {DB_TABLES["profile"]} (updated_at);
+CREATE INDEX IF NOT EXISTS idx_property_product_updated_at ON {DB_TABLES["property_product"]} (updated_at);
+CREATE INDEX IF NOT EXISTS idx_misc_product_updated_at ON {DB_TABLES["misc_product"]} (updated_at);
+CREATE INDEX IF NOT EXISTS idx_property_template_updated_at ON {DB_TABLES["property_template"]} (updated_at);
+CREATE INDEX IF NOT EXISTS idx_sync_tombstone_deleted_at ON {DB_TABLES["sync_tombstone"]} (deleted_at);
+"""
+
+# Trigger chứa ";" bên trong BEGIN ... END nên không thể tách theo ";" như CREATE_TABLE_SQL:
+# mỗi phần tử là một câu lệnh hoàn chỉnh.
+# Mọi lệnh DELETE trên bảng đồng bộ (kể cả từ code khác repo) đều để lại tombstone cho delta export.
+CREATE_TRIGGER_SQL = [
+    f"""
+CREATE TRIGGER IF NOT EXISTS trg_{key}_sync_tombstone AFTER DELETE ON {DB_TABLES[key]}
+BEGIN
+    INSERT OR REPLACE INTO {DB_TABLES["sync_tombstone"]} (table_key, row_id, deleted_at)
+    VALUES ('{key}', OLD.id, strftime('%Y-%m-%d %H:%M:%S', 'now', 'localtime'));
+END
 """
+    for key in SYNC_TABLES
+]
@@ -1,11 +1,25 @@
 import sys
+import time
+import multiprocessing
 from PyQt6.QtWidgets import QApplication
 from src.app import Application
+from src.utils.startup_profiler import STARTUP_PROFILE_FLAG
 
 def main():
+    profile_startup = STARTUP_PROFILE_FLAG in sys.argv
+    if profile_startup:
+        sys.argv.remove(STARTUP_PROFILE_FLAG)
+        from src.utils.startup_profiler import log_startup_profile, logger
+        log_startup_profile()
+        started = time.perf_counter()
+
     app = QApplication(sys.argv)
     application = Application()
+    if profile_startup:
+        logger.info(f"Application constructed in {(time.perf_counter() - started) * 1000:.1f} ms")
     sys.exit(app.exec())
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    # Image processing uses a spawn-based process pool (needed for frozen builds).
+    multiprocessing.freeze_support()
+    main()
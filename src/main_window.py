@@ -1,16 +1,33 @@
 # src/views/main_window.py
-from PyQt6.QtCore import Qt, pyqtSlot
-from PyQt6.QtWidgets import QMainWindow, QLabel
+from importlib import import_module
+from typing import Dict, List
+from PyQt6.QtCore import Qt, pyqtSlot, QTimer
+from PyQt6.QtWidgets import QMainWindow, QLabel, QWidget
 
 from src.controllers._controller_manager import Controller_Manager
 from src.models._model_manager import Model_Manager
-from src.views.profiles.profiles_page import PageProfiles
-from src.views.settings.settings_page import PageSettings
-from src.views.properties.properties_page import PageProperties
-from src.views.robot.robot_page import PageRobot
+from src.my_types import BackupResult_Type
 
 from src.ui.mainwindow_ui import Ui_MainWindow
 
+PROFILES_PAGE = "profiles"
+SETTINGS_PAGE = "settings"
+PROPERTIES_PAGE = "properties"
+ROBOT_PAGE = "robot"
+
+# Page modules are imported together with their first construction.
+PAGE_CLASSES: Dict[str, str] = {
+    PROFILES_PAGE: "src.views.profiles.profiles_page:PageProfiles",
+    SETTINGS_PAGE: "src.views.settings.settings_page:PageSettings",
+    PROPERTIES_PAGE: "src.views.properties.properties_page:PageProperties",
+    ROBOT_PAGE: "src.views.robot.robot_page:PageRobot",
+}
+
+# Trang hiển thị đầu tiên; các trang còn lại được tạo khi rảnh (idle).
+START_PAGE = ROBOT_PAGE
+# Chờ cửa sổ vẽ xong rồi mới bắt đầu tạo trước các trang còn lại.
+WARM_UP_DELAY_MS = 300
+
 class MainWindow(QMainWindow, Ui_MainWindow):
     def __init__(self, controller_manager: Controller_Manager, model_manager: Model_Manager, parent=None):
         super().__init__(parent)
@@ -18,22 +35,24 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         self.setWindowTitle("My manager")
         self.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
         self.setMinimumSize(960, 540)
-        
-        self.profiles_page = PageProfiles(controller_manager, model_manager)
-        self.settings_page = PageSettings(controller_manager, model_manager)
-        self.properties_page = PageProperties(controller_manager, model_manager)
-        self.robot_page = PageRobot(controller_manager, model_manager)
 
-        self.profiles_page.status_msg.connect(self.on_status_msg)
-        self.robot_page.status_msg.connect(self.on_status_msg)
+        # Pages are built (and their models loaded) on first navigation.
+        self.controller_manager = controller_manager
+        self.model_manager = model_manager
+        self._pages: Dict[str, QWidget] = {}
+        self._pages_to_warm: List[str] = [
+            name for name in PAGE_CLASSES if name != START_PAGE
+        ]
 
         self.permanent_label = QLabel()
-        
+
         self.setup_UI()
         self.setup_events()
         self.setup_statusbar()
 
-    
+        QTimer.singleShot(WARM_UP_DELAY_MS, self._warm_next_page)
+
+
     def setup_UI(self):
         self.real_estate.setToolTip("Real estate products")
         self.misc.setToolTip("Misc products")
@@ -41,24 +60,51 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         self.robot.setToolTip("Robot")
         self.template.setToolTip("Templates")
         self.setting.setToolTip("Settings")
-        self.content_container.addWidget(self.properties_page)
-        self.content_container.addWidget(self.settings_page)
         # _handle_list_more_place
-        # self.content_container.addWidget(self.templates_page)
-        # self.content_container.addWidget(self.misc_page)
-        self.content_container.addWidget(self.profiles_page)
-        self.content_container.addWidget(self.robot_page)
-        self.content_container.setCurrentWidget(self.robot_page)
+        # templates_page / misc_page
+        self.show_page(START_PAGE)
     def setup_events(self):
-        self.setting.toggled.connect(lambda : self.content_container.setCurrentWidget(self.settings_page))
-        self.profile.toggled.connect(lambda : self.content_container.setCurrentWidget(self.profiles_page))
-        self.real_estate.toggled.connect(lambda : self.content_container.setCurrentWidget(self.properties_page))
-        self.robot.toggled.connect(lambda : self.content_container.setCurrentWidget(self.robot_page))
-        # self.real_estate.toggled.connect(self.content_container.setCurrentWidget())
+        self.setting.toggled.connect(lambda checked: checked and self.show_page(SETTINGS_PAGE))
+        self.profile.toggled.connect(lambda checked: checked and self.show_page(PROFILES_PAGE))
+        self.real_estate.toggled.connect(lambda checked: checked and self.show_page(PROPERTIES_PAGE))
+        self.robot.toggled.connect(lambda checked: checked and self.show_page(ROBOT_PAGE))
+        self.controller_manager.backup_controller.backup_finished.connect(self.on_backup_finished)
     def setup_statusbar(self):
         self.status_bar.addWidget(self.permanent_label)
-    
+
+    def get_page(self, name: str) -> QWidget:
+        """Returns the page registered under `name`, constructing it on first use."""
+        page = self._pages.get(name)
+        if page is None:
+            module_name, _, class_name = PAGE_CLASSES[name].partition(":")
+            page_class = getattr(import_module(module_name), class_name)
+            page = page_class(self.controller_manager, self.model_manager)
+            if hasattr(page, "status_msg"):
+                page.status_msg.connect(self.on_status_msg)
+            self.content_container.addWidget(page)
+            self._pages[name] = page
+        return page
+
+    def show_page(self, name: str):
+        self.content_container.setCurrentWidget(self.get_page(name))
+
+    def _warm_next_page(self):
+        """Builds one not-yet-visited page per idle tick so the UI stays responsive."""
+        while self._pages_to_warm:
+            name = self._pages_to_warm.pop(0)
+            if name not in self._pages:
+                self.get_page(name)
+                break
+        if self._pages_to_warm:
+            QTimer.singleShot(0, self._warm_next_page)
 
     @pyqtSlot(str)
     def on_status_msg(self, msg: str):
-        self.permanent_label.setText(msg)
\ No newline at end of file
+        self.permanent_label.setText(msg)
+
+    @pyqtSlot(object)
+    def on_backup_finished(self, result: BackupResult_Type):
+        if result.error:
+            self.on_status_msg(f"Backup failed: {result.error}")
+        elif result.snapshot_path:
+            self.on_status_msg(f"Database backed up to {result.snapshot_path}")
@@ -0,0 +1,229 @@
+# src/maintenance.py
+"""
+Headless maintenance commands (no window is created).
+
+    python -m src.maintenance [--db PATH] gc-images [--dry-run] [--container DIR]
+    python -m src.maintenance [--db PATH] sync-export PEER FILE [--since TIME]
+    python -m src.maintenance [--db PATH] sync-import PEER FILE [--allow-gap]
+    python -m src.maintenance [--db PATH] sync-peers [--reset PEER]
+    python -m src.maintenance [--db PATH] backup [--no-manifest] [--keep N] [--dir DIR]
+    python -m src.maintenance backups [--dir DIR]
+    python -m src.maintenance [--db PATH] restore SNAPSHOT [--dir DIR]
+    python -m src.maintenance [--db PATH] bundle-export TABLE FILE [--id ID ...]
+    python -m src.maintenance [--db PATH] bundle-import FILE [--workers N]
+"""
+import argparse
+import os
+import sys
+
+from PyQt6.QtCore import QCoreApplication
+
+
+def _open_repositories(db_path: str = ""):
+    """Opens the application database (or `db_path`) and returns a Repository_Manager."""
+    from src.database.qt_database import QtDatabase
+
+    if db_path:
+        QtDatabase.db_path = db_path
+    from src.database._database_manager import DatabaseManager
+    from src.repositories._repo_manager import Repository_Manager
+
+    return Repository_Manager(DatabaseManager().get_db())
+
+
+def gc_images(args) -> int:
+    from src.services._base_service import BaseService
+
+    service = BaseService(_open_repositories(args.db))
+    stats = service.collect_image_garbage(
+        image_container=args.container or None,
+        dry_run=args.dry_run,
+        orphan_min_age_s=args.min_age,
+    )
+    action = "would reclaim" if args.dry_run else "reclaimed"
+    print(
+        f"{stats['blobs']} blob(s): {stats['unreferenced']} unreferenced, {stats['orphans']} orphan; "
+        f"{action} {stats['bytes_reclaimed']} bytes."
+    )
+    return 0
+
+
+def sync_export(args) -> int:
+    from src.services.sync_service import Sync_Service
+
+    service = Sync_Service(_open_repositories(args.db))
+    written = service.export_delta(args.file, args.peer, since=args.since or None)
+    if written < 0:
+        print("Delta export failed, see the logs.", file=sys.stderr)
+        return 1
+    print(f"{written} change(s) written to {args.file}.")
+    return 0
+
+
+def sync_import(args) -> int:
+    from src.services.sync_service import Sync_Service
+
+    service = Sync_Service(_open_repositories(args.db))
+    result = service.import_delta(args.file, args.peer, allow_gap=args.allow_gap)
+    print(
+        f"{result.rows_imported} row(s) upserted, {result.rows_deleted} deleted, {result.rows_skipped} unchanged, "
+        f"{result.rows_invalid} invalid, {result.rows_failed} failed."
+    )
+    if result.error:
+        print(result.error, file=sys.stderr)
+        return 1
+    return 0
+
+
+def sync_peers(args) -> int:
+    from src.services.sync_service import Sync_Service, local_peer_id
+
+    service = Sync_Service(_open_repositories(args.db))
+    if args.reset:
+        service.reset_peer(args.reset)
+    print(f"This machine: {local_peer_id()}")
+    for peer in service.get_peers():
+        print(f"{peer.peer_id}: exported until {peer.exported_until or '-'}, imported until {peer.imported_until or '-'}")
+    return 0
+
+
+def backup(args) -> int:
+    from src.services.backup_service import Backup_Service
+
+    service = Backup_Service(_open_repositories(args.db))
+    prepared = service.prepare(include_manifest=not args.no_manifest, backup_dir=args.dir, keep=args.keep)
+    result = service.create_snapshot(prepared)
+    if not result.ok:
+        print(result.error, file=sys.stderr)
+        return 1
+    print(f"Snapshot written to {result.snapshot_path} ({result.pages} pages, {result.restarts} restart(s)).")
+    if result.manifest_path:
+        print(f"{result.manifest_files} file(s) listed in {result.manifest_path}.")
+    for path in result.removed:
+        print(f"Removed old snapshot {path}.")
+    return 0
+
+
+def backups(args) -> int:
+    from src.utils.db_backup import list_snapshots, manifest_path_for
+
+    for path in list_snapshots(args.dir):
+        manifest = " (+ manifest)" if os.path.exists(manifest_path_for(path)) else ""
+        print(f"{path}  {os.path.getsize(path)} bytes{manifest}")
+    return 0
+
+
+def restore(args) -> int:
+    from src.services.backup_service import Backup_Service
+
+    service = Backup_Service(_open_repositories(args.db))
+    result = service.restore_snapshot(args.snapshot, service.prepare(include_manifest=False, backup_dir=args.dir))
+    if result.error:
+        print(result.error, file=sys.stderr)
+        return 1
+    print(f"Database restored from {args.snapshot}; the previous state is saved in {result.snapshot_path}.")
+    return 0
+
+
+def bundle_export(args) -> int:
+    from src.services.bundle_service import Bundle_Service
+
+    service = Bundle_Service(_open_repositories(args.db))
+    result = service.export_bundle(args.file, args.table, product_ids=args.id or None)
+    if not result.ok:
+        print(result.error, file=sys.stderr)
+        return 1
+    print(f"{result.rows} product(s) and {result.blobs_written} image(s) ({result.bytes_written} bytes) written to {args.file}.")
+    if result.images_missing:
+        print(f"{result.images_missing} image(s) disappeared during the export.", file=sys.stderr)
+    return 0
+
+
+def bundle_import(args) -> int:
+    from src.services.bundle_service import Bundle_Service
+
+    service = Bundle_Service(_open_repositories(args.db))
+    result = service.import_bundle(args.file, workers=args.workers)
+    print(
+        f"{result.rows} product(s) upserted, {result.rows_skipped} unchanged, {result.rows_deleted} deleted here, "
+        f"{result.rows_invalid} invalid, {result.rows_failed} failed; {result.blobs_written} image(s) written, "
+        f"{result.blobs_skipped} already present."
+    )
+    if result.error:
+        print(result.error, file=sys.stderr)
+        return 1
+    return 0
+
+
+def main(argv=None) -> int:
+    from src.my_constants import BACKUP_DIR, BACKUP_KEEP
+    from src.services._base_service import ORPHAN_BLOB_MIN_AGE_S
+    from src.services.bundle_service import BUNDLE_EXTRACT_WORKERS
+    from src.services.sync_service import PRODUCT_TABLES
+
+    parser = argparse.ArgumentParser(prog="python -m src.maintenance", description="Maintenance commands.")
+    parser.add_argument("--db", default="", help="database file (default: the application database)")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    gc_parser = commands.add_parser("gc-images", help="delete stored images no product references")
+    gc_parser.add_argument("--container", default="", help="image container (default: the image_container_dir setting)")
+    gc_parser.add_argument("--dry-run", action="store_true", help="only report what would be deleted")
+    gc_parser.add_argument(
+        "--min-age", type=float, default=ORPHAN_BLOB_MIN_AGE_S, help="seconds before an untracked blob counts as orphan"
+    )
+    gc_parser.set_defaults(handler=gc_images)
+
+    export_parser = commands.add_parser("sync-export", help="write the changes since the last delta for a peer")
+    export_parser.add_argument("peer", help="name of the machine the delta is for")
+    export_parser.add_argument("file", help="delta file (.jsonl, .jsonl.gz or .jsonl.zst)")
+    export_parser.add_argument("--since", default="", help="export changes since this time instead (YYYY-MM-DD HH:MM:SS)")
+    export_parser.set_defaults(handler=sync_export)
+
+    import_parser = commands.add_parser("sync-import", help="apply a delta written by another machine")
+    import_parser.add_argument("peer", help="name of the machine the delta comes from (as used with sync-export)")
+    import_parser.add_argument("file", help="delta file")
+    import_parser.add_argument(
+        "--allow-gap", action="store_true", help="apply the delta even if an earlier one from the peer is missing"
+    )
+    import_parser.set_defaults(handler=sync_import)
+
+    peers_parser = commands.add_parser("sync-peers", help="list sync peers and their watermarks")
+    peers_parser.add_argument("--reset", default="", metavar="PEER", help="forget a peer: its next delta is a full export")
+    peers_parser.set_defaults(handler=sync_peers)
+
+    backup_parser = commands.add_parser("backup", help="take an online snapshot of the database")
+    backup_parser.add_argument("--no-manifest", action="store_true", help="do not list the image/profile folders")
+    backup_parser.add_argument("--keep", type=int, default=BACKUP_KEEP, help="snapshots to keep (0 = keep all)")
+    backup_parser.add_argument("--dir", default=BACKUP_DIR, help="snapshot directory")
+    backup_parser.set_defaults(handler=backup)
+
+    backups_parser = commands.add_parser("backups", help="list the snapshots")
+    backups_parser.add_argument("--dir", default=BACKUP_DIR, help="snapshot directory")
+    backups_parser.set_defaults(handler=backups)
+
+    restore_parser = commands.add_parser("restore", help="replace the database with a snapshot (close the app first)")
+    restore_parser.add_argument("snapshot", help="snapshot file")
+    restore_parser.add_argument("--dir", default=BACKUP_DIR, help="where to save the current database first")
+    restore_parser.set_defaults(handler=restore)
+
+    bundle_export_parser = commands.add_parser("bundle-export", help="write products and their images to one archive")
+    bundle_export_parser.add_argument("table", choices=PRODUCT_TABLES, help="product table")
+    bundle_export_parser.add_argument("file", help="bundle file (.zip or .tar)")
+    bundle_export_parser.add_argument("--id", action="append", default=[], help="only this product (repeatable)")
+    bundle_export_parser.set_defaults(handler=bundle_export)
+
+    bundle_import_parser = commands.add_parser("bundle-import", help="import a product bundle")
+    bundle_import_parser.add_argument("file", help="bundle file")
+    bundle_import_parser.add_argument(
+        "--workers", type=int, default=BUNDLE_EXTRACT_WORKERS, help="threads writing the images"
+    )
+    bundle_import_parser.set_defaults(handler=bundle_import)
+
+    args = parser.parse_args(argv)
+    # QtSql cần một QCoreApplication đang tồn tại
+    app = QCoreApplication.instance() or QCoreApplication(sys.argv[:1])
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,47 +1,206 @@
 # src/models/_base_model.py
-from PyQt6.QtSql import QSqlTableModel
-from PyQt6.QtCore import Qt, QModelIndex, QSortFilterProxyModel, QRegularExpression
+from PyQt6.QtSql import QSqlTableModel, QSqlQuery
+from PyQt6.QtCore import (
+    Qt,
+    QModelIndex,
+    QSortFilterProxyModel,
+    QRegularExpression,
+    QTimer,
+    pyqtSignal,
+)
 from PyQt6.QtGui import QBrush, QColor
-from typing import Any
+from typing import Any, Dict, List, Optional, Set
+
+# Bảng có nhiều dòng hơn ngưỡng này sẽ được lọc/sắp xếp bằng SQL thay vì trong proxy.
+SERVER_SIDE_ROW_THRESHOLD = 5000
+# Thời gian chờ (ms) sau lần gõ phím cuối cùng trước khi áp dụng bộ lọc theo cột.
+FILTER_DEBOUNCE_MS = 250
+
+# Brushes are shared by every cell instead of being allocated per data() call.
+FOREGROUND_BRUSH = QBrush(QColor("black"))
+INACTIVE_ROW_BRUSH = QBrush(QColor("#e7625f"))
+EVEN_ROW_BRUSH = QBrush(QColor("#d3eaf2"))
+ODD_ROW_BRUSH = QBrush(QColor("#f8e3ec"))
+
+
 class BaseModel(QSqlTableModel):
-    def __init__(self, db, table_name, parent=None):
+    """
+    Table model used by the grids.
+
+    If `columns` is given, only those columns are selected (a projected read
+    model); the full entity is loaded through the controllers when a row is
+    opened or acted on. `computed_columns` (alias -> SQL expression) appends
+    read-only derived columns to the projection.
+    """
+    # Rows whose "status" equals this value are painted with INACTIVE_ROW_BRUSH.
+    INACTIVE_STATUS = 0
+
+    def __init__(
+        self,
+        db,
+        table_name,
+        parent=None,
+        columns: Optional[List[str]] = None,
+        computed_columns: Optional[Dict[str, str]] = None,
+    ):
         super().__init__(parent, db=db)
+        self.columns = columns
+        self.computed_columns = computed_columns or {}
         self.setTable(table_name)
         self.setEditStrategy(QSqlTableModel.EditStrategy.OnManualSubmit)
+        # When False, rows are fetched lazily by the view (server-side mode).
+        self.fetch_all = True
+        # row -> True if the row is inactive; rebuilt lazily while painting.
+        self._inactive_rows: Dict[int, bool] = {}
+        for signal in (
+            self.modelReset,
+            self.dataChanged,
+            self.rowsInserted,
+            self.rowsRemoved,
+            self.layoutChanged,
+        ):
+            signal.connect(self._clear_style_cache)
+
+    def setTable(self, table_name: str):
+        super().setTable(table_name)
+        if self.columns:
+            # Prime record() with the projected layout so fieldIndex() matches
+            # the selected columns before the first select().
+            query = QSqlQuery(self.database())
+            query.exec(f"SELECT {self._column_list()} FROM {table_name} LIMIT 0")
+            self.setQuery(query)
+        self._status_col = self.fieldIndex("status")
+
+    def selectStatement(self) -> str:
+        if not self.columns:
+            return super().selectStatement()
+        statement = f"SELECT {self._column_list()} FROM {self.tableName()}"
+        if self.filter():
+            statement += f" WHERE {self.filter()}"
+        order_by = self.orderByClause()
+        if order_by:
+            statement += f" {order_by}"
+        return statement
+
+    def orderByClause(self) -> str:
+        order_by = super().orderByClause()
+        # Qt qualifies the sort column with the table name, which a computed alias does not have.
+        for alias in self.computed_columns:
+            order_by = order_by.replace(f'"{self.tableName()}"."{alias}"', f'"{alias}"')
+        return order_by
+
+    def _column_list(self) -> str:
+        columns = [f'"{column}"' for column in self.columns]
+        columns += [f'({expression}) AS "{alias}"' for alias, expression in self.computed_columns.items()]
+        return ", ".join(columns)
 
     def reload_db(self):
+        # Truy vấn đọc dở giữ snapshot (WAL) cũ; kết thúc nó trước để select thấy dữ liệu mới
+        self.query().finish()
         self.select()
+        if not self.fetch_all:
+            return
         while self.canFetchMore():
             self.fetchMore()
 
+    def count_rows(self) -> int:
+        """Returns the number of rows in the underlying table (without loading them)."""
+        query = QSqlQuery(self.database())
+        if not query.exec(f"SELECT COUNT(*) FROM {self.tableName()}") or not query.next():
+            return 0
+        try:
+            return int(query.value(0))
+        except (ValueError, TypeError):
+            return 0
+
     def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
         if not index.isValid():
             return None
         if role == Qt.ItemDataRole.ForegroundRole:
-            return QBrush(QColor("black"))
+            return FOREGROUND_BRUSH
         if role == Qt.ItemDataRole.BackgroundRole:
-            status_col = self.fieldIndex("status")
-            if status_col != -1:
-                status_index = self.index(index.row(), status_col)
-                status_value = super().data(status_index, Qt.ItemDataRole.DisplayRole)
+            row = index.row()
+            if self._is_inactive_row(row):
+                return INACTIVE_ROW_BRUSH
+            return EVEN_ROW_BRUSH if row % 2 == 0 else ODD_ROW_BRUSH
+        return super().data(index, role)
+
+    def _is_inactive_row(self, row: int) -> bool:
+        inactive = self._inactive_rows.get(row)
+        if inactive is None:
+            inactive = False
+            if self._status_col != -1:
+                status_value = super().data(
+                    self.index(row, self._status_col), Qt.ItemDataRole.DisplayRole
+                )
                 try:
-                    if int(status_value) == 0:
-                        return QBrush(QColor("#e7625f"))
+                    inactive = int(status_value) == self.INACTIVE_STATUS
                 except (ValueError, TypeError):
                     pass
-            return QBrush(QColor("#d3eaf2" if index.row() % 2 == 0 else "#f8e3ec"))
-        return super().data(index, role)
+            self._inactive_rows[row] = inactive
+        return inactive
+
+    def _clear_style_cache(self, *args):
+        self._inactive_rows.clear()
 
 class BaseProxyModel(QSortFilterProxyModel):
     """
     Base Proxy Model, inherits QSortFilterProxyModel.
     Wraps a BaseModel instance to provide sorting and filtering capabilities for Views.
+
+    In server-side mode, filters and sort order are pushed into the SQL of the
+    source model (WHERE / ORDER BY) and the proxy only passes rows through.
+    Server-side mode is chosen automatically for tables larger than
+    SERVER_SIDE_ROW_THRESHOLD unless `server_side` is given explicitly.
+
+    Per-column filters (`set_column_filter`) are combined with AND, matched as
+    case-insensitive substrings and applied after FILTER_DEBOUNCE_MS of
+    inactivity. `filters_applied` is emitted once they take effect.
     """
-    def __init__(self, source_model: BaseModel, parent=None):
+    filters_applied = pyqtSignal()
+
+    def __init__(self, source_model: BaseModel, parent=None, server_side: Optional[bool] = None):
         super().__init__(parent)
+        # column -> casefolded needle
+        self._column_filters: Dict[int, str] = {}
+        self._pending_filters: Dict[int, str] = {}
+        # Source rows rejected by the last evaluation; reused while a filter only narrows.
+        self._rejected_rows: Set[int] = set()
+        self._narrowing = False
+        self._debounce_timer = QTimer(self)
+        self._debounce_timer.setSingleShot(True)
+        self._debounce_timer.setInterval(FILTER_DEBOUNCE_MS)
+        self._debounce_timer.timeout.connect(self.apply_filters_now)
+        # Row numbers shift on these, so the rejected-row cache can no longer be trusted.
+        for signal in (
+            source_model.modelAboutToBeReset,
+            source_model.rowsAboutToBeInserted,
+            source_model.rowsAboutToBeRemoved,
+            source_model.layoutAboutToBeChanged,
+            # Giá trị ô thay đổi: một dòng bị loại trước đây có thể khớp bộ lọc mới
+            source_model.dataChanged,
+        ):
+            signal.connect(self._forget_rejected_rows)
         self.setSourceModel(source_model)
         self.setFilterCaseSensitivity(Qt.CaseSensitivity.CaseInsensitive)
         self.setDynamicSortFilter(True) # Quan trọng để lọc và sắp xếp nhanh
+        if server_side is None:
+            server_side = source_model.count_rows() > SERVER_SIDE_ROW_THRESHOLD
+        self.set_server_side(server_side)
+
+    def is_server_side(self) -> bool:
+        return self._server_side
+
+    def set_server_side(self, enabled: bool):
+        """Switches between SQL filtering/sorting and in-memory proxy filtering/sorting."""
+        self._server_side = enabled
+        source = self.get_source_model()
+        source.fetch_all = not enabled
+        source.setFilter("")
+        self._column_filters = {}
+        self._pending_filters = {}
+        self._rejected_rows.clear()
+        self.setFilterRegularExpression(QRegularExpression())
 
     def set_filter_column(self, column_index: int):
         """Đặt cột mà bộ lọc văn bản (text filter) sẽ áp dụng."""
@@ -49,6 +208,13 @@ class BaseProxyModel(QSortFilterProxyModel):
 
     def filter_by_text(self, text: str):
         """Lọc dữ liệu dựa trên văn bản và cột đã chọn."""
+        if self._server_side:
+            self.get_source_model().setFilter(
+                self._sql_like_clause(self.filterKeyColumn(), text)
+            )
+            return
+        # Bộ lọc văn bản cũng quyết định dòng nào bị loại: cache không còn đúng
+        self._rejected_rows.clear()
         # QRegExp là cách linh hoạt nhất để đặt bộ lọc văn bản
         # Escaping special characters and using a fixed string match (.*text.*)
         if text:
@@ -60,10 +226,110 @@ class BaseProxyModel(QSortFilterProxyModel):
             # Clear the filter
             self.setFilterRegularExpression(QRegularExpression())
 
+    def set_column_filter(self, column_index: int, text: str):
+        """Sets (or clears, with empty text) the filter of one column; applied after a debounce."""
+        if column_index < 0:
+            return
+        self._pending_filters[column_index] = (text or "").strip().casefold()
+        self._debounce_timer.start()
+
+    def clear_column_filters(self):
+        """Removes every per-column filter immediately."""
+        self._pending_filters = {column: "" for column in self._column_filters}
+        self.apply_filters_now()
+
+    def apply_filters_now(self):
+        """Applies pending per-column filters without waiting for the debounce timer."""
+        self._debounce_timer.stop()
+        new_filters = dict(self._column_filters)
+        new_filters.update(self._pending_filters)
+        new_filters = {column: needle for column, needle in new_filters.items() if needle}
+        self._pending_filters = {}
+        if new_filters == self._column_filters:
+            return
+        narrowing = self._is_narrowing(self._column_filters, new_filters)
+        if not new_filters or not self._column_filters:
+            # Không có bộ lọc cột thì filterAcceptsRow không cập nhật cache: bỏ cache cũ
+            self._rejected_rows.clear()
+            narrowing = False
+        self._column_filters = new_filters
+
+        if self._server_side:
+            clauses = [
+                self._sql_like_clause(column, needle)
+                for column, needle in new_filters.items()
+            ]
+            self.get_source_model().setFilter(
+                " AND ".join(f"({clause})" for clause in clauses if clause)
+            )
+        else:
+            self._narrowing = narrowing
+            try:
+                self.invalidateRowsFilter()
+            finally:
+                self._narrowing = False
+        self.filters_applied.emit()
+
+    def filterAcceptsRow(self, source_row: int, source_parent: QModelIndex) -> bool:
+        if self._server_side:
+            return True
+        if not self._column_filters:
+            return super().filterAcceptsRow(source_row, source_parent)
+        if self._narrowing and source_row in self._rejected_rows:
+            return False
+
+        source = self.sourceModel()
+        accepted = True
+        for column, needle in self._column_filters.items():
+            value = source.data(source.index(source_row, column, source_parent))
+            if value is None or needle not in str(value).casefold():
+                accepted = False
+                break
+        if accepted:
+            accepted = super().filterAcceptsRow(source_row, source_parent)
+
+        if accepted:
+            self._rejected_rows.discard(source_row)
+        else:
+            self._rejected_rows.add(source_row)
+        return accepted
+
     def sort_data(self, column_index: int, order: Qt.SortOrder = Qt.SortOrder.AscendingOrder):
         """Sắp xếp dữ liệu theo cột và thứ tự chỉ định."""
         self.sort(column_index, order)
 
+    def sort(self, column: int, order: Qt.SortOrder = Qt.SortOrder.AscendingOrder):
+        if self._server_side:
+            # QSqlTableModel.sort() sets the ORDER BY clause and re-selects.
+            if column >= 0:
+                self.get_source_model().sort(column, order)
+            return
+        super().sort(column, order)
+
     def get_source_model(self) -> BaseModel:
         """Trả về Source Model (BaseModel) đã bọc."""
-        return self.sourceModel()
\ No newline at end of file
+        return self.sourceModel()
+
+    def _forget_rejected_rows(self, *args):
+        self._rejected_rows.clear()
+
+    @staticmethod
+    def _is_narrowing(old: Dict[int, str], new: Dict[int, str]) -> bool:
+        """True if every row accepted by `new` is also accepted by `old`."""
+        return all(column in new and needle in new[column] for column, needle in old.items())
+
+    def _sql_like_clause(self, column: int, text: str) -> str:
+        """Builds a `LIKE '%text%'` WHERE clause for the given column."""
+        source = self.get_source_model()
+        if not text or column < 0:
+            return ""
+        field_name = source.record().fieldName(column)
+        if not field_name:
+            return ""
+        escaped = (
+            text.replace("\\", "\\\\")
+            .replace("%", "\\%")
+            .replace("_", "\\_")
+            .replace("'", "''")
+        )
+        return f"\"{field_name}\" LIKE '%{escaped}%' ESCAPE '\\'"
@@ -1,12 +1,21 @@
 from src.models._base_model import BaseModel, BaseProxyModel
-from src.my_constants import DB_TABLES
+from src.my_constants import DB_TABLES, IMAGE_JOB_STATE_READY
 
 MISC_PRODUCT_TABLE = DB_TABLES["misc_product"]
+IMAGE_JOB_TABLE = DB_TABLES["image_job"]
+MISC_PRODUCT_GRID_COLUMNS = ["id", "status", "name", "created_at"]
+MISC_PRODUCT_COMPUTED_COLUMNS = {
+	"image_state": (
+		f"SELECT COALESCE((SELECT j.state FROM {IMAGE_JOB_TABLE} j "
+		f"WHERE j.product_id = {MISC_PRODUCT_TABLE}.id), '{IMAGE_JOB_STATE_READY}')"
+	),
+}
 
 
 class MiscProduct_Model(BaseModel):
 	def __init__(self, db, parent=None):
-		super().__init__(db, MISC_PRODUCT_TABLE, parent)
+		super().__init__(db, MISC_PRODUCT_TABLE, parent, columns=MISC_PRODUCT_GRID_COLUMNS,
+			computed_columns=MISC_PRODUCT_COMPUTED_COLUMNS)
 
 
 class MiscProduct_ProxyModel(BaseProxyModel):
@@ -1,13 +1,41 @@
 # src/models/property_product_model.py
 from src.models._base_model import BaseModel, BaseProxyModel
-from src.my_constants import DB_TABLES
+from src.my_constants import DB_TABLES, IMAGE_JOB_STATE_READY
 
 PROPERTY_PRODUCT_TABLE = DB_TABLES["property_product"]
+IMAGE_JOB_TABLE = DB_TABLES["image_job"]
+# Columns shown by the properties page; "description" is loaded on demand.
+PROPERTY_PRODUCT_GRID_COLUMNS = [
+    "id",
+    "pid",
+    "status",
+    "transaction_type",
+    "ward",
+    "street",
+    "category",
+    "area",
+    "price",
+    "unit",
+    "created_at",
+]
+# Trạng thái xử lý ảnh; sản phẩm không có job (dữ liệu cũ, nhập từ file) coi như đã sẵn sàng
+PROPERTY_PRODUCT_COMPUTED_COLUMNS = {
+    "image_state": (
+        f"SELECT COALESCE((SELECT j.state FROM {IMAGE_JOB_TABLE} j "
+        f"WHERE j.product_id = {PROPERTY_PRODUCT_TABLE}.id), '{IMAGE_JOB_STATE_READY}')"
+    ),
+}
 
 
 class PropertyProduct_Model(BaseModel):
     def __init__(self, db, parent=None):
-        super().__init__(db, PROPERTY_PRODUCT_TABLE, parent)
+        super().__init__(
+            db,
+            PROPERTY_PRODUCT_TABLE,
+            parent,
+            columns=PROPERTY_PRODUCT_GRID_COLUMNS,
+            computed_columns=PROPERTY_PRODUCT_COMPUTED_COLUMNS,
+        )
 
 
 class PropertyProduct_ProxyModel(BaseProxyModel):
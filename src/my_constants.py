@@ -1,13 +1,26 @@
 # src/my_constants.py
 DB_PATH = "./bin/database.db"
 COOKIES_PATH = "./bin/cookies.json"
+CACHE_DIR = "./bin/cache"
+BACKUP_DIR = "./bin/backups"
+# Số snapshot giữ lại và khoảng cách tối thiểu giữa hai lần backup tự động
+BACKUP_KEEP = 7
+BACKUP_INTERVAL_HOURS = 24
 DB_TABLES = {
     "profile": "PROFILE",
     "property_product": "PROPERTY_PRODUCT",
     "misc_product": "MISC_PRODUCT",
     "property_template": "PROPERTY_TEMPLATE",
     "setting": "SETTING",
-}
+    "image_folder": "IMAGE_FOLDER",
+    "image_manifest": "IMAGE_MANIFEST",
+    "image_blob": "IMAGE_BLOB",
+    "image_job": "IMAGE_JOB",
+    "sync_tombstone": "SYNC_TOMBSTONE",
+    "sync_peer": "SYNC_PEER",
+}
+# Bảng được đồng bộ giữa các máy (delta export/import). SETTING giữ đường dẫn riêng của từng máy nên không đồng bộ.
+SYNC_TABLES = ("profile", "property_product", "misc_product", "property_template")
 PROFILE__NAME_OPTIONS = {
     "real_estate": "Real estate",
     "tire": "Tire",
@@ -101,11 +114,20 @@ PROPERTY_TEMPLATE__NAME_OPTIONS = {
 }
 PROPERTY_TEMPLATE__CATEGORY_OPTIONS = PROPERTY_PRODUCT__CATEGORY_OPTIONS
 
+IMAGE_JOB_STATE_PENDING = "pending"
+IMAGE_JOB_STATE_PROCESSING = "processing"
+IMAGE_JOB_STATE_READY = "ready"
+IMAGE_JOB_STATE_FAILED = "failed"
+
 SETTING_NAME_OPTIONS = {
     "profile_container_dir": "user_data_dir container",
     "image_container_dir": "image_dir container",
     "logo_file": "logo_file",
     "proxy": "proxy",
+    "image_output_format": "image output format (PNG / JPEG / WEBP)",
+    "image_output_quality": "image output quality (1-100)",
+    "image_output_max_edge": "image output max edge (px, 0 = original)",
+    "image_output_strip_metadata": "image output strip metadata (true / false)",
 }
 
 SELL__BY_MARKETPLACE = "sell__by_marketplace"
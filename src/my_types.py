@@ -1,6 +1,6 @@
 # src/my_types.py
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Optional, List, Union, Any, Dict
 from PyQt6.QtCore import QObject, pyqtSignal
 
@@ -82,6 +82,111 @@ class Setting_Type:
     updated_at: Optional[str]
 
 
+@dataclass
+class ImageFile_Type:
+    folder: str
+    file_name: str
+    size: Optional[int]
+    hash: Optional[str]
+
+
+@dataclass
+class ImageFolder_Type:
+    folder: str
+    owner_id: Optional[str]
+    kind: str
+    mtime_ns: Optional[int]
+    files: List[ImageFile_Type]
+
+
+@dataclass
+class ImageJob_Type:
+    product_id: str
+    product_table: str
+    state: str
+    image_paths: List[str]
+    error: Optional[str]
+    attempts: int
+    created_at: Optional[str]
+    updated_at: Optional[str]
+
+
+@dataclass
+class ImageBlob_Type:
+    hash: str
+    size: Optional[int]
+    ref_count: int
+    created_at: Optional[str]
+    updated_at: Optional[str]
+
+
+@dataclass
+class BackupResult_Type:
+    snapshot_path: Optional[str] = None
+    pages: int = 0
+    restarts: int = 0
+    manifest_path: Optional[str] = None
+    manifest_files: int = 0
+    removed: List[str] = field(default_factory=list)
+    cancelled: bool = False
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None and not self.cancelled
+
+
+@dataclass
+class SyncPeer_Type:
+    peer_id: str
+    exported_until: Optional[str]
+    imported_until: Optional[str]
+    created_at: Optional[str]
+    updated_at: Optional[str]
+
+
+@dataclass
+class ImportResult_Type:
+    rows_imported: int = 0
+    rows_invalid: int = 0
+    rows_failed: int = 0
+    # Delta import: deletions applied, rows/deletions ignored because the local version is newer
+    rows_deleted: int = 0
+    rows_skipped: int = 0
+    cancelled: bool = False
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None and not self.cancelled
+
+
+@dataclass
+class BundleResult_Type:
+    # Export: rows/images written; import: rows upserted, rows kept because the local version is newer
+    rows: int = 0
+    rows_skipped: int = 0
+    rows_invalid: int = 0
+    rows_failed: int = 0
+    # Import: rows deleted on this machine after the bundle's version (left deleted)
+    rows_deleted: int = 0
+    blobs_written: int = 0
+    # Import: images already in the local store (not extracted), images whose content does not match
+    # their hash, images that could not be written
+    blobs_skipped: int = 0
+    blobs_invalid: int = 0
+    blobs_failed: int = 0
+    bytes_written: int = 0
+    # Products whose images could not all be exported / restored
+    images_missing: int = 0
+    cancelled: bool = False
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None and not self.cancelled
+
+
 class Statuses:
 
 
@@ -1,11 +1,14 @@
 # src/repositories/_base_repo.py
 from PyQt6.QtSql import QSqlDatabase, QSqlQuery, QSqlRecord
-from typing import Dict, Any, Optional, List, Callable, Tuple
+from typing import Dict, Any, Optional, Iterator, List, Callable, Tuple
 from datetime import datetime
 import uuid
 
 from src.utils.logger import Logger
 
+# Rows per batch when streaming large results (exports).
+EXPORT_BATCH_SIZE = 1000
+
 
 class BaseRepository:
 
@@ -121,6 +124,39 @@ class BaseRepository:
             results.append(self._record_to_dict(query.record()))
         return results
 
+    def iter_batches(
+        self,
+        sql: str,
+        params: Optional[Dict[str, Any]] = None,
+        batch_size: int = EXPORT_BATCH_SIZE,
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Yields the records matching the SQL query in lists of up to `batch_size`.
+
+        The query is forward-only, so rows are not cached by Qt and memory use
+        stays at one batch however large the result is. Consume the iterator
+        before running other statements that must see a consistent snapshot.
+        """
+        query = QSqlQuery(self.db)
+        query.setForwardOnly(True)
+        if not self._execute_query(query, sql, params):
+            # Khác với get_all: một export rỗng vì lỗi truy vấn không được coi là thành công
+            raise RuntimeError(f"Query error: {query.lastError().text()}")
+
+        field_names = None
+        batch: List[Dict[str, Any]] = []
+        while query.next():
+            if field_names is None:
+                record = query.record()
+                field_names = [record.fieldName(i) for i in range(record.count())]
+            batch.append({name: query.value(i) for i, name in enumerate(field_names)})
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+        query.finish()
+
     # --- Bulk/Transaction Methods ---
 
     def execute_many(self, sql: str, params_list: List[Dict[str, Any]]) -> bool:
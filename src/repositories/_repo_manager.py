@@ -6,6 +6,10 @@ from src.repositories.profile_repo import Profile_Repo
 from src.repositories.property_product_repo import PropertyProduct_Repo
 from src.repositories.property_template_repo import PropertyTemplate_Repo
 from src.repositories.setting_repo import Setting_Repo
+from src.repositories.image_manifest_repo import ImageManifest_Repo
+from src.repositories.image_blob_repo import ImageBlob_Repo
+from src.repositories.image_job_repo import ImageJob_Repo
+from src.repositories.sync_repo import Sync_Repo
 
 
 class Repository_Manager:
@@ -16,3 +20,7 @@ class Repository_Manager:
         self.property_product_repo = PropertyProduct_Repo(db_instance)
         self.property_template_repo = PropertyTemplate_Repo(db_instance)
         self.setting_repo = Setting_Repo(db_instance)
+        self.image_manifest_repo = ImageManifest_Repo(db_instance)
+        self.image_blob_repo = ImageBlob_Repo(db_instance)
+        self.image_job_repo = ImageJob_Repo(db_instance)
+        self.sync_repo = Sync_Repo(db_instance)
@@ -0,0 +1,107 @@
+# src/repositories/image_blob_repo.py
+
+from collections import Counter
+from typing import Any, Dict, Iterable, List, Tuple
+from src.my_constants import DB_TABLES
+from src.repositories._base_repo import BaseRepository
+from src.my_types import ImageBlob_Type
+
+IMAGE_BLOB_TABLE = DB_TABLES["image_blob"]
+
+
+class ImageBlob_Repo(BaseRepository):
+    """
+    Repository for the reference counts of the content-addressed image store:
+    one IMAGE_BLOB row per stored hash, counting the product files linked to it.
+    """
+
+    def _dict_to_blob(self, data: Dict[str, Any]) -> ImageBlob_Type:
+        return ImageBlob_Type(
+            hash=data.get("hash"),
+            size=data.get("size"),
+            ref_count=data.get("ref_count") or 0,
+            created_at=data.get("created_at"),
+            updated_at=data.get("updated_at"),
+        )
+
+    def add_refs(self, blobs: Iterable[Tuple[str, int]]) -> bool:
+        """Adds one reference per (hash, size) item, creating missing rows, in a single transaction."""
+        blobs = list(blobs)
+        if not blobs:
+            return True
+        success, _ = self.execute_in_transaction(lambda: (self.apply_add_refs(blobs), None))
+        return success
+
+    def apply_add_refs(self, blobs: Iterable[Tuple[str, int]]) -> bool:
+        """Same as `add_refs`, inside the caller's transaction."""
+        counts = Counter()
+        sizes: Dict[str, int] = {}
+        for digest, size in blobs:
+            counts[digest] += 1
+            sizes[digest] = size
+        if not counts:
+            return True
+        now = self.init_time()
+        params_list = [
+            {"hash": digest, "size": sizes[digest], "refs": refs, "now": now}
+            for digest, refs in counts.items()
+        ]
+        return super().execute_many(
+            sql=f"""
+            INSERT INTO {IMAGE_BLOB_TABLE} (hash, size, ref_count, created_at, updated_at)
+            VALUES (:hash, :size, :refs, :now, :now)
+            ON CONFLICT(hash) DO UPDATE SET
+                ref_count = ref_count + excluded.ref_count,
+                updated_at = excluded.updated_at
+            """,
+            params_list=params_list,
+        )
+
+    def release_refs(self, hashes: Iterable[str]) -> bool:
+        """Drops one reference per hash occurrence; unknown hashes are ignored."""
+        hashes = [digest for digest in hashes if digest]
+        if not hashes:
+            return True
+        success, _ = self.execute_in_transaction(lambda: (self.apply_release_refs(hashes), None))
+        return success
+
+    def apply_release_refs(self, hashes: Iterable[str]) -> bool:
+        """Same as `release_refs`, inside the caller's transaction."""
+        counts = Counter(digest for digest in hashes if digest)
+        if not counts:
+            return True
+        now = self.init_time()
+        params_list = [{"hash": digest, "refs": refs, "now": now} for digest, refs in counts.items()]
+        return super().execute_many(
+            sql=f"""
+            UPDATE {IMAGE_BLOB_TABLE} SET
+                ref_count = MAX(ref_count - :refs, 0),
+                updated_at = :now
+            WHERE hash = :hash
+            """,
+            params_list=params_list,
+        )
+
+    def get_unreferenced(self) -> List[ImageBlob_Type]:
+        sql = f"SELECT * FROM {IMAGE_BLOB_TABLE} WHERE ref_count <= 0"
+        return [self._dict_to_blob(row) for row in super().get_all(sql)]
+
+    def get_all_hashes(self) -> List[str]:
+        sql = f"SELECT hash FROM {IMAGE_BLOB_TABLE}"
+        return [row.get("hash") for row in super().get_all(sql)]
+
+    def delete_unreferenced(self, hashes: List[str]) -> bool:
+        """Deletes rows of the given hashes that are still unreferenced (re-checked inside the transaction)."""
+        if not hashes:
+            return True
+        repo_super = super(ImageBlob_Repo, self)
+
+        def execute_delete() -> Tuple[bool, Any]:
+            success = repo_super.execute_many(
+                sql=f"DELETE FROM {IMAGE_BLOB_TABLE} WHERE hash = :hash AND ref_count <= 0",
+                params_list=[{"hash": digest} for digest in hashes],
+            )
+            return success, None
+
+        success, _ = repo_super.execute_in_transaction(execute_delete)
+        return success
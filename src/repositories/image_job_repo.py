@@ -0,0 +1,136 @@
+# src/repositories/image_job_repo.py
+
+import json
+from typing import Any, Dict, List, Optional
+from src.my_constants import (
+    DB_TABLES,
+    IMAGE_JOB_STATE_PENDING,
+    IMAGE_JOB_STATE_PROCESSING,
+)
+from src.repositories._base_repo import BaseRepository
+from src.my_types import ImageJob_Type
+
+IMAGE_JOB_TABLE = DB_TABLES["image_job"]
+
+
+class ImageJob_Repo(BaseRepository):
+    """
+    Repository for the product image-processing queue: one IMAGE_JOB row per
+    product, holding its processing state and the source images to process.
+    """
+
+    def _dict_to_job(self, data: Dict[str, Any]) -> ImageJob_Type:
+        try:
+            image_paths = json.loads(data.get("image_paths") or "[]")
+        except ValueError:
+            image_paths = []
+        return ImageJob_Type(
+            product_id=data.get("product_id"),
+            product_table=data.get("product_table"),
+            state=data.get("state"),
+            image_paths=image_paths,
+            error=data.get("error") or None,
+            attempts=data.get("attempts") or 0,
+            created_at=data.get("created_at"),
+            updated_at=data.get("updated_at"),
+        )
+
+    def add_job(self, product_id: str, product_table: str, image_paths: List[str]) -> bool:
+        """
+        Queues a product as pending. A single statement, so it can run inside
+        the caller's transaction (together with the product INSERT).
+        """
+        now = self.init_time()
+        sql = f"""
+        INSERT OR REPLACE INTO {IMAGE_JOB_TABLE} (
+            product_id, product_table, state, image_paths, error, attempts, created_at, updated_at
+        ) VALUES (
+            :product_id, :product_table, :state, :image_paths, NULL, 0, :now, :now
+        )
+        """
+        params = {
+            "product_id": product_id,
+            "product_table": product_table,
+            "state": IMAGE_JOB_STATE_PENDING,
+            "image_paths": json.dumps(image_paths, ensure_ascii=False),
+            "now": now,
+        }
+        return super().insert(sql=sql, params=params)
+
+    def get_job(self, product_id: str) -> Optional[ImageJob_Type]:
+        sql = f"SELECT * FROM {IMAGE_JOB_TABLE} WHERE product_id = :product_id"
+        result_dict = super().get_one(sql=sql, params={"product_id": product_id})
+        if result_dict:
+            return self._dict_to_job(result_dict)
+        return None
+
+    def claim_next(self) -> Optional[ImageJob_Type]:
+        """Marks the oldest pending job as processing (one more attempt) and returns it."""
+        sql = f"""
+        SELECT * FROM {IMAGE_JOB_TABLE}
+        WHERE state = :state
+        ORDER BY created_at LIMIT 1
+        """
+        result_dict = super().get_one(sql=sql, params={"state": IMAGE_JOB_STATE_PENDING})
+        if not result_dict:
+            return None
+        job = self._dict_to_job(result_dict)
+        sql = f"""
+        UPDATE {IMAGE_JOB_TABLE} SET
+            state = :state,
+            attempts = attempts + 1,
+            updated_at = :updated_at
+        WHERE product_id = :product_id AND state = :pending
+        """
+        params = {
+            "state": IMAGE_JOB_STATE_PROCESSING,
+            "updated_at": self.init_time(),
+            "product_id": job.product_id,
+            "pending": IMAGE_JOB_STATE_PENDING,
+        }
+        if not super().update(sql=sql, params=params):
+            return None
+        job.state = IMAGE_JOB_STATE_PROCESSING
+        job.attempts += 1
+        return job
+
+    def set_state(self, product_id: str, state: str, error: Optional[str] = None) -> bool:
+        sql = f"""
+        UPDATE {IMAGE_JOB_TABLE} SET
+            state = :state,
+            error = :error,
+            updated_at = :updated_at
+        WHERE product_id = :product_id
+        """
+        params = {
+            "state": state,
+            "error": error,
+            "updated_at": self.init_time(),
+            "product_id": product_id,
+        }
+        return super().update(sql=sql, params=params)
+
+    def requeue(self, from_state: str) -> int:
+        """Moves every job in `from_state` back to pending; returns how many were moved."""
+        sql = f"SELECT COUNT(*) AS total FROM {IMAGE_JOB_TABLE} WHERE state = :state"
+        result_dict = super().get_one(sql=sql, params={"state": from_state})
+        total = (result_dict or {}).get("total") or 0
+        if total:
+            sql = f"""
+            UPDATE {IMAGE_JOB_TABLE} SET
+                state = :pending,
+                updated_at = :updated_at
+            WHERE state = :state
+            """
+            params = {
+                "pending": IMAGE_JOB_STATE_PENDING,
+                "updated_at": self.init_time(),
+                "state": from_state,
+            }
+            if not super().update(sql=sql, params=params):
+                return 0
+        return total
+
+    def delete_job(self, product_id: str) -> bool:
+        sql = f"DELETE FROM {IMAGE_JOB_TABLE} WHERE product_id = :product_id"
+        return super().delete(sql=sql, params={"product_id": product_id})
@@ -0,0 +1,148 @@
+# src/repositories/image_manifest_repo.py
+
+from typing import Dict, Any, Optional, List
+from PyQt6.QtSql import QSqlQuery
+from src.my_constants import DB_TABLES
+from src.repositories._base_repo import BaseRepository
+from src.my_types import ImageFile_Type, ImageFolder_Type
+
+IMAGE_FOLDER_TABLE = DB_TABLES["image_folder"]
+IMAGE_MANIFEST_TABLE = DB_TABLES["image_manifest"]
+
+
+class ImageManifest_Repo(BaseRepository):
+    """
+    Repository for the image manifest: one IMAGE_FOLDER row per product image
+    folder (with the folder mtime it was indexed at) and one IMAGE_MANIFEST row
+    per image file in it.
+    """
+
+    def _load_folders(self, sql: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, ImageFolder_Type]:
+        """Runs a folder LEFT JOIN manifest query and groups the rows by folder."""
+        query = QSqlQuery(self.db)
+        folders: Dict[str, ImageFolder_Type] = {}
+        if not self._execute_query(query, sql, params):
+            return folders
+        while query.next():
+            folder = query.value(0)
+            current = folders.get(folder)
+            if current is None:
+                current = ImageFolder_Type(
+                    folder=folder,
+                    owner_id=query.value(1),
+                    kind=query.value(2),
+                    mtime_ns=query.value(3),
+                    files=[],
+                )
+                folders[folder] = current
+            file_name = query.value(4)
+            if file_name:
+                current.files.append(
+                    ImageFile_Type(folder, file_name, query.value(5), query.value(6) or None)
+                )
+        return folders
+
+    def get_folder(self, folder: str) -> Optional[ImageFolder_Type]:
+        """Returns the indexed state of one folder, or None if it was never indexed."""
+        sql = f"""
+        SELECT f.folder, f.owner_id, f.kind, f.mtime_ns, m.file_name, m.size, m.hash
+        FROM {IMAGE_FOLDER_TABLE} f
+        LEFT JOIN {IMAGE_MANIFEST_TABLE} m ON m.folder = f.folder
+        WHERE f.folder = :folder
+        ORDER BY m.file_name
+        """
+        return self._load_folders(sql, {"folder": folder}).get(folder)
+
+    def get_folders_by_kind(self, kind: str) -> Dict[str, ImageFolder_Type]:
+        """Returns every indexed folder of a kind ("logo" / "source") in a single query."""
+        sql = f"""
+        SELECT f.folder, f.owner_id, f.kind, f.mtime_ns, m.file_name, m.size, m.hash
+        FROM {IMAGE_FOLDER_TABLE} f
+        LEFT JOIN {IMAGE_MANIFEST_TABLE} m ON m.folder = f.folder
+        WHERE f.kind = :kind
+        ORDER BY f.folder, m.file_name
+        """
+        return self._load_folders(sql, {"kind": kind})
+
+    def get_folders_by_owners(self, owner_ids: List[str]) -> Dict[str, ImageFolder_Type]:
+        """Returns the indexed folders of a batch of owners (product ids) in a single query."""
+        if not owner_ids:
+            return {}
+        params = {f"owner_{index}": owner_id for index, owner_id in enumerate(owner_ids)}
+        placeholders = ", ".join(f":{name}" for name in params)
+        sql = f"""
+        SELECT f.folder, f.owner_id, f.kind, f.mtime_ns, m.file_name, m.size, m.hash
+        FROM {IMAGE_FOLDER_TABLE} f
+        LEFT JOIN {IMAGE_MANIFEST_TABLE} m ON m.folder = f.folder
+        WHERE f.owner_id IN ({placeholders})
+        ORDER BY f.folder, m.file_name
+        """
+        return self._load_folders(sql, params)
+
+    def replace_folders(self, folders: List[ImageFolder_Type]) -> bool:
+        """Replaces the indexed files of the given folders in a single transaction."""
+        if not folders:
+            return True
+        success, _ = self.execute_in_transaction(lambda: (self.apply_replace_folders(folders), None))
+        return success
+
+    def apply_replace_folders(self, folders: List[ImageFolder_Type]) -> bool:
+        """Same as `replace_folders`, inside the caller's transaction."""
+        if not folders:
+            return True
+        now = self.init_time()
+        folder_params = [
+            {
+                "folder": folder.folder,
+                "owner_id": folder.owner_id,
+                "kind": folder.kind,
+                "mtime_ns": folder.mtime_ns,
+                "updated_at": now,
+            }
+            for folder in folders
+        ]
+        file_params = [
+            {"folder": file.folder, "file_name": file.file_name, "size": file.size, "hash": file.hash}
+            for folder in folders
+            for file in folder.files
+        ]
+        return (
+            super().execute_many(
+                sql=f"DELETE FROM {IMAGE_MANIFEST_TABLE} WHERE folder = :folder",
+                params_list=[{"folder": params["folder"]} for params in folder_params],
+            )
+            and super().execute_many(
+                sql=f"""
+                INSERT OR REPLACE INTO {IMAGE_FOLDER_TABLE} (folder, owner_id, kind, mtime_ns, updated_at)
+                VALUES (:folder, :owner_id, :kind, :mtime_ns, :updated_at)
+                """,
+                params_list=folder_params,
+            )
+            and super().execute_many(
+                sql=f"""
+                INSERT INTO {IMAGE_MANIFEST_TABLE} (folder, file_name, size, hash)
+                VALUES (:folder, :file_name, :size, :hash)
+                """,
+                params_list=file_params,
+            )
+        )
+
+    def delete_by_owner(self, owner_id: str) -> bool:
+        """Forgets every folder (and its files) indexed for an owner (product id)."""
+        success, _ = self.execute_in_transaction(lambda: (self.apply_delete_by_owner(owner_id), None))
+        return success
+
+    def apply_delete_by_owner(self, owner_id: str) -> bool:
+        """Same as `delete_by_owner`, inside the caller's transaction."""
+        params = {"owner_id": owner_id}
+        return super().delete(
+            sql=f"""
+            DELETE FROM {IMAGE_MANIFEST_TABLE} WHERE folder IN (
+                SELECT folder FROM {IMAGE_FOLDER_TABLE} WHERE owner_id = :owner_id
+            )
+            """,
+            params=params,
+        ) and super().delete(
+            sql=f"DELETE FROM {IMAGE_FOLDER_TABLE} WHERE owner_id = :owner_id",
+            params=params,
+        )
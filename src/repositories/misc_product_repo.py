@@ -1,12 +1,13 @@
 # src/repositories/misc_product_repo.py
 from datetime import datetime, timedelta
-from typing import Dict, Any, Optional, List, Union, Tuple
+from typing import Dict, Any, Optional, List, Union, Tuple, Iterator
 from dataclasses import asdict
-from src.my_constants import DB_TABLES
-from src.repositories._base_repo import BaseRepository
+from src.my_constants import DB_TABLES, IMAGE_JOB_STATE_READY
+from src.repositories._base_repo import BaseRepository, EXPORT_BATCH_SIZE
 from src.my_types import MiscProduct_Type
 
 
+IMAGE_JOB_TABLE = DB_TABLES["image_job"]
 MISC_PRODUCT_TABLE = DB_TABLES["misc_product"]
 
 
@@ -113,9 +114,14 @@ class MiscProduct_Repo(BaseRepository):
         sql = f"""
         SELECT * FROM {MISC_PRODUCT_TABLE}
         WHERE name = :name AND updated_at < :time_ago
+        -- Sản phẩm có ảnh chưa xử lý xong (pending/processing/failed) không được chọn
+        AND NOT EXISTS (
+            SELECT 1 FROM {IMAGE_JOB_TABLE} j
+            WHERE j.product_id = {MISC_PRODUCT_TABLE}.id AND j.state != :ready_state
+        )
         ORDER BY RANDOM() LIMIT 1
         """
-        params = {"name": name, "time_ago": time_ago}
+        params = {"name": name, "time_ago": time_ago, "ready_state": IMAGE_JOB_STATE_READY}
         result_dict = super().get_one(sql=sql, params=params)
 
         if result_dict:
@@ -133,6 +139,11 @@ class MiscProduct_Repo(BaseRepository):
         sql = f"SELECT * FROM {MISC_PRODUCT_TABLE}"
         return super().get_all(sql=sql)
 
+    def iter_all_for_export(self, batch_size: int = EXPORT_BATCH_SIZE) -> Iterator[List[Dict[str, Any]]]:
+        """Yields all records in batches of dictionaries (forward-only, constant memory)."""
+        sql = f"SELECT * FROM {MISC_PRODUCT_TABLE}"
+        return super().iter_batches(sql=sql, batch_size=batch_size)
+
     def insert_bulk(self, payload: List[Any]) -> bool:
         """Inserts multiple MiscProduct_Type records in a single transaction."""
         if not payload:
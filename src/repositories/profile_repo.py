@@ -1,9 +1,9 @@
 # src/repositories/profile_repo.py
 
-from typing import Dict, Any, Optional, List, Union, Tuple
+from typing import Dict, Any, Optional, List, Union, Tuple, Iterator
 from dataclasses import asdict
 from src.my_constants import DB_TABLES
-from src.repositories._base_repo import BaseRepository
+from src.repositories._base_repo import BaseRepository, EXPORT_BATCH_SIZE
 from src.my_types import Profile_Type
 
 PROFILE_TABLE = DB_TABLES["profile"]
@@ -129,6 +129,11 @@ class Profile_Repo(BaseRepository):
         sql = f"SELECT * FROM {PROFILE_TABLE}"
         return super().get_all(sql=sql)
 
+    def iter_all_for_export(self, batch_size: int = EXPORT_BATCH_SIZE) -> Iterator[List[Dict[str, Any]]]:
+        """Yields all records in batches of dictionaries (forward-only, constant memory)."""
+        sql = f"SELECT * FROM {PROFILE_TABLE}"
+        return super().iter_batches(sql=sql, batch_size=batch_size)
+
     def insert_bulk(self, payload: List[Any]) -> bool:
         """
         Inserts multiple Profile_Type records in a single transaction.
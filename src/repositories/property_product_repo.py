@@ -1,13 +1,14 @@
 # src/repositories/property_product_repo.py
 
-from typing import Dict, Any, Optional, List, Union, Tuple
+from typing import Dict, Any, Optional, List, Union, Tuple, Iterator
 from datetime import datetime, timedelta
 from dataclasses import asdict
-from src.my_constants import DB_TABLES
-from src.repositories._base_repo import BaseRepository
+from src.my_constants import DB_TABLES, IMAGE_JOB_STATE_READY
+from src.repositories._base_repo import BaseRepository, EXPORT_BATCH_SIZE
 from src.my_types import PropertyProduct_Type
 
 
+IMAGE_JOB_TABLE = DB_TABLES["image_job"]
 PROPERTY_PRODUCT_TABLE = DB_TABLES["property_product"]
 
 
@@ -133,9 +134,14 @@ class PropertyProduct_Repo(BaseRepository):
         sql = f"""
         SELECT * FROM {PROPERTY_PRODUCT_TABLE}
         WHERE transaction_type = :transaction_type AND updated_at < :time_ago
+        -- Sản phẩm có ảnh chưa xử lý xong (pending/processing/failed) không được chọn
+        AND NOT EXISTS (
+            SELECT 1 FROM {IMAGE_JOB_TABLE} j
+            WHERE j.product_id = {PROPERTY_PRODUCT_TABLE}.id AND j.state != :ready_state
+        )
         ORDER BY RANDOM() LIMIT 1
         """
-        params = {"transaction_type": transaction_type, "time_ago": time_ago}
+        params = {"transaction_type": transaction_type, "time_ago": time_ago, "ready_state": IMAGE_JOB_STATE_READY}
         result_dict = super().get_one(sql=sql, params=params)
 
         if result_dict:
@@ -151,6 +157,12 @@ class PropertyProduct_Repo(BaseRepository):
     def get_all_for_export(self) -> List[Dict[str, Any]]:
         sql = f"SELECT * FROM {PROPERTY_PRODUCT_TABLE}"
         return super().get_all(sql=sql)
+
+    def iter_all_for_export(self, batch_size: int = EXPORT_BATCH_SIZE) -> Iterator[List[Dict[str, Any]]]:
+        """Yields all records in batches of dictionaries (forward-only, constant memory)."""
+        sql = f"SELECT * FROM {PROPERTY_PRODUCT_TABLE}"
+        return super().iter_batches(sql=sql, batch_size=batch_size)
+
     def insert_bulk(self, payload: List[Any]) -> bool:
         """Inserts multiple PropertyProduct_Type records in a single transaction."""
         if not payload:
@@ -1,9 +1,9 @@
 # src/repositories/property_template_repo.py
 
-from typing import Dict, Any, Optional, List, Union, Tuple
+from typing import Dict, Any, Optional, List, Union, Tuple, Iterator
 from dataclasses import asdict
 from src.my_constants import DB_TABLES
-from src.repositories._base_repo import BaseRepository
+from src.repositories._base_repo import BaseRepository, EXPORT_BATCH_SIZE
 from src.my_types import PropertyTemplate_Type
 
 
@@ -104,6 +104,12 @@ class PropertyTemplate_Repo(BaseRepository):
     def get_all_for_export(self) -> List[Dict[str, Any]]:
         sql = f"SELECT * FROM {PROPERTY_TEMPLATE_TABLE}"
         return super().get_all(sql=sql)
+
+    def iter_all_for_export(self, batch_size: int = EXPORT_BATCH_SIZE) -> Iterator[List[Dict[str, Any]]]:
+        """Yields all records in batches of dictionaries (forward-only, constant memory)."""
+        sql = f"SELECT * FROM {PROPERTY_TEMPLATE_TABLE}"
+        return super().iter_batches(sql=sql, batch_size=batch_size)
+
     def get_all_templates(self) -> List[PropertyTemplate_Type]:
         """Retrieves all property template records from the table."""
         sql = f"SELECT * FROM {PROPERTY_TEMPLATE_TABLE}"
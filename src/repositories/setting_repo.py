@@ -1,9 +1,9 @@
 # src/repositories/setting_repo.py
 
-from typing import Dict, Tuple, Any, Optional, List, Union
+from typing import Dict, Tuple, Any, Optional, List, Union, Iterator
 from dataclasses import asdict
 from src.my_constants import DB_TABLES
-from src.repositories._base_repo import BaseRepository
+from src.repositories._base_repo import BaseRepository, EXPORT_BATCH_SIZE
 from src.my_types import Setting_Type
 
 
@@ -139,6 +139,12 @@ class Setting_Repo(BaseRepository):
     def get_all_for_export(self) -> List[Dict[str, Any]]:
         sql = f"SELECT * FROM {SETTING_TABLE}"
         return super().get_all(sql=sql)
+
+    def iter_all_for_export(self, batch_size: int = EXPORT_BATCH_SIZE) -> Iterator[List[Dict[str, Any]]]:
+        """Yields all records in batches of dictionaries (forward-only, constant memory)."""
+        sql = f"SELECT * FROM {SETTING_TABLE}"
+        return super().iter_batches(sql=sql, batch_size=batch_size)
+
     def get_all_settings(self) -> List[Setting_Type]:
         """Retrieves all setting records from the table."""
         sql = f"SELECT * FROM {SETTING_TABLE}"
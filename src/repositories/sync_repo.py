@@ -0,0 +1,233 @@
+# src/repositories/sync_repo.py
+
+from typing import Any, Dict, Iterator, List, Optional
+from PyQt6.QtSql import QSqlQuery
+from src.my_constants import DB_TABLES, SYNC_TABLES
+from src.repositories._base_repo import BaseRepository, EXPORT_BATCH_SIZE
+from src.my_types import SyncPeer_Type
+
+SYNC_TOMBSTONE_TABLE = DB_TABLES["sync_tombstone"]
+SYNC_PEER_TABLE = DB_TABLES["sync_peer"]
+
+
+class Sync_Repo(BaseRepository):
+    """
+    Repository for delta sync between workstations: changed rows of the
+    SYNC_TABLES (by `updated_at`), deletion tombstones (written by the
+    AFTER DELETE triggers) and per-peer watermarks.
+
+    Rows coming from a peer are applied last-writer-wins on `updated_at`, so
+    applying the same delta twice, or an older delta after a newer one,
+    changes nothing.
+    """
+
+    def __init__(self, db):
+        super().__init__(db)
+        self._columns: Dict[str, List[str]] = {}
+
+    def table_columns(self, table_key: str) -> List[str]:
+        """Column names of a synced table, read from the schema (cached)."""
+        if table_key not in SYNC_TABLES:
+            raise ValueError(f"Table is not synced: {table_key}")
+        if table_key not in self._columns:
+            rows = super().get_all(sql=f"PRAGMA table_info({DB_TABLES[table_key]})")
+            self._columns[table_key] = [row.get("name") for row in rows]
+        return self._columns[table_key]
+
+    # --- Export ---
+
+    def iter_changed_rows(
+        self, table_key: str, since: Optional[str], batch_size: int = EXPORT_BATCH_SIZE
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Yields the rows of `table_key` updated at or after `since` (all rows if None).
+        `since` is inclusive: rows written in the same second as the previous
+        export are sent again, which is harmless since applying is idempotent.
+        """
+        table = DB_TABLES[table_key]
+        if since is None:
+            return super().iter_batches(sql=f"SELECT * FROM {table}", batch_size=batch_size)
+        sql = f"SELECT * FROM {table} WHERE updated_at >= :since"
+        return super().iter_batches(sql=sql, params={"since": since}, batch_size=batch_size)
+
+    def get_updated_at(self, table_key: str, row_ids: List[str]) -> Dict[str, Optional[str]]:
+        """{id: updated_at} of the rows of `table_key` among `row_ids` that exist."""
+        if table_key not in SYNC_TABLES:
+            raise ValueError(f"Table is not synced: {table_key}")
+        if not row_ids:
+            return {}
+        params = {f"id_{index}": row_id for index, row_id in enumerate(row_ids)}
+        placeholders = ", ".join(f":{name}" for name in params)
+        sql = f"SELECT id, updated_at FROM {DB_TABLES[table_key]} WHERE id IN ({placeholders})"
+        return {row["id"]: row["updated_at"] for row in super().get_all(sql=sql, params=params)}
+
+    def get_tombstones(self, table_key: str, row_ids: List[str]) -> Dict[str, str]:
+        """{id: deleted_at} of the rows of `table_key` among `row_ids` deleted on this machine."""
+        if not row_ids:
+            return {}
+        params = {f"id_{index}": row_id for index, row_id in enumerate(row_ids)}
+        placeholders = ", ".join(f":{name}" for name in params)
+        params["table_key"] = table_key
+        sql = f"""
+        SELECT row_id, deleted_at FROM {SYNC_TOMBSTONE_TABLE}
+        WHERE table_key = :table_key AND row_id IN ({placeholders})
+        """
+        return {row["row_id"]: row["deleted_at"] for row in super().get_all(sql=sql, params=params)}
+
+    def iter_tombstones(
+        self, since: Optional[str], batch_size: int = EXPORT_BATCH_SIZE
+    ) -> Iterator[List[Dict[str, Any]]]:
+        if since is None:
+            return super().iter_batches(sql=f"SELECT * FROM {SYNC_TOMBSTONE_TABLE}", batch_size=batch_size)
+        sql = f"SELECT * FROM {SYNC_TOMBSTONE_TABLE} WHERE deleted_at >= :since"
+        return super().iter_batches(sql=sql, params={"since": since}, batch_size=batch_size)
+
+    def prune_tombstones(self, before: str) -> bool:
+        """Forgets deletions older than `before`."""
+        sql = f"DELETE FROM {SYNC_TOMBSTONE_TABLE} WHERE deleted_at < :before"
+        return super().delete(sql=sql, params={"before": before})
+
+    # --- Apply (call inside a transaction) ---
+
+    def _exec(self, queries: Dict[str, QSqlQuery], sql: str, params: Dict[str, Any]) -> Optional[int]:
+        """Executes `sql` with a query prepared once per statement; returns the rows affected, None on error."""
+        query = queries.get(sql)
+        if query is None:
+            query = QSqlQuery(self.db)
+            query.prepare(sql)
+            queries[sql] = query
+        for key, value in params.items():
+            query.bindValue(f":{key}", value)
+        if not query.exec():
+            self.logger.error(f"Query error: {query.lastError().text()}")
+            self.logger.error(f"SQL: {sql}")
+            return None
+        return query.numRowsAffected()
+
+    def _upsert_sql(self, table_key: str, columns: List[str]) -> str:
+        table = DB_TABLES[table_key]
+        assignments = ", ".join(f"{column} = excluded.{column}" for column in columns if column != "id")
+        # Không chèn lại dòng đã bị xóa sau lần sửa cuối; chỉ ghi đè khi bản đến mới hơn bản đang có
+        return f"""
+        INSERT INTO {table} ({", ".join(columns)})
+        SELECT {", ".join(f":{column}" for column in columns)}
+        WHERE NOT EXISTS (
+            SELECT 1 FROM {SYNC_TOMBSTONE_TABLE} t
+            WHERE t.table_key = :sync_table_key AND t.row_id = :id AND t.deleted_at > :updated_at
+        )
+        ON CONFLICT(id) DO UPDATE SET {assignments}
+        WHERE {table}.updated_at IS NULL OR excluded.updated_at > {table}.updated_at
+        """
+
+    def upsert_row(self, queries: Dict[str, QSqlQuery], table_key: str, row: Dict[str, Any]) -> Optional[bool]:
+        """
+        Inserts or updates one row from a peer, keeping the newer version.
+        Returns True if the row changed, False if the local version was kept,
+        None on a database error. Unknown columns are ignored.
+        """
+        columns = [column for column in self.table_columns(table_key) if column in row]
+        params = {column: row[column] for column in columns}
+        params["sync_table_key"] = table_key
+        affected = self._exec(queries, self._upsert_sql(table_key, columns), params)
+        if affected is None:
+            return None
+        if affected:
+            # Dòng được tạo lại sau một lần xóa cũ hơn: tombstone không còn đúng
+            sql = f"""
+            DELETE FROM {SYNC_TOMBSTONE_TABLE}
+            WHERE table_key = :table_key AND row_id = :id AND deleted_at <= :updated_at
+            """
+            params = {"table_key": table_key, "id": row["id"], "updated_at": row["updated_at"]}
+            if self._exec(queries, sql, params) is None:
+                return None
+        return affected > 0
+
+    def apply_delete(
+        self, queries: Dict[str, QSqlQuery], table_key: str, row_id: str, deleted_at: str
+    ) -> Optional[bool]:
+        """
+        Deletes a row deleted on a peer, unless it was modified here after the
+        deletion. Returns True if a row was deleted, False if not, None on error.
+        The tombstone keeps the peer's deletion time, so it is not echoed back
+        as a new deletion.
+        """
+        table = DB_TABLES[table_key]
+        params = {"id": row_id, "deleted_at": deleted_at}
+        sql = f"DELETE FROM {table} WHERE id = :id AND (updated_at IS NULL OR updated_at <= :deleted_at)"
+        deleted = self._exec(queries, sql, params)
+        if deleted is None:
+            return None
+
+        params["table_key"] = table_key
+        if deleted:
+            # Trigger vừa ghi tombstone với thời điểm hiện tại: thay bằng thời điểm xóa gốc
+            sql = f"""
+            UPDATE {SYNC_TOMBSTONE_TABLE} SET deleted_at = :deleted_at
+            WHERE table_key = :table_key AND row_id = :id
+            """
+        else:
+            sql = f"""
+            INSERT INTO {SYNC_TOMBSTONE_TABLE} (table_key, row_id, deleted_at)
+            SELECT :table_key, :id, :deleted_at
+            WHERE NOT EXISTS (SELECT 1 FROM {table} WHERE id = :id)
+            ON CONFLICT(table_key, row_id) DO UPDATE SET deleted_at = MAX(deleted_at, excluded.deleted_at)
+            """
+        if self._exec(queries, sql, params) is None:
+            return None
+        return deleted > 0
+
+    # --- Peers ---
+
+    def _dict_to_peer(self, data: Dict[str, Any]) -> SyncPeer_Type:
+        return SyncPeer_Type(
+            peer_id=data.get("peer_id"),
+            exported_until=data.get("exported_until") or None,
+            imported_until=data.get("imported_until") or None,
+            created_at=data.get("created_at"),
+            updated_at=data.get("updated_at"),
+        )
+
+    def get_peer(self, peer_id: str) -> Optional[SyncPeer_Type]:
+        sql = f"SELECT * FROM {SYNC_PEER_TABLE} WHERE peer_id = :peer_id"
+        result_dict = super().get_one(sql=sql, params={"peer_id": peer_id})
+        if result_dict:
+            return self._dict_to_peer(result_dict)
+        return None
+
+    def get_all_peers(self) -> List[SyncPeer_Type]:
+        results_list = super().get_all(sql=f"SELECT * FROM {SYNC_PEER_TABLE} ORDER BY peer_id")
+        return [self._dict_to_peer(data) for data in results_list]
+
+    def min_exported_until(self) -> Optional[str]:
+        """Oldest export watermark over all peers; None if there are none or one has never been exported to."""
+        sql = f"""
+        SELECT MIN(exported_until) AS oldest, COUNT(*) - COUNT(exported_until) AS never
+        FROM {SYNC_PEER_TABLE}
+        """
+        result_dict = super().get_one(sql=sql)
+        if not result_dict or result_dict.get("never"):
+            return None
+        return result_dict.get("oldest") or None
+
+    def _set_watermark(self, peer_id: str, column: str, value: str) -> bool:
+        # Watermark chỉ tiến lên: áp dụng lại một delta cũ không kéo lùi nó
+        sql = f"""
+        INSERT INTO {SYNC_PEER_TABLE} (peer_id, {column}, created_at, updated_at)
+        VALUES (:peer_id, :value, :now, :now)
+        ON CONFLICT(peer_id) DO UPDATE SET
+            {column} = MAX(COALESCE({column}, ''), excluded.{column}),
+            updated_at = excluded.updated_at
+        """
+        params = {"peer_id": peer_id, "value": value, "now": self.init_time()}
+        return super().insert(sql=sql, params=params)
+
+    def set_exported_until(self, peer_id: str, until: str) -> bool:
+        return self._set_watermark(peer_id, "exported_until", until)
+
+    def set_imported_until(self, peer_id: str, until: str) -> bool:
+        return self._set_watermark(peer_id, "imported_until", until)
+
+    def reset_peer(self, peer_id: str) -> bool:
+        """Forgets a peer's watermarks: the next delta for it is a full export."""
+        sql = f"DELETE FROM {SYNC_PEER_TABLE} WHERE peer_id = :peer_id"
+        return super().delete(sql=sql, params={"peer_id": peer_id})
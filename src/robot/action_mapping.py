@@ -1,4 +1,7 @@
 # src/robot/action_mapping.py
+from importlib import import_module
+from typing import Callable, Dict, Iterator, Mapping
+
 from src.my_constants import (
     SELL__BY_MARKETPLACE,
     SELL__BY_GROUP,
@@ -14,14 +17,35 @@ from src.my_constants import (
     GET_COOKIES
 )
 
-from src.robot.facebooks.launch import launch
-from src.robot.facebooks.get_cookies import get_cookies
-from src.robot.facebooks.join_groups import join_groups
-from src.robot.facebooks.add_friends import add_friends
-
-ACTION_MAPING = {
-    LAUNCH : launch,
-    GET_COOKIES: get_cookies,
-    TAKE_CARE__JOIN_GROUP: join_groups,
-    TAKE_CARE__ADD_FRIEND: add_friends,
-}
\ No newline at end of file
+
+class LazyActionMapping(Mapping):
+    """
+    Maps action names to "module:function" targets and imports the module
+    only the first time the action is looked up (action modules pull in playwright).
+    """
+
+    def __init__(self, targets: Dict[str, str]):
+        self._targets = targets
+        self._resolved: Dict[str, Callable] = {}
+
+    def __getitem__(self, action_name: str) -> Callable:
+        action = self._resolved.get(action_name)
+        if action is None:
+            module_name, _, func_name = self._targets[action_name].partition(":")
+            action = getattr(import_module(module_name), func_name)
+            self._resolved[action_name] = action
+        return action
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._targets)
+
+    def __len__(self) -> int:
+        return len(self._targets)
+
+
+ACTION_MAPING = LazyActionMapping({
+    LAUNCH : "src.robot.facebooks.launch:launch",
+    GET_COOKIES: "src.robot.facebooks.get_cookies:get_cookies",
+    TAKE_CARE__JOIN_GROUP: "src.robot.facebooks.join_groups:join_groups",
+    TAKE_CARE__ADD_FRIEND: "src.robot.facebooks.add_friends:add_friends",
+})
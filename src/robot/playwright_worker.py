@@ -1,10 +1,6 @@
 # src/robot/facebook_action_worker.py
 from typing import Optional, Dict, Any, Tuple
 from urllib.parse import urlparse, parse_qs
-from playwright.sync_api import (
-    sync_playwright
-)
-from undetected_playwright import Tarnished
 from PyQt6.QtCore import QRunnable
 
 from src.my_exceptions import MyException
@@ -69,6 +65,9 @@ class PlaywrightWorker(QRunnable):
                 raise e
     
     def handle_playwright(self) -> Tuple[bool, str]:
+        from playwright.sync_api import sync_playwright
+        from undetected_playwright import Tarnished
+
         with sync_playwright() as p:
             header = self.__init_header()
             context = p.chromium.launch_persistent_context(**header)
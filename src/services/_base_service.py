@@ -1,22 +1,362 @@
 # src/services/_base_service.py
-from fake_useragent import UserAgent
-from typing import List, Dict, Any, Tuple, Optional
-import json, csv
+from typing import Callable, Iterable, List, Dict, Any, Tuple, Optional
+import csv, gzip, os, time
 
 from src.utils.logger import Logger
+from src.utils.blob_store import BlobStore, StoredFile
+from src.utils.export_writers import EXPORT_FORMATS, write_export
+from src.utils.file_codecs import CodecUnavailableError, codec_for_path, open_binary_reader, open_text_writer
+from src.utils.import_readers import IMPORT_FORMATS, ImportFormatError, iter_chunks, iter_records
+from src.utils.image_handlers import (
+    ImageOutputProfile,
+    file_digest,
+    insert_logo_to_images,
+    remove_images,
+    scan_image_folder,
+)
 from src.repositories._repo_manager import Repository_Manager
+from src.my_types import ImageFile_Type, ImageFolder_Type, ImportResult_Type
+
+IMAGE_KIND_SOURCE = "source"
+IMAGE_KIND_LOGO = "logo"
+IMAGE_CONTAINER_DIR = "image_container_dir"
+# Blobs không có dòng IMAGE_BLOB chỉ bị GC xoá khi đủ cũ (có thể đang được tạo dở)
+ORPHAN_BLOB_MIN_AGE_S = 3600
+
+IMAGE_OUTPUT_FORMAT = "image_output_format"
+IMAGE_OUTPUT_QUALITY = "image_output_quality"
+IMAGE_OUTPUT_MAX_EDGE = "image_output_max_edge"
+IMAGE_OUTPUT_STRIP_METADATA = "image_output_strip_metadata"
+
+# Rows per committed transaction in a streaming import.
+IMPORT_CHUNK_SIZE = 1000
+# progress_callback(rows_imported, bytes_read, total_bytes)
+ImportProgressCallback = Callable[[int, int, int], None]
 
 
 class BaseService:
     def __init__(self, repo_manager: Repository_Manager):
         self.repo_manager = repo_manager
         self.logger = Logger(self.__class__.__name__)
+        self._image_stores: Dict[str, BlobStore] = {}
 
     def init_ua(self) -> Dict[str, str]:
+        from fake_useragent import UserAgent  # nạp dữ liệu UA khá chậm, chỉ import khi cần
+
         ua_desktop = UserAgent(os="Mac OS X")
         ua_mobile = UserAgent(os="iOS")
         return {"mobile": ua_mobile.random, "desktop": ua_desktop.random}
 
+    def image_output_profile(self) -> ImageOutputProfile:
+        """Encoding of watermarked product images, from the image_output_* settings."""
+        setting_repo = self.repo_manager.setting_repo
+        return ImageOutputProfile.from_values(
+            format=setting_repo.get_setting_value_by_name(IMAGE_OUTPUT_FORMAT),
+            quality=setting_repo.get_setting_value_by_name(IMAGE_OUTPUT_QUALITY),
+            max_edge=setting_repo.get_setting_value_by_name(IMAGE_OUTPUT_MAX_EDGE),
+            strip_metadata=setting_repo.get_setting_value_by_name(IMAGE_OUTPUT_STRIP_METADATA),
+        )
+
+    # ----------------------------------------------------------------------
+    # Product image folders (<container>/<id>/<id>_<kind>), indexed by the image manifest
+    # ----------------------------------------------------------------------
+
+    def product_image_dir(self, image_container: str, product_id: str, kind: str = IMAGE_KIND_LOGO) -> str:
+        return os.path.join(image_container, product_id, f"{product_id}_{kind}")
+
+    def image_store(self, image_container: str) -> BlobStore:
+        """The content-addressed store shared by all products of an image container."""
+        store = self._image_stores.get(image_container)
+        if store is None:
+            store = BlobStore.for_container(image_container)
+            self._image_stores[image_container] = store
+        return store
+
+    def store_product_images(
+        self,
+        image_container: str,
+        product_id: str,
+        image_paths: List[str],
+        logo_path: Optional[str],
+        opacity: float = 0.7,
+    ) -> bool:
+        """
+        Writes the `<id>_source` and watermarked `<id>_logo` folders of a product
+        and indexes them (see `write_product_images` / `index_product_images`).
+        """
+        stored = self.write_product_images(
+            image_container, product_id, image_paths, logo_path, self.image_output_profile(), opacity
+        )
+        return self.index_product_images(image_container, product_id, stored)
+
+    def write_product_images(
+        self,
+        image_container: str,
+        product_id: str,
+        image_paths: List[str],
+        logo_path: Optional[str],
+        output_profile: ImageOutputProfile,
+        opacity: float = 0.7,
+    ) -> List[StoredFile]:
+        """
+        File part of storing product images; touches no database, so it can run
+        on a worker thread.
+
+        Sources and watermarked outputs are stored once per content in the image
+        store and linked into the product folders, so photos reused across
+        listings take no extra space.
+        """
+        store = self.image_store(image_container)
+        source_dir = self.product_image_dir(image_container, product_id, IMAGE_KIND_SOURCE)
+        logo_dir = self.product_image_dir(image_container, product_id, IMAGE_KIND_LOGO)
+        os.makedirs(source_dir, exist_ok=True)
+        os.makedirs(logo_dir, exist_ok=True)
+
+        stored = store.import_files(image_paths, source_dir, product_id)
+        insert_logo_to_images(
+            image_paths,
+            logo_path,
+            logo_dir,
+            product_id,
+            opacity,
+            output_profile=output_profile,
+        )
+        stored += store.adopt_folder(logo_dir)
+        return stored
+
+    def index_product_images(self, image_container: str, product_id: str, stored: List[StoredFile]) -> bool:
+        """Database part: references the stored blobs and records the product folders in the manifest."""
+        return self.index_products_images(image_container, {product_id: stored})
+
+    def index_products_images(self, image_container: str, stored_by_product: Dict[str, List[StoredFile]]) -> bool:
+        """
+        Indexes the image folders of products right after they were written, in
+        one transaction: references the blobs of the new manifest and releases
+        the ones the folders were indexed with before. Indexing the same files
+        again (a retried or resumed job, a re-imported bundle) therefore leaves
+        the reference counts unchanged.
+        """
+        if not stored_by_product:
+            return True
+        folders = []
+        for product_id, stored in stored_by_product.items():
+            folders += self._scan_product_folders(image_container, product_id, stored)
+        previous = self.repo_manager.image_manifest_repo.get_folders_by_owners(list(stored_by_product))
+        indexed = {folder.folder for folder in folders}
+        # Thư mục từng được index nhưng không còn nữa: ghi lại là rỗng để không nhả tham chiếu lần nữa sau này
+        folders += [
+            ImageFolder_Type(folder.folder, folder.owner_id, folder.kind, None, [])
+            for folder in previous.values()
+            if folder.folder not in indexed
+        ]
+        blob_repo = self.repo_manager.image_blob_repo
+        manifest_repo = self.repo_manager.image_manifest_repo
+
+        def execute_index() -> Tuple[bool, Any]:
+            success = (
+                blob_repo.apply_add_refs(
+                    (file.hash, file.size) for folder in folders for file in folder.files if file.hash
+                )
+                and manifest_repo.apply_replace_folders(folders)
+                and blob_repo.apply_release_refs(
+                    file.hash for folder in previous.values() for file in folder.files if file.hash
+                )
+            )
+            return success, None
+
+        success, _ = blob_repo.execute_in_transaction(execute_index)
+        return success
+
+    def insert_with_image_job(self, product_repo, product_payload, product_table: str, image_paths: List[str]):
+        """
+        Inserts a product and its pending image job in one transaction, so a
+        product is never visible (e.g. to the robot) without its image state.
+        Returns the inserted product or False.
+        """
+        job_repo = self.repo_manager.image_job_repo
+
+        def execute_create() -> Tuple[bool, Any]:
+            new_product = product_repo.insert(product_payload)
+            if not new_product:
+                return False, None
+            return job_repo.add_job(str(new_product.id), product_table, list(image_paths or [])), new_product
+
+        success, new_product = product_repo.execute_in_transaction(execute_create)
+        return new_product if success else False
+
+    def remove_product_images(self, image_container: Optional[str], product_id: str) -> bool:
+        """
+        Drops the product's image job, releases its blob references and forgets
+        its manifest in one transaction, then deletes its image folder.
+        """
+        if not image_container:
+            self.repo_manager.image_job_repo.delete_job(product_id)
+            return False
+        indexed = self.repo_manager.image_manifest_repo.get_folders_by_owners([product_id])
+        hashes = [file.hash for folder in indexed.values() for file in folder.files if file.hash]
+        blob_repo = self.repo_manager.image_blob_repo
+
+        def execute_remove():
+            # Nhả ref và xóa manifest cùng lúc: nếu tách ra, lần index/xóa sau sẽ nhả ref lần nữa
+            success = (
+                self.repo_manager.image_job_repo.delete_job(product_id)
+                and blob_repo.apply_release_refs(hashes)
+                and self.repo_manager.image_manifest_repo.apply_delete_by_owner(product_id)
+            )
+            return success, None
+
+        success, _ = blob_repo.execute_in_transaction(execute_remove)
+        if not success:
+            self.logger.error(f"Could not release the images of product {product_id}; its folder is kept.")
+            return False
+        return remove_images(os.path.join(image_container, product_id))
+
+    def collect_image_garbage(
+        self,
+        image_container: Optional[str] = None,
+        dry_run: bool = False,
+        orphan_min_age_s: float = ORPHAN_BLOB_MIN_AGE_S,
+    ) -> Dict[str, int]:
+        """
+        Deletes blobs no product references any more: rows with ref_count 0 and
+        files without a row (older than `orphan_min_age_s`). Product folders
+        keep their own links, so collecting a blob never removes a product image.
+        """
+        image_container = image_container or self.repo_manager.setting_repo.get_setting_value_by_name(
+            IMAGE_CONTAINER_DIR
+        )
+        stats = {"blobs": 0, "unreferenced": 0, "orphans": 0, "bytes_reclaimed": 0}
+        if not image_container or not os.path.isdir(image_container):
+            self.logger.error(f"Image container directory not found: {image_container}.")
+            return stats
+        store = self.image_store(image_container)
+        blob_repo = self.repo_manager.image_blob_repo
+
+        unreferenced = [blob.hash for blob in blob_repo.get_unreferenced()]
+        known = set(blob_repo.get_all_hashes())
+        cutoff = time.time() - orphan_min_age_s
+        orphans = []
+        for digest, _, mtime in store.iter_blobs():
+            stats["blobs"] += 1
+            if digest not in known and mtime < cutoff:
+                orphans.append(digest)
+        stats["unreferenced"] = len(unreferenced)
+        stats["orphans"] = len(orphans)
+        if dry_run:
+            stats["bytes_reclaimed"] = sum(
+                os.path.getsize(store.blob_path(digest)) for digest in unreferenced + orphans if store.has(digest)
+            )
+            return stats
+
+        blob_repo.delete_unreferenced(unreferenced)
+        # Một blob có thể vừa được tham chiếu lại giữa hai truy vấn: giữ lại
+        still_known = set(blob_repo.get_all_hashes())
+        for digest in unreferenced + orphans:
+            if digest not in still_known:
+                stats["bytes_reclaimed"] += store.remove(digest)
+        store.remove_stale_tmp_files(orphan_min_age_s)
+        self.logger.info(
+            f"Image GC: {stats['unreferenced']} unreferenced and {stats['orphans']} orphan blob(s), "
+            f"{stats['bytes_reclaimed']} bytes reclaimed."
+        )
+        return stats
+
+    def _scan_product_folders(
+        self, image_container: str, product_id: str, stored: List[StoredFile]
+    ) -> List[ImageFolder_Type]:
+        """
+        Lists (with hashes) the image folders of a product; hashes already known
+        from `stored` are not recomputed.
+        """
+        known_hashes = {file.path: file.hash for file in stored}
+        folders = []
+        for kind in (IMAGE_KIND_SOURCE, IMAGE_KIND_LOGO):
+            folder = self.product_image_dir(image_container, product_id, kind)
+            scanned = scan_image_folder(folder)
+            if scanned is None:
+                continue
+            mtime_ns, entries = scanned
+            entries = [
+                (name, size, known_hashes.get(os.path.join(folder, name)) or file_digest(os.path.join(folder, name)))
+                for name, size, _ in entries
+            ]
+            folders.append(self._folder_from_scan(folder, product_id, kind, (mtime_ns, entries)))
+        return folders
+
+    def get_product_images(
+        self, image_container: Optional[str], product_id: str, kind: str = IMAGE_KIND_LOGO
+    ) -> List[str]:
+        """Image paths of one product, from the manifest if the folder is unchanged."""
+        if not image_container:
+            return []
+        folder = self.product_image_dir(image_container, product_id, kind)
+        indexed = self.repo_manager.image_manifest_repo.get_folder(folder)
+        stale: List[ImageFolder_Type] = []
+        paths = self._resolve_image_folder(folder, product_id, kind, indexed, stale)
+        self.repo_manager.image_manifest_repo.replace_folders(stale)
+        return paths
+
+    def get_products_images(
+        self, image_container: Optional[str], product_ids: List[str], kind: str = IMAGE_KIND_LOGO
+    ) -> Dict[str, List[str]]:
+        """
+        Image paths of many products: one manifest query plus one stat() per folder.
+        Folders whose mtime changed (or that were never indexed) are rescanned and re-indexed.
+        """
+        if not image_container:
+            return {product_id: [] for product_id in product_ids}
+        indexed_folders = self.repo_manager.image_manifest_repo.get_folders_by_kind(kind)
+        stale: List[ImageFolder_Type] = []
+        results = {}
+        for product_id in product_ids:
+            folder = self.product_image_dir(image_container, product_id, kind)
+            results[product_id] = self._resolve_image_folder(
+                folder, product_id, kind, indexed_folders.get(folder), stale
+            )
+        if stale:
+            self.repo_manager.image_manifest_repo.replace_folders(stale)
+            self.logger.info(f"Re-indexed {len(stale)} image folder(s).")
+        return results
+
+    def _resolve_image_folder(
+        self,
+        folder: str,
+        owner_id: str,
+        kind: str,
+        indexed: Optional[ImageFolder_Type],
+        stale: List[ImageFolder_Type],
+    ) -> List[str]:
+        try:
+            mtime_ns = os.stat(folder).st_mtime_ns
+        except OSError:
+            return []
+        if indexed is None or indexed.mtime_ns != mtime_ns:
+            scanned = scan_image_folder(folder)
+            if scanned is None:
+                return []
+            if indexed is not None:
+                # Giữ hash của các file không đổi (cùng tên, cùng size) để còn đếm tham chiếu blob
+                previous = {file.file_name: file for file in indexed.files}
+                mtime_ns, entries = scanned
+                scanned = mtime_ns, [
+                    (name, size, previous[name].hash if name in previous and previous[name].size == size else None)
+                    for name, size, _ in entries
+                ]
+            indexed = self._folder_from_scan(folder, owner_id, kind, scanned)
+            stale.append(indexed)
+        return [os.path.join(folder, file.file_name) for file in indexed.files]
+
+    @staticmethod
+    def _folder_from_scan(folder: str, owner_id: str, kind: str, scanned) -> ImageFolder_Type:
+        mtime_ns, entries = scanned
+        return ImageFolder_Type(
+            folder=folder,
+            owner_id=owner_id,
+            kind=kind,
+            mtime_ns=mtime_ns,
+            files=[ImageFile_Type(folder, name, size, file_hash) for name, size, file_hash in entries],
+        )
+
     # ----------------------------------------------------------------------
     # NEW: Export/Import Methods with CSV Support
     # ----------------------------------------------------------------------
@@ -28,109 +368,115 @@ class BaseService:
         data_format: str = "json",
     ) -> bool:
         """
-        Exports a list of dictionary data to a specified file path and format (JSON or CSV).
+        Exports a list of dictionary data to a specified file path and format (JSON, JSON Lines or CSV).
+        Prefer `export_stream` for whole tables.
         """
         if not data_to_export:
             self.logger.warning("Attempted to export data but the data list is empty.")
             return False
+        return self.export_stream(file_path, [data_to_export], data_format) > 0
 
-        data_format = data_format.lower()
+    def export_stream(
+        self,
+        file_path: str,
+        batches: Iterable[List[Dict[str, Any]]],
+        data_format: str = "jsonl",
+    ) -> int:
+        """
+        Streams batches of dictionary rows to a file (CSV, JSON Lines or a JSON array),
+        compressed if the file name ends in .gz or .zst.
 
-        if data_format == "json":
-            try:
-                with open(file_path, "w", encoding="utf-8") as f:
-                    json.dump(data_to_export, f, ensure_ascii=False, indent=4)
-                self.logger.info(f"Data successfully exported to {file_path} as JSON.")
-                return True
-            except Exception as e:
-                self.logger.error(f"Error exporting data to JSON: {e}")
-                return False
-
-        elif data_format == "csv":
-            try:
-                # Lấy headers (tên cột) từ khóa của bản ghi đầu tiên
-                headers = list(data_to_export[0].keys())
-
-                with open(file_path, "w", newline="", encoding="utf-8") as f:
-                    writer = csv.DictWriter(f, fieldnames=headers)
-                    writer.writeheader()
-                    writer.writerows(data_to_export)
-
-                self.logger.info(f"Data successfully exported to {file_path} as CSV.")
-                return True
-            except Exception as e:
-                self.logger.error(f"Error exporting data to CSV: {e}")
-                return False
-
-        else:
+        Memory use is bounded by one batch. The file is written next to its
+        destination and renamed into place only once complete, so a failed
+        export never leaves a truncated file. Nothing is written for an empty
+        export.
+
+        Returns:
+            The number of rows written, or -1 on failure.
+        """
+        data_format = data_format.lower()
+        if data_format not in EXPORT_FORMATS:
             self.logger.error(
-                f"Unsupported export format: {data_format}. Only 'json' and 'csv' are supported in BaseService."
+                f"Unsupported export format: {data_format}. Supported formats are {', '.join(EXPORT_FORMATS)}."
             )
-            return False
+            return -1
+
+        tmp_path = f"{file_path}.{os.getpid()}.tmp"
+        try:
+            # Nén trực tiếp khi ghi (theo đuôi file: .gz / .zst), không qua bản tạm chưa nén
+            with open_text_writer(tmp_path, codec_for_path(file_path)) as f:
+                rows_written = write_export(f, batches, data_format)
+            if rows_written:
+                os.replace(tmp_path, file_path)
+                self.logger.info(f"{rows_written} row(s) exported to {file_path} as {data_format.upper()}.")
+            else:
+                self.logger.warning("Attempted to export data but there are no rows.")
+            return rows_written
+        except Exception as e:
+            self.logger.error(f"Error exporting data to {data_format.upper()}: {e}")
+            return -1
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
 
-    def import_data(
+    def import_stream(
         self,
         file_path: str,
-        data_format: str = "json",
-    ) -> Optional[List[Dict[str, Any]]]:
+        data_format: str = "jsonl",
+        chunk_size: int = IMPORT_CHUNK_SIZE,
+        progress_callback: Optional[ImportProgressCallback] = None,
+        is_cancelled: Optional[Callable[[], bool]] = None,
+    ) -> ImportResult_Type:
         """
-        Imports data from a specified file path and format (JSON or CSV).
+        Imports a file chunk by chunk (decompressing .gz / .zst files on the
+        fly): records are parsed incrementally,
+        converted with `_dict_to_data_type` and inserted with `create_bulk`,
+        one committed transaction per chunk.
+
+        Memory use is bounded by one chunk. Rows that cannot be converted are
+        skipped and counted; a chunk whose insert fails is rolled back and
+        counted, and the import goes on. Cancelling stops before the next
+        chunk: chunks already committed stay in the database.
         """
+        result = ImportResult_Type()
         data_format = data_format.lower()
-
-        if data_format == "json":
-            try:
-                with open(file_path, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-
-                if isinstance(data, list):
-                    self.logger.info(
-                        f"Data successfully imported from {file_path} as JSON."
-                    )
-                    return data
-                else:
-                    self.logger.error(
-                        "Imported JSON file does not contain a list of records."
-                    )
-                    return None
-            except FileNotFoundError:
-                self.logger.error(f"Import failed: File not found at {file_path}")
-                return None
-            except json.JSONDecodeError as e:
-                self.logger.error(
-                    f"Import failed: Invalid JSON format in file {file_path}: {e}"
-                )
-                return None
-            except Exception as e:
-                self.logger.error(f"Error importing data from JSON: {e}")
-                return None
-
-        elif data_format == "csv":
-            try:
-                data = []
-                with open(file_path, "r", newline="", encoding="utf-8") as f:
-                    reader = csv.DictReader(f)
-                    for row in reader:
-                        data.append(dict(row))
-
-                if data:
-                    self.logger.info(
-                        f"Data successfully imported from {file_path} as CSV."
-                    )
-                    return data
-                else:
-                    self.logger.warning(f"Imported CSV file is empty: {file_path}")
-                    return []
-
-            except FileNotFoundError:
-                self.logger.error(f"Import failed: File not found at {file_path}")
-                return None
-            except Exception as e:
-                self.logger.error(f"Error importing data from CSV: {e}")
-                return None
-
-        else:
-            self.logger.error(
-                f"Unsupported import format: {data_format}. Only 'json' and 'csv' are supported in BaseService."
-            )
-            return None
+        if data_format not in IMPORT_FORMATS:
+            result.error = f"Unsupported import format: {data_format}. Supported formats are {', '.join(IMPORT_FORMATS)}."
+            self.logger.error(result.error)
+            return result
+        try:
+            total_bytes = os.path.getsize(file_path)
+            with open_binary_reader(file_path) as (stream, raw):
+                records = iter_records(stream, data_format)
+                for chunk in iter_chunks(records, chunk_size):
+                    if is_cancelled and is_cancelled():
+                        result.cancelled = True
+                        break
+                    payload = []
+                    for record in chunk:
+                        try:
+                            payload.append(self._dict_to_data_type(record))
+                        except (TypeError, ValueError) as e:
+                            result.rows_invalid += 1
+                            self.logger.warning(f"Skipping invalid record: {e}")
+                    if self.create_bulk(payload):
+                        result.rows_imported += len(payload)
+                    else:
+                        result.rows_failed += len(payload)
+                    if progress_callback:
+                        progress_callback(result.rows_imported, raw.tell(), total_bytes)
+        except FileNotFoundError:
+            result.error = f"Import failed: File not found at {file_path}"
+        except CodecUnavailableError as e:
+            result.error = f"Import failed: {e}"
+        except (ImportFormatError, UnicodeDecodeError, csv.Error, EOFError, gzip.BadGzipFile) as e:
+            result.error = f"Import failed: {file_path} is not valid {data_format.upper()}: {e}"
+        except Exception as e:
+            result.error = f"Error importing data from {data_format.upper()}: {e}"
+        if result.error:
+            self.logger.error(result.error)
+        self.logger.info(
+            f"Import of {file_path} {'cancelled' if result.cancelled else 'finished'}: "
+            f"{result.rows_imported} imported, {result.rows_invalid} invalid, {result.rows_failed} failed."
+        )
+        return result
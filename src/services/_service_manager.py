@@ -6,6 +6,10 @@ from src.services.profile_service import Profile_Service
 from src.services.property_product_service import PropertyProduct_Service
 from src.services.property_template_service import PropertyTemplate_Service
 from src.services.setting_service import Setting_Service
+from src.services.image_job_service import ImageJob_Service
+from src.services.sync_service import Sync_Service
+from src.services.backup_service import Backup_Service
+from src.services.bundle_service import Bundle_Service
 
 
 class Service_Manager:
@@ -21,4 +25,8 @@ class Service_Manager:
         self.profile_service = Profile_Service(repo_manager)
         self.property_product_service = PropertyProduct_Service(repo_manager)
         self.property_template_service = PropertyTemplate_Service(repo_manager)
-        self.setting_service = Setting_Service(repo_manager)
\ No newline at end of file
+        self.setting_service = Setting_Service(repo_manager)
+        self.image_job_service = ImageJob_Service(repo_manager)
+        self.sync_service = Sync_Service(repo_manager)
+        self.backup_service = Backup_Service(repo_manager)
+        self.bundle_service = Bundle_Service(repo_manager)
\ No newline at end of file
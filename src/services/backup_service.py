@@ -0,0 +1,132 @@
+# src/services/backup_service.py
+
+import os
+import sqlite3
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional
+
+from src.my_constants import BACKUP_DIR, BACKUP_INTERVAL_HOURS, BACKUP_KEEP
+from src.my_types import BackupResult_Type
+from src.services._base_service import BaseService, IMAGE_CONTAINER_DIR
+from src.services.profile_service import PROFILE_CONTAINER_DIR
+from src.utils.db_backup import (
+    BackupCancelled,
+    BackupProgressCallback,
+    backup_database,
+    list_snapshots,
+    manifest_path_for,
+    restore_database,
+    rotate_snapshots,
+    snapshot_name,
+    write_folder_manifest,
+)
+
+
+@dataclass
+class PreparedBackup:
+    """Everything a snapshot needs, resolved on the thread owning the connection."""
+    db_path: str
+    backup_dir: str
+    keep: int
+    # {label: directory} listed in the snapshot's manifest; empty for no manifest
+    folders: Dict[str, str]
+
+
+class Backup_Service(BaseService):
+    """
+    Rotating online snapshots of the database (see src/utils/db_backup.py).
+
+    `prepare` reads the settings and must run on the thread owning the
+    connection; `create_snapshot` touches no QtSql connection and may run on
+    a worker thread.
+    """
+
+    def prepare(self, include_manifest: bool = True, backup_dir: str = BACKUP_DIR, keep: int = BACKUP_KEEP) -> PreparedBackup:
+        folders = {}
+        if include_manifest:
+            setting_repo = self.repo_manager.setting_repo
+            for label, setting_name in (("images", IMAGE_CONTAINER_DIR), ("profiles", PROFILE_CONTAINER_DIR)):
+                folder = setting_repo.get_setting_value_by_name(setting_name)
+                if folder and os.path.isdir(folder):
+                    folders[label] = folder
+        db_path = self.repo_manager.setting_repo.db.databaseName()
+        return PreparedBackup(db_path=db_path, backup_dir=backup_dir, keep=keep, folders=folders)
+
+    def get_snapshots(self, backup_dir: str = BACKUP_DIR) -> List[str]:
+        return list_snapshots(backup_dir)
+
+    def is_backup_due(self, backup_dir: str = BACKUP_DIR, interval_hours: float = BACKUP_INTERVAL_HOURS) -> bool:
+        snapshots = list_snapshots(backup_dir)
+        if not snapshots:
+            return True
+        return time.time() - os.path.getmtime(snapshots[-1]) >= interval_hours * 3600
+
+    def create_snapshot(
+        self,
+        prepared: PreparedBackup,
+        progress_callback: Optional[BackupProgressCallback] = None,
+        is_cancelled: Optional[Callable[[], bool]] = None,
+    ) -> BackupResult_Type:
+        """
+        Takes a snapshot of the live database without stopping writers, lists
+        the image/profile folders next to it if asked, then deletes the
+        snapshots beyond `prepared.keep`.
+        """
+        result = BackupResult_Type()
+        os.makedirs(prepared.backup_dir, exist_ok=True)
+        snapshot_path = os.path.join(prepared.backup_dir, snapshot_name())
+        started = time.perf_counter()
+        try:
+            result.pages, result.restarts = backup_database(
+                prepared.db_path,
+                snapshot_path,
+                progress_callback=progress_callback,
+                is_cancelled=is_cancelled,
+            )
+            result.snapshot_path = snapshot_path
+        except BackupCancelled:
+            result.cancelled = True
+            self.logger.info("Backup cancelled.")
+            return result
+        except (sqlite3.Error, OSError, RuntimeError) as e:
+            result.error = f"Backup of {prepared.db_path} failed: {e}"
+            self.logger.error(result.error)
+            return result
+
+        if prepared.folders:
+            manifest_path = manifest_path_for(snapshot_path)
+            try:
+                result.manifest_files = write_folder_manifest(manifest_path, prepared.folders)
+                result.manifest_path = manifest_path
+            except OSError as e:
+                # Snapshot CSDL vẫn dùng được dù không có manifest
+                self.logger.warning(f"Could not write the folder manifest of {snapshot_path}: {e}")
+
+        if prepared.keep > 0:
+            result.removed = rotate_snapshots(prepared.backup_dir, prepared.keep)
+        self.logger.info(
+            f"Snapshot {snapshot_path} written in {time.perf_counter() - started:.1f}s "
+            f"({result.pages} pages, {result.restarts} restart(s), {result.manifest_files} file(s) in manifest, "
+            f"{len(result.removed)} old snapshot(s) removed)."
+        )
+        return result
+
+    def restore_snapshot(self, snapshot_path: str, prepared: PreparedBackup) -> BackupResult_Type:
+        """
+        Replaces the database with `snapshot_path`, after saving the current
+        database as a new snapshot (no rotation, so nothing is deleted). Run
+        it only while the application is closed.
+        """
+        safety = self.create_snapshot(PreparedBackup(prepared.db_path, prepared.backup_dir, keep=0, folders={}))
+        if not safety.ok:
+            safety.error = f"Restore aborted, the current database could not be backed up first: {safety.error}"
+            return safety
+        try:
+            restore_database(snapshot_path, prepared.db_path)
+        except (sqlite3.Error, OSError, RuntimeError) as e:
+            safety.error = f"Restore of {snapshot_path} failed: {e}"
+            self.logger.error(safety.error)
+            return safety
+        self.logger.info(f"Database restored from {snapshot_path} (previous state saved as {safety.snapshot_path}).")
+        return safety
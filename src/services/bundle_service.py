@@ -0,0 +1,473 @@
+# src/services/bundle_service.py
+"""
+Product bundles: the rows of a product table together with their `<id>_source`
+and `<id>_logo` images, in one zip or tar archive.
+
+Entries, in the order they are written and read back:
+
+    bundle.json           {"format": "my-manager-bundle", "version": 1, "table": ..., "source": ..., "created_at": ...}
+    rows/000000.jsonl.gz  one {"data": {...row...}, "images": {"source": [{"name", "hash", "size"}], "logo": [...]}} per line
+    blobs/<sha256>        the image files first referenced by the rows entry above, once per content
+    rows/000001.jsonl.gz
+    blobs/...
+    end.json              {"rows": <n>, "blobs": <n>}
+
+An image shared by several products (or kinds) is written once. On import,
+images already in the local blob store are skipped without being read, the
+others are verified and written by a small thread pool while the archive keeps
+being read, and rows are applied last-writer-wins like the delta sync, so
+re-importing a bundle only redoes what is missing.
+"""
+import gzip
+import json
+import os
+import re
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+from src.my_types import BundleResult_Type, ImageFolder_Type
+from src.services._base_service import (
+    BaseService,
+    IMAGE_CONTAINER_DIR,
+    IMAGE_KIND_LOGO,
+    IMAGE_KIND_SOURCE,
+    ImportProgressCallback,
+)
+from src.services.sync_service import PRODUCT_TABLES, local_peer_id
+from src.utils.blob_store import BlobStore, StoredFile
+from src.utils.bundle_archive import (
+    BundleFormatError,
+    BundleReader,
+    bundle_format,
+    open_bundle_reader,
+    open_bundle_writer,
+)
+from src.utils.file_codecs import GZIP_LEVEL
+from src.utils.image_handlers import IMAGE_EXTENSIONS, remove_images, scan_image_folder
+
+BUNDLE_FORMAT = "my-manager-bundle"
+BUNDLE_VERSION = 1
+BUNDLE_HEADER_ENTRY = "bundle.json"
+BUNDLE_END_ENTRY = "end.json"
+BUNDLE_ROWS_PREFIX = "rows/"
+BUNDLE_BLOBS_PREFIX = "blobs/"
+# Số sản phẩm mỗi entry rows/: cũng là số dòng mỗi transaction khi import
+BUNDLE_BATCH_SIZE = 500
+# Luồng ghi ảnh khi import; ảnh đang chờ ghi được giới hạn để bộ nhớ không tăng theo archive
+BUNDLE_EXTRACT_WORKERS = min(4, os.cpu_count() or 1)
+BUNDLE_MAX_PENDING_BLOBS = 4 * BUNDLE_EXTRACT_WORKERS
+IMAGE_KINDS = (IMAGE_KIND_SOURCE, IMAGE_KIND_LOGO)
+
+_HASH_PATTERN = re.compile(r"^[0-9a-f]{64}$")
+
+# progress_callback(rows_written, bytes_written)
+ExportProgressCallback = Callable[[int, int], None]
+
+
+def _json_bytes(record: Any) -> bytes:
+    return json.dumps(record, ensure_ascii=False).encode("utf-8")
+
+
+def _is_safe_name(name: Any) -> bool:
+    """A plain file/folder name from the archive (no path separators, no `..`)."""
+    return (
+        isinstance(name, str)
+        and name not in ("", ".", "..")
+        and os.path.basename(name) == name
+        and "/" not in name
+        and "\\" not in name
+    )
+
+
+class Bundle_Service(BaseService):
+
+    # --- Export ---
+
+    def _bundle_images(
+        self, image_container: Optional[str], product_id: str, indexed: Dict[str, ImageFolder_Type]
+    ) -> Tuple[Dict[str, List[Dict[str, Any]]], Dict[str, str]]:
+        """
+        Lists the images of a product with their hashes (from the manifest when
+        the folder is unchanged, otherwise by reading the files). Returns the
+        record's "images" value and {hash: file to copy into the archive}.
+        """
+        images: Dict[str, List[Dict[str, Any]]] = {kind: [] for kind in IMAGE_KINDS}
+        files: Dict[str, str] = {}
+        if not image_container:
+            return images, files
+        for kind in IMAGE_KINDS:
+            folder = self.product_image_dir(image_container, product_id, kind)
+            try:
+                mtime_ns = os.stat(folder).st_mtime_ns
+            except OSError:
+                continue
+            known = indexed.get(folder)
+            if known is not None and known.mtime_ns == mtime_ns and all(file.hash for file in known.files):
+                entries = [(file.file_name, file.size, file.hash) for file in known.files]
+            else:
+                scanned = scan_image_folder(folder, with_hash=True)
+                entries = scanned[1] if scanned else []
+            for name, size, file_hash in entries:
+                images[kind].append({"name": name, "hash": file_hash, "size": size})
+                files[file_hash] = os.path.join(folder, name)
+        return images, files
+
+    def export_bundle(
+        self,
+        file_path: str,
+        table_key: str,
+        product_ids: Optional[List[str]] = None,
+        batch_size: int = BUNDLE_BATCH_SIZE,
+        progress_callback: Optional[ExportProgressCallback] = None,
+    ) -> BundleResult_Type:
+        """
+        Writes the products of `table_key` (all, or only `product_ids`) and their
+        images to a .zip or .tar bundle. Rows are read in batches and images are
+        copied file by file, so memory use does not grow with the bundle; like
+        the table exports, the file is renamed into place only once complete.
+        """
+        result = BundleResult_Type()
+        if table_key not in PRODUCT_TABLES:
+            result.error = f"Bundle export failed: {table_key} is not a product table."
+            return result
+        image_container = self.repo_manager.setting_repo.get_setting_value_by_name(IMAGE_CONTAINER_DIR)
+        if not image_container:
+            self.logger.warning("No image container set: the bundle will hold rows only.")
+        store = self.image_store(image_container) if image_container else None
+        wanted = set(product_ids) if product_ids is not None else None
+        written: Set[str] = set()
+        header = {
+            "format": BUNDLE_FORMAT,
+            "version": BUNDLE_VERSION,
+            "table": table_key,
+            "source": local_peer_id(),
+            "created_at": self.repo_manager.sync_repo.init_time(),
+        }
+
+        tmp_path = f"{file_path}.{os.getpid()}.tmp"
+        try:
+            with open_bundle_writer(tmp_path, bundle_format(file_path)) as writer:
+                writer.add_bytes(BUNDLE_HEADER_ENTRY, _json_bytes(header))
+                batch_index = 0
+                for batch in self.repo_manager.sync_repo.iter_changed_rows(table_key, None, batch_size):
+                    if wanted is not None:
+                        batch = [row for row in batch if row.get("id") in wanted]
+                        if not batch:
+                            continue
+                    indexed = self.repo_manager.image_manifest_repo.get_folders_by_owners(
+                        [str(row["id"]) for row in batch]
+                    )
+                    lines = []
+                    batch_files: Dict[str, str] = {}
+                    for row in batch:
+                        images, files = self._bundle_images(image_container, str(row["id"]), indexed)
+                        lines.append(_json_bytes({"data": row, "images": images}))
+                        for file_hash, path in files.items():
+                            if file_hash not in written:
+                                batch_files[file_hash] = path
+                    writer.add_bytes(
+                        f"{BUNDLE_ROWS_PREFIX}{batch_index:06d}.jsonl.gz",
+                        gzip.compress(b"\n".join(lines) + b"\n", compresslevel=GZIP_LEVEL, mtime=0),
+                    )
+                    batch_index += 1
+                    result.rows += len(batch)
+
+                    for file_hash, path in batch_files.items():
+                        # Ưu tiên bản trong blob store: nội dung chắc chắn khớp hash
+                        if store is not None and store.has(file_hash):
+                            path = store.blob_path(file_hash)
+                        try:
+                            writer.add_file(f"{BUNDLE_BLOBS_PREFIX}{file_hash}", path)
+                        except FileNotFoundError:
+                            result.images_missing += 1
+                            self.logger.warning(f"Image {path} disappeared during the export.")
+                            continue
+                        written.add(file_hash)
+                        result.blobs_written += 1
+                        result.bytes_written += os.path.getsize(path)
+                    if progress_callback:
+                        progress_callback(result.rows, result.bytes_written)
+                writer.add_bytes(BUNDLE_END_ENTRY, _json_bytes({"rows": result.rows, "blobs": result.blobs_written}))
+            os.replace(tmp_path, file_path)
+        except Exception as e:
+            result.error = f"Bundle export to {file_path} failed: {e}"
+            self.logger.error(result.error)
+            return result
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+        self.logger.info(
+            f"Bundle of {table_key} exported to {file_path}: {result.rows} row(s), "
+            f"{result.blobs_written} image(s), {result.bytes_written} bytes of images."
+        )
+        return result
+
+    # --- Import ---
+
+    @staticmethod
+    def _read_header(reader: BundleReader) -> Tuple[Dict[str, Any], Any]:
+        entries = iter(reader)
+        entry = next(entries, None)
+        if entry is None or entry.name != BUNDLE_HEADER_ENTRY:
+            raise BundleFormatError("Not a bundle (no bundle.json first).")
+        header = json.loads(entry.read())
+        if header.get("format") != BUNDLE_FORMAT:
+            raise BundleFormatError("Not a bundle.")
+        if header.get("version") != BUNDLE_VERSION:
+            raise BundleFormatError(f"Unsupported bundle version: {header.get('version')}.")
+        if header.get("table") not in PRODUCT_TABLES:
+            raise BundleFormatError(f"Unsupported bundle table: {header.get('table')}.")
+        return header, entries
+
+    def _materialize_images(
+        self, store: BlobStore, image_container: str, product_id: str, images: Dict[str, List[Dict[str, Any]]]
+    ) -> List[StoredFile]:
+        """
+        File part of restoring one product's images (no database): links the
+        listed blobs into its folders and removes images it no longer lists.
+        """
+        stored = []
+        for kind in IMAGE_KINDS:
+            folder = self.product_image_dir(image_container, product_id, kind)
+            files = images.get(kind) or []
+            if files:
+                os.makedirs(folder, exist_ok=True)
+            elif not os.path.isdir(folder):
+                continue
+            names = {file["name"] for file in files}
+            for name in os.listdir(folder):
+                path = os.path.join(folder, name)
+                if name not in names and name.lower().endswith(IMAGE_EXTENSIONS) and os.path.isfile(path):
+                    os.remove(path)
+            for file in files:
+                path = os.path.join(folder, file["name"])
+                store.link(file["hash"], path)
+                stored.append(StoredFile(path, file["hash"], file.get("size") or os.path.getsize(path)))
+            if not files and not os.listdir(folder):
+                os.rmdir(folder)
+        return stored
+
+    def _apply_batch(
+        self,
+        table_key: str,
+        records: List[Dict[str, Any]],
+        image_container: Optional[str],
+        pool: ThreadPoolExecutor,
+        result: BundleResult_Type,
+    ):
+        """
+        Applies one rows entry once the blobs it references are stored: restores
+        the images of the products whose local version is not newer, upserts the
+        rows in one transaction, then indexes the images of the rows now present.
+        Rows deleted here after their bundle version are left deleted and counted
+        in `rows_deleted`.
+        """
+        sync_repo = self.repo_manager.sync_repo
+        rows = []
+        for record in records:
+            data = record.get("data") if isinstance(record, dict) else None
+            if not isinstance(data, dict) or not _is_safe_name(data.get("id")) or not data.get("updated_at"):
+                result.rows_invalid += 1
+                continue
+            rows.append(record)
+        if not rows:
+            return
+        # Như delta sync, xóa ở máy này sau phiên bản trong bundle thì thắng: báo lại thay vì bỏ qua trong im lặng
+        tombstones = sync_repo.get_tombstones(table_key, [record["data"]["id"] for record in rows])
+        deleted = [
+            record["data"]["id"] for record in rows
+            if tombstones.get(record["data"]["id"], "") > record["data"]["updated_at"]
+        ]
+        if deleted:
+            result.rows_deleted += len(deleted)
+            self.logger.warning(
+                f"{len(deleted)} product(s) of the bundle were deleted on this machine after they were exported "
+                f"and were not imported: {', '.join(deleted[:10])}{' ...' if len(deleted) > 10 else ''}"
+            )
+            deleted_ids = set(deleted)
+            rows = [record for record in rows if record["data"]["id"] not in deleted_ids]
+            if not rows:
+                return
+        product_ids = [record["data"]["id"] for record in rows]
+
+        # Ảnh được khôi phục trước khi ghi dòng: sản phẩm mới không bao giờ hiện ra thiếu ảnh.
+        # Cùng updated_at (import lại sau khi bị ngắt) thì làm lại, vì link lại là vô hại.
+        local = sync_repo.get_updated_at(table_key, product_ids)
+        restored: Dict[str, List[StoredFile]] = {}
+        if image_container:
+            store = self.image_store(image_container)
+            futures: Dict[str, Future] = {}
+            for record in rows:
+                product_id = record["data"]["id"]
+                local_updated_at = local.get(product_id)
+                if local_updated_at is not None and local_updated_at > record["data"]["updated_at"]:
+                    continue
+                images = record.get("images") or {}
+                files = [file for kind in IMAGE_KINDS for file in images.get(kind) or []]
+                if not files and not os.path.isdir(os.path.join(image_container, product_id)):
+                    continue
+                if not all(
+                    isinstance(file, dict) and _is_safe_name(file.get("name")) and store.has(str(file.get("hash")))
+                    for file in files
+                ):
+                    result.images_missing += 1
+                    continue
+                futures[product_id] = pool.submit(self._materialize_images, store, image_container, product_id, images)
+            for product_id, future in futures.items():
+                try:
+                    restored[product_id] = future.result()
+                except OSError as e:
+                    result.images_missing += 1
+                    self.logger.error(f"Could not restore the images of {product_id}: {e}")
+
+        counts = {"imported": 0, "skipped": 0}
+
+        def execute_apply():
+            queries = {}
+            for record in rows:
+                changed = sync_repo.upsert_row(queries, table_key, record["data"])
+                if changed is None:
+                    return False, None
+                counts["imported" if changed else "skipped"] += 1
+            return True, None
+
+        success, _ = sync_repo.execute_in_transaction(execute_apply)
+        if success:
+            result.rows += counts["imported"]
+            result.rows_skipped += counts["skipped"]
+        else:
+            result.rows_failed += len(rows)
+
+        if restored:
+            present = sync_repo.get_updated_at(table_key, list(restored))
+            updated_at = {record["data"]["id"]: record["data"]["updated_at"] for record in rows}
+            for product_id in list(restored):
+                if product_id not in present:
+                    # Dòng không được ghi (lỗi, hoặc đã bị xóa ở máy này sau đó): bỏ ảnh vừa tạo
+                    remove_images(os.path.join(image_container, product_id))
+                    del restored[product_id]
+                elif present[product_id] != updated_at[product_id]:
+                    del restored[product_id]
+            if not self.index_products_images(image_container, restored):
+                result.images_missing += len(restored)
+                self.logger.error(f"Could not index the images of {len(restored)} imported product(s).")
+                return
+            job_repo = self.repo_manager.image_job_repo
+            job_repo.execute_in_transaction(
+                lambda: (all(job_repo.delete_job(product_id) for product_id in restored), None)
+            )
+
+    def import_bundle(
+        self,
+        file_path: str,
+        workers: int = BUNDLE_EXTRACT_WORKERS,
+        progress_callback: Optional[ImportProgressCallback] = None,
+        is_cancelled: Optional[Callable[[], bool]] = None,
+    ) -> BundleResult_Type:
+        """
+        Imports a bundle in one pass over the archive. Images whose hash is
+        already in the local store are skipped; the others are checked against
+        their hash and written by `workers` threads. Each rows entry is applied
+        (one transaction) once its images are stored. Database work stays on
+        the calling thread.
+        """
+        result = BundleResult_Type()
+        image_container = self.repo_manager.setting_repo.get_setting_value_by_name(IMAGE_CONTAINER_DIR)
+        store = self.image_store(image_container) if image_container else None
+        pending_blobs: List[Future] = []
+        records: Optional[List[Dict[str, Any]]] = None
+        rows_read = 0
+        blobs_read = 0
+        trailer = None
+
+        def wait_blobs(limit: int):
+            while len(pending_blobs) > limit:
+                future = pending_blobs.pop(0)
+                try:
+                    _, size = future.result()
+                    result.blobs_written += 1
+                    result.bytes_written += size
+                except ValueError as e:
+                    result.blobs_invalid += 1
+                    self.logger.error(f"Bundle image rejected: {e}")
+                except OSError as e:
+                    result.blobs_failed += 1
+                    self.logger.error(f"Bundle image could not be written: {e}")
+
+        def flush():
+            nonlocal records
+            if records is not None:
+                wait_blobs(0)
+                self._apply_batch(header["table"], records, image_container, pool, result)
+                records = None
+
+        pool = ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="bundle")
+        try:
+            total_bytes = os.path.getsize(file_path)
+            with open_bundle_reader(file_path) as reader:
+                header, entries = self._read_header(reader)
+                for entry in entries:
+                    if entry.name.startswith(BUNDLE_ROWS_PREFIX):
+                        flush()
+                        if is_cancelled and is_cancelled():
+                            result.cancelled = True
+                            break
+                        if progress_callback:
+                            progress_callback(result.rows, reader.position(), total_bytes)
+                        records = []
+                        data = entry.read()
+                        if entry.name.endswith(".gz"):
+                            data = gzip.decompress(data)
+                        for line in data.splitlines():
+                            if line.strip():
+                                records.append(json.loads(line))
+                        rows_read += len(records)
+                    elif entry.name.startswith(BUNDLE_BLOBS_PREFIX):
+                        blobs_read += 1
+                        digest = entry.name[len(BUNDLE_BLOBS_PREFIX):]
+                        if not _HASH_PATTERN.match(digest):
+                            result.blobs_invalid += 1
+                        elif store is None or store.has(digest):
+                            # Đã có sẵn (hoặc không có nơi chứa ảnh): không đọc dữ liệu của entry
+                            result.blobs_skipped += 1
+                        else:
+                            wait_blobs(BUNDLE_MAX_PENDING_BLOBS)
+                            pending_blobs.append(pool.submit(store.put_bytes, entry.read(), digest))
+                    elif entry.name == BUNDLE_END_ENTRY:
+                        trailer = json.loads(entry.read())
+                else:
+                    flush()
+        except FileNotFoundError:
+            result.error = f"Bundle import failed: File not found at {file_path}"
+        except (BundleFormatError, json.JSONDecodeError, UnicodeDecodeError, EOFError, gzip.BadGzipFile) as e:
+            result.error = f"Bundle import failed: {file_path} is not a valid bundle: {e}"
+        except Exception as e:
+            result.error = f"Error importing bundle: {e}"
+        finally:
+            wait_blobs(0)
+            pool.shutdown(wait=True)
+
+        if not result.error and not result.cancelled:
+            if trailer is None:
+                result.error = f"Bundle import failed: {file_path} is truncated (no end record)."
+            elif rows_read != trailer.get("rows") or blobs_read != trailer.get("blobs"):
+                result.error = f"Bundle import failed: {file_path} is incomplete (entry count does not match its end record)."
+            elif not image_container and blobs_read:
+                result.error = "Rows imported, but no image container is set: the images were not restored."
+            elif result.rows_failed or result.rows_deleted or result.blobs_invalid or result.blobs_failed or result.images_missing:
+                result.error = (
+                    f"{result.rows_failed} row(s) failed, {result.rows_deleted} deleted here after the export "
+                    f"(not imported), {result.blobs_invalid + result.blobs_failed} image(s) invalid or not written, "
+                    f"{result.images_missing} product(s) without all their images (see logs)."
+                )
+
+        if result.error:
+            self.logger.error(result.error)
+        self.logger.info(
+            f"Bundle import of {file_path} {'cancelled' if result.cancelled else 'finished'}: "
+            f"{result.rows} upserted, {result.rows_skipped} unchanged, {result.rows_deleted} deleted here, "
+            f"{result.rows_invalid} invalid, {result.rows_failed} failed; {result.blobs_written} image(s) written, "
+            f"{result.blobs_skipped} already present."
+        )
+        return result
@@ -0,0 +1,110 @@
+# src/services/image_job_service.py
+
+import os
+from dataclasses import dataclass
+from typing import List, Optional
+
+from src.my_constants import (
+    IMAGE_JOB_STATE_FAILED,
+    IMAGE_JOB_STATE_PROCESSING,
+    IMAGE_JOB_STATE_READY,
+)
+from src.my_types import ImageJob_Type
+from src.services._base_service import BaseService, IMAGE_CONTAINER_DIR
+from src.utils.blob_store import StoredFile
+from src.utils.image_handlers import ImageOutputProfile, remove_images
+
+LOGO_FILE = "logo_file"
+LOGO_OPACITY = 0.7
+
+
+@dataclass
+class PreparedImageJob:
+    """A claimed job plus the settings it needs, resolved on the GUI thread."""
+    job: ImageJob_Type
+    image_container: str
+    logo_path: Optional[str]
+    output_profile: ImageOutputProfile
+
+
+class ImageJob_Service(BaseService):
+    """
+    Background processing of product images (copy into the image store,
+    watermark, index). States: pending -> processing -> ready / failed.
+
+    Only `process` touches no database and may run on a worker thread; every
+    other method must be called from the thread owning the connection.
+    """
+
+    def resume_interrupted(self) -> int:
+        """Re-queues jobs left 'processing' by a previous run (crash or exit mid-job)."""
+        resumed = self.repo_manager.image_job_repo.requeue(IMAGE_JOB_STATE_PROCESSING)
+        if resumed:
+            self.logger.info(f"Resuming {resumed} interrupted image job(s).")
+        return resumed
+
+    def retry_failed(self) -> int:
+        return self.repo_manager.image_job_repo.requeue(IMAGE_JOB_STATE_FAILED)
+
+    def get_job(self, product_id: str) -> Optional[ImageJob_Type]:
+        return self.repo_manager.image_job_repo.get_job(product_id)
+
+    def claim_next(self) -> Optional[PreparedImageJob]:
+        """Claims the oldest pending job; jobs that cannot run (no image container) are failed."""
+        setting_repo = self.repo_manager.setting_repo
+        while True:
+            job = self.repo_manager.image_job_repo.claim_next()
+            if job is None:
+                return None
+            image_container = setting_repo.get_setting_value_by_name(IMAGE_CONTAINER_DIR)
+            if not image_container or not os.path.isdir(image_container):
+                self.fail(job, f"Image container directory not found: {image_container}.")
+                continue
+            return PreparedImageJob(
+                job=job,
+                image_container=image_container,
+                logo_path=setting_repo.get_setting_value_by_name(LOGO_FILE),
+                output_profile=self.image_output_profile(),
+            )
+
+    def process(self, prepared: PreparedImageJob) -> List[StoredFile]:
+        """Writes the product's image folders. Worker-thread safe (files only)."""
+        job = prepared.job
+        missing = [path for path in job.image_paths if not os.path.isfile(path)]
+        if missing:
+            raise FileNotFoundError(f"Source image(s) not found: {', '.join(missing)}")
+        if job.image_paths and not (prepared.logo_path and os.path.isfile(prepared.logo_path)):
+            raise FileNotFoundError(f"Logo file not found: {prepared.logo_path}")
+        stored = self.write_product_images(
+            prepared.image_container,
+            job.product_id,
+            job.image_paths,
+            prepared.logo_path,
+            prepared.output_profile,
+            LOGO_OPACITY,
+        )
+        # Nguồn + ảnh logo: mỗi ảnh đầu vào phải cho ra hai file
+        if len(stored) < 2 * len(job.image_paths):
+            raise RuntimeError(
+                f"Only {len(stored)} of {2 * len(job.image_paths)} image file(s) were written; see the log."
+            )
+        return stored
+
+    def complete(self, prepared: PreparedImageJob, stored: List[StoredFile]) -> bool:
+        """Indexes the written images and marks the product ready."""
+        job = prepared.job
+        if self.get_job(job.product_id) is None:
+            # Sản phẩm đã bị xoá trong lúc xử lý: dọn thư mục vừa ghi (blob sẽ được GC)
+            remove_images(os.path.join(prepared.image_container, job.product_id))
+            self.logger.info(f"Product {job.product_id} was deleted while its images were processed.")
+            return False
+        if not self.index_product_images(prepared.image_container, job.product_id, stored):
+            self.fail(job, "Failed to index the written images.")
+            return False
+        self.repo_manager.image_job_repo.set_state(job.product_id, IMAGE_JOB_STATE_READY)
+        self.logger.info(f"Images of product {job.product_id} are ready ({len(job.image_paths)} image(s)).")
+        return True
+
+    def fail(self, job: ImageJob_Type, error: str) -> bool:
+        self.logger.error(f"Image job for product {job.product_id} failed (attempt {job.attempts}): {error}")
+        return self.repo_manager.image_job_repo.set_state(job.product_id, IMAGE_JOB_STATE_FAILED, error)
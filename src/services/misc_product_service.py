@@ -1,23 +1,19 @@
 # src/services/misc_product_service.py
 import os
 from random import randint, choice
-from typing import Optional, List, Union, Dict, Any, Tuple
+from typing import Optional, List, Union, Dict, Any, Tuple, Iterator
 from datetime import datetime
-from PIL import Image
 
 # Giả định các import cần thiết từ các file bạn đã cung cấp
+from src.my_constants import DB_TABLES
 from src.my_types import MiscProduct_Type
-from src.utils.image_handlers import (
-    copy_source_images,
-    insert_logo_to_images,
-    remove_images,
-    get_images,
-)
 from src.services._base_service import BaseService
+from src.repositories._base_repo import EXPORT_BATCH_SIZE
 
 
 IMAGE_CONTAINER_DIR = "image_container_dir"
 LOGO_FILE = "logo_file"
+MISC_PRODUCT_TABLE = DB_TABLES["misc_product"]
 
 
 class MiscProduct_Service(BaseService):
@@ -36,32 +32,21 @@ class MiscProduct_Service(BaseService):
         self, product_payload: MiscProduct_Type, image_paths: List[str]
     ) -> Union[MiscProduct_Type, bool]:
         """
-        Creates a new miscellaneous product and handles image processing.
+        Creates a new miscellaneous product and queues its images for background processing.
         """
-        new_product = self.repo_manager.misc_product_repo.insert(product_payload)
-        if not new_product:
-            self.logger.error("Failed to insert misc product into repository.")
-            return False
-
         image_container = self.repo_manager.setting_repo.get_setting_value_by_name(IMAGE_CONTAINER_DIR)
         if not image_container or not os.path.exists(image_container):
-            self.logger.error(f"Image container directory not found: {image_container}. Aborting image processing.")
+            self.logger.error(f"Image container directory not found: {image_container}. Aborting product creation.")
             return False
 
-        current_image_dir = os.path.join(image_container, str(new_product.id))
-        current_image_source_dir = os.path.join(current_image_dir, f"{str(new_product.id)}_source")
-        current_image_logo_dir = os.path.join(current_image_dir, f"{str(new_product.id)}_logo")
-        
-        os.makedirs(current_image_source_dir, exist_ok=True)
-        os.makedirs(current_image_logo_dir, exist_ok=True)
-
-        copy_source_images(image_paths, current_image_source_dir)
-        
-        insert_logo_to_images(
-            image_paths, LOGO_FILE, current_image_logo_dir, str(new_product.id), 0.7
+        new_product = self.insert_with_image_job(
+            self.repo_manager.misc_product_repo, product_payload, MISC_PRODUCT_TABLE, image_paths
         )
+        if not new_product:
+            self.logger.error("Failed to insert misc product into repository.")
+            return False
 
-        self.logger.info(f"Misc product created successfully: {new_product.id}")
+        self.logger.info(f"Misc product created successfully: {new_product.id} ({len(image_paths)} image(s) queued)")
         return new_product
 
     def update(self, product_payload: MiscProduct_Type) -> bool:
@@ -105,9 +90,8 @@ class MiscProduct_Service(BaseService):
         Deletes a miscellaneous product and its associated image folders.
         """
         image_container = self.repo_manager.setting_repo.get_setting_value_by_name(IMAGE_CONTAINER_DIR)
-        current_image_dir = os.path.join(image_container, product_id)
-        
-        if not remove_images(current_image_dir):
+
+        if not self.remove_product_images(image_container, product_id):
             self.logger.warning(f"Failed to remove image directory for misc product: {product_id}. Proceeding with DB deletion.")
         
         is_deleted = self.repo_manager.misc_product_repo.delete_product_by_id(product_id)
@@ -128,9 +112,7 @@ class MiscProduct_Service(BaseService):
             self.logger.warning(f"Misc product not found with ID: {product_id}")
             return None
         image_container = self.repo_manager.setting_repo.get_setting_value_by_name(IMAGE_CONTAINER_DIR)
-        current_image_dir = os.path.join(image_container, str(current_product.id))
-        current_image_logo_dir = os.path.join(current_image_dir, f"{str(current_product.id)}_logo")
-        current_product_imgs = get_images(current_image_logo_dir)
+        current_product_imgs = self.get_product_images(image_container, str(current_product.id))
         return {
             "info": current_product,
             "image_paths": current_product_imgs
@@ -143,13 +125,14 @@ class MiscProduct_Service(BaseService):
         results = []
         image_container = self.repo_manager.setting_repo.get_setting_value_by_name(IMAGE_CONTAINER_DIR)
         list_of_product = self.repo_manager.misc_product_repo.get_all_products()
+        # Một truy vấn manifest cho tất cả sản phẩm thay vì listdir từng thư mục.
+        images_by_id = self.get_products_images(
+            image_container, [str(product.id) for product in list_of_product]
+        )
         for product in list_of_product:
-            current_image_dir = os.path.join(image_container, str(product.id))
-            current_image_logo_dir = os.path.join(current_image_dir, f"{str(product.id)}_logo")
-            current_product_imgs = get_images(current_image_logo_dir)
             results.append({
                 "info": product,
-                "image_paths": current_product_imgs
+                "image_paths": images_by_id[str(product.id)]
             })
 
         return results
@@ -160,9 +143,7 @@ class MiscProduct_Service(BaseService):
             self.logger.warning(f"Không tìm thấy product phù hợp với name = {name}, days = {days}")
             return None
         image_container = self.repo_manager.setting_repo.get_setting_value_by_name(IMAGE_CONTAINER_DIR)
-        current_image_dir = os.path.join(image_container, str(current_product.id))
-        current_image_logo_dir = os.path.join(current_image_dir, f"{str(current_product.id)}_logo")
-        current_product_imgs = get_images(current_image_logo_dir)
+        current_product_imgs = self.get_product_images(image_container, str(current_product.id))
         return {
             "info": current_product,
             "image_paths": current_product_imgs
@@ -175,6 +156,12 @@ class MiscProduct_Service(BaseService):
         
         return self.repo_manager.misc_product_repo.get_all_for_export()
 
+    def iter_all_for_export(self, batch_size: int = EXPORT_BATCH_SIZE) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Yields the records for export in batches, read from a forward-only cursor.
+        """
+        return self.repo_manager.misc_product_repo.iter_all_for_export(batch_size)
+
     def create_bulk(self, payload: List[MiscProduct_Type]) -> bool:
         """
         Inserts multiple MiscProduct_Type records in a single database transaction.
@@ -1,10 +1,11 @@
 
 
 import os
-from typing import Optional, List, Union, Dict, Any
+from typing import Optional, List, Union, Dict, Any, Iterator
 
 from src.my_types import Profile_Type
 from src.services._base_service import BaseService
+from src.repositories._base_repo import EXPORT_BATCH_SIZE
 from src.utils.profile_handlers import create_profile_folder, remove_profile_folder
 
 
@@ -181,6 +182,12 @@ class Profile_Service(BaseService):
         Retrieves all profile records in dictionary format for export/display.
         """
         return self.repo_manager.profile_repo.get_all_for_export()
+
+    def iter_all_for_export(self, batch_size: int = EXPORT_BATCH_SIZE) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Yields the records for export in batches, read from a forward-only cursor.
+        """
+        return self.repo_manager.profile_repo.iter_all_for_export(batch_size)
     
     def create_bulk(self, payload: List[Profile_Type]) -> bool:
         """
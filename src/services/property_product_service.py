@@ -1,21 +1,18 @@
 # src/services/property_product_service.py
 
 import os
-from typing import Optional, List, Union, Dict, Any, Tuple
+from typing import Optional, List, Union, Dict, Any, Tuple, Iterator
 from dataclasses import asdict
 
+from src.my_constants import DB_TABLES
 from src.my_types import PropertyProduct_Type
 from src.services._base_service import BaseService
-from src.utils.image_handlers import (
-    copy_source_images,
-    insert_logo_to_images,
-    remove_images,
-    get_images,
-)
+from src.repositories._base_repo import EXPORT_BATCH_SIZE
 
 
 IMAGE_CONTAINER_DIR = "image_container_dir"
 LOGO_FILE = "logo_file"
+PROPERTY_PRODUCT_TABLE = DB_TABLES["property_product"]
 
 
 class PropertyProduct_Service(BaseService):
@@ -34,40 +31,27 @@ class PropertyProduct_Service(BaseService):
         self, product_payload: PropertyProduct_Type, image_paths: List[str]
     ) -> Union[PropertyProduct_Type, bool]:
         """
-        Creates a new property product and handles image processing.
-        """
-        # 1. Insert product data into the database
-        new_product = self.repo_manager.property_product_repo.insert(product_payload)
-        if not new_product:
-            self.logger.error("Failed to insert property product into repository.")
-            return False
+        Creates a new property product and queues its images for processing.
 
-        # 2. Handle image container setup
+        The product row and its pending image job are inserted in one
+        transaction; copying and watermarking happen later in the background
+        (see ImageJob_Service), so this returns immediately.
+        """
+        # 1. Check the image container before writing anything
         image_container = self.repo_manager.setting_repo.get_setting_value_by_name(IMAGE_CONTAINER_DIR)
         if not image_container or not os.path.exists(image_container):
-            self.logger.error(f"Image container directory not found: {image_container}. Aborting image processing.")
-            # Rollback DB insert
-            self.repo_manager.property_product_repo.delete_product_by_id(new_product.id)
+            self.logger.error(f"Image container directory not found: {image_container}. Aborting product creation.")
             return False
 
-        # 3. Define and create product-specific image directories
-        product_id_str = str(new_product.id)
-        current_image_dir = os.path.join(image_container, product_id_str)
-        current_image_source_dir = os.path.join(current_image_dir, f"{product_id_str}_source")
-        current_image_logo_dir = os.path.join(current_image_dir, f"{product_id_str}_logo")
-        
-        os.makedirs(current_image_source_dir, exist_ok=True)
-        os.makedirs(current_image_logo_dir, exist_ok=True)
-
-        # 4. Copy source images
-        copy_source_images(image_paths, current_image_source_dir)
-        
-        # 5. Insert logo (process image)
-        insert_logo_to_images(
-            image_paths, LOGO_FILE, current_image_logo_dir, product_id_str, 0.7
+        # 2. Insert product data and its image job together
+        new_product = self.insert_with_image_job(
+            self.repo_manager.property_product_repo, product_payload, PROPERTY_PRODUCT_TABLE, image_paths
         )
+        if not new_product:
+            self.logger.error("Failed to insert property product into repository.")
+            return False
 
-        self.logger.info(f"Property product created successfully: {new_product.id}")
+        self.logger.info(f"Property product created successfully: {new_product.id} ({len(image_paths)} image(s) queued)")
         return new_product
 
     def update(self, product_payload: PropertyProduct_Type) -> bool:
@@ -110,12 +94,11 @@ class PropertyProduct_Service(BaseService):
         """
         # 1. Get image container path
         image_container = self.repo_manager.setting_repo.get_setting_value_by_name(IMAGE_CONTAINER_DIR)
-        current_image_dir = os.path.join(image_container, product_id)
-        
-        # 2. Remove associated image files
-        if not remove_images(current_image_dir):
+
+        # 2. Release stored images and remove associated image files
+        if not self.remove_product_images(image_container, product_id):
             self.logger.warning(f"Failed to remove image directory for property product: {product_id}. Proceeding with DB deletion.")
-        
+
         # 3. Delete product from database
         is_deleted = self.repo_manager.property_product_repo.delete_product_by_id(product_id)
         
@@ -135,9 +118,7 @@ class PropertyProduct_Service(BaseService):
             self.logger.warning(f"Misc product not found with ID: {product_id}")
             return None
         image_container = self.repo_manager.setting_repo.get_setting_value_by_name(IMAGE_CONTAINER_DIR)
-        current_image_dir = os.path.join(image_container, str(current_product.id))
-        current_image_logo_dir = os.path.join(current_image_dir, f"{str(current_product.id)}_logo")
-        current_product_imgs = get_images(current_image_logo_dir)
+        current_product_imgs = self.get_product_images(image_container, str(current_product.id))
         return {
             "info": current_product,
             "image_paths": current_product_imgs
@@ -150,13 +131,14 @@ class PropertyProduct_Service(BaseService):
         results = []
         image_container = self.repo_manager.setting_repo.get_setting_value_by_name(IMAGE_CONTAINER_DIR)
         list_of_product = self.repo_manager.property_product_repo.get_all_products()
+        # Một truy vấn manifest cho tất cả sản phẩm thay vì listdir từng thư mục.
+        images_by_id = self.get_products_images(
+            image_container, [str(product.id) for product in list_of_product]
+        )
         for product in list_of_product:
-            current_image_dir = os.path.join(image_container, str(product.id))
-            current_image_logo_dir = os.path.join(current_image_dir, f"{str(product.id)}_logo")
-            current_product_imgs = get_images(current_image_logo_dir)
             results.append({
                 "info": product,
-                "image_paths": current_product_imgs
+                "image_paths": images_by_id[str(product.id)]
             })
 
         return results
@@ -167,9 +149,7 @@ class PropertyProduct_Service(BaseService):
             self.logger.warning(f"Không tìm thấy product phù hợp với transaction = {transaction}, days = {days}")
             return None
         image_container = self.repo_manager.setting_repo.get_setting_value_by_name(IMAGE_CONTAINER_DIR)
-        current_image_dir = os.path.join(image_container, str(current_product.id))
-        current_image_logo_dir = os.path.join(current_image_dir, f"{str(current_product.id)}_logo")
-        current_product_imgs = get_images(current_image_logo_dir)
+        current_product_imgs = self.get_product_images(image_container, str(current_product.id))
         return {
             "info": current_product,
             "image_paths": current_product_imgs
@@ -180,6 +160,12 @@ class PropertyProduct_Service(BaseService):
         Retrieves all property product records in dictionary format for export/display.
         """
         return self.repo_manager.property_product_repo.get_all_for_export()
+
+    def iter_all_for_export(self, batch_size: int = EXPORT_BATCH_SIZE) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Yields the records for export in batches, read from a forward-only cursor.
+        """
+        return self.repo_manager.property_product_repo.iter_all_for_export(batch_size)
     
     def create_bulk(self, payload: List[PropertyProduct_Type]) -> bool:
         """
@@ -1,10 +1,11 @@
 # src/services/property_template_service.py
 
-from typing import Optional, List, Union, Dict, Any
+from typing import Optional, List, Union, Dict, Any, Iterator
 from dataclasses import asdict
 
 from src.my_types import PropertyTemplate_Type
 from src.services._base_service import BaseService
+from src.repositories._base_repo import EXPORT_BATCH_SIZE
 
 
 class PropertyTemplate_Service(BaseService):
@@ -84,6 +85,12 @@ class PropertyTemplate_Service(BaseService):
         Retrieves all property template records in dictionary format for export/display.
         """
         return self.repo_manager.property_template_repo.get_all_for_export()
+
+    def iter_all_for_export(self, batch_size: int = EXPORT_BATCH_SIZE) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Yields the records for export in batches, read from a forward-only cursor.
+        """
+        return self.repo_manager.property_template_repo.iter_all_for_export(batch_size)
     
     def create_bulk(self, payload: List[PropertyTemplate_Type]) -> bool:
         """
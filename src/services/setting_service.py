@@ -1,10 +1,11 @@
 # src/services/setting_service.py
 
-from typing import Optional, List, Union, Dict, Any
+from typing import Optional, List, Union, Dict, Any, Iterator
 from dataclasses import asdict
 
 from src.my_types import Setting_Type
 from src.services._base_service import BaseService
+from src.repositories._base_repo import EXPORT_BATCH_SIZE
 
 
 class Setting_Service(BaseService):
@@ -124,6 +125,13 @@ class Setting_Service(BaseService):
         Retrieves all setting records in dictionary format for export/display.
         """
         return self.repo_manager.setting_repo.get_all_for_export()
+
+    def iter_all_for_export(self, batch_size: int = EXPORT_BATCH_SIZE) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Yields the records for export in batches, read from a forward-only cursor.
+        """
+        return self.repo_manager.setting_repo.iter_all_for_export(batch_size)
+
     def get_proxies_selected(self) -> List[str]:
         return self.repo_manager.setting_repo.get_proxies_selected()
     
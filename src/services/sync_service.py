@@ -0,0 +1,285 @@
+# src/services/sync_service.py
+"""
+Delta sync between workstations.
+
+A delta file holds the rows changed since the last export for a peer and the
+deletions (tombstones) since then, as JSON Lines (compressed by extension,
+like the table exports):
+
+    {"kind": "header", "format": "my-manager-delta", "version": 1, "source": ..., "peer": ..., "since": ..., "until": ...}
+    {"kind": "row", "table": "property_product", "data": {...}}
+    {"kind": "delete", "table": "property_product", "id": ..., "deleted_at": ...}
+    {"kind": "end", "rows": <n>, "deletes": <n>}
+
+Watermarks are the exporting machine's `updated_at` clock and are kept per
+peer, under the name the user gives the peer on both commands:
+`exported_until` (what was last sent to the peer) and `imported_until` (what
+was last applied from it). A delta whose `since` is past `imported_until` was
+written after a delta that never arrived here and is refused. Rows keep
+their original `updated_at`, so deltas are meant for direct peer pairs; a
+row received from one peer is not relayed to a third one whose watermark is
+already past it.
+"""
+import gzip
+import os
+import platform
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from src.my_constants import SYNC_TABLES
+from src.my_types import ImportResult_Type, SyncPeer_Type
+from src.repositories._base_repo import EXPORT_BATCH_SIZE
+from src.services._base_service import BaseService, IMAGE_CONTAINER_DIR, IMPORT_CHUNK_SIZE, ImportProgressCallback
+from src.utils.export_writers import JsonLinesExportWriter
+from src.utils.file_codecs import CodecUnavailableError, codec_for_path, open_binary_reader, open_text_writer
+from src.utils.import_readers import ImportFormatError, iter_chunks, iter_jsonl_records
+
+DELTA_FORMAT = "my-manager-delta"
+DELTA_VERSION = 1
+# Xóa sản phẩm từ máy khác thì xóa luôn ảnh của nó ở máy này
+PRODUCT_TABLES = ("property_product", "misc_product")
+# Tombstone được giữ thêm một thời gian sau khi mọi peer đã nhận: chặn một dòng cũ
+# (peer sửa trước khi nhận lệnh xóa) quay lại qua delta của chính peer đó
+TOMBSTONE_RETENTION_DAYS = 30
+
+
+class DeltaGapError(Exception):
+    """The delta starts after the last change applied from its peer: an earlier delta is missing."""
+
+
+def local_peer_id() -> str:
+    """Name this machine gives itself in the deltas it writes."""
+    return platform.node() or "local"
+
+
+class Sync_Service(BaseService):
+
+    def get_peers(self) -> List[SyncPeer_Type]:
+        return self.repo_manager.sync_repo.get_all_peers()
+
+    def reset_peer(self, peer_id: str) -> bool:
+        return self.repo_manager.sync_repo.reset_peer(peer_id)
+
+    # --- Export ---
+
+    def _iter_delta_records(self, header: Dict[str, Any], batch_size: int, counts: Dict[str, int]) -> Iterator[List[Dict[str, Any]]]:
+        sync_repo = self.repo_manager.sync_repo
+        yield [header]
+        for table_key in SYNC_TABLES:
+            for batch in sync_repo.iter_changed_rows(table_key, header["since"], batch_size):
+                counts["rows"] += len(batch)
+                yield [{"kind": "row", "table": table_key, "data": row} for row in batch]
+        for batch in sync_repo.iter_tombstones(header["since"], batch_size):
+            counts["deletes"] += len(batch)
+            yield [
+                {"kind": "delete", "table": row["table_key"], "id": row["row_id"], "deleted_at": row["deleted_at"]}
+                for row in batch
+            ]
+        yield [{"kind": "end", **counts}]
+
+    def export_delta(
+        self,
+        file_path: str,
+        peer_id: str,
+        since: Optional[str] = None,
+        batch_size: int = EXPORT_BATCH_SIZE,
+    ) -> int:
+        """
+        Writes the changes since the last delta exported for `peer_id` (or
+        since `since`; everything for a new peer) and moves the peer's export
+        watermark forward. Like `export_stream`, the file is renamed into place
+        only once complete.
+
+        Returns:
+            The number of rows and deletions written, or -1 on failure.
+        """
+        sync_repo = self.repo_manager.sync_repo
+        if since is None:
+            peer = sync_repo.get_peer(peer_id)
+            since = peer.exported_until if peer else None
+        # Mốc lấy trước khi đọc: thay đổi trong lúc export sẽ nằm trong delta sau
+        until = sync_repo.init_time()
+        header = {
+            "kind": "header",
+            "format": DELTA_FORMAT,
+            "version": DELTA_VERSION,
+            "source": local_peer_id(),
+            "peer": peer_id,
+            "since": since,
+            "until": until,
+        }
+        counts = {"rows": 0, "deletes": 0}
+
+        tmp_path = f"{file_path}.{os.getpid()}.tmp"
+        try:
+            with open_text_writer(tmp_path, codec_for_path(file_path)) as f:
+                writer = JsonLinesExportWriter(f)
+                for records in self._iter_delta_records(header, batch_size, counts):
+                    writer.write_rows(records)
+            os.replace(tmp_path, file_path)
+        except Exception as e:
+            self.logger.error(f"Error exporting delta for peer '{peer_id}': {e}")
+            return -1
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+        if not sync_repo.set_exported_until(peer_id, until):
+            self.logger.warning(f"Delta written but the watermark of peer '{peer_id}' was not saved.")
+        oldest = sync_repo.min_exported_until()
+        if oldest:
+            retention = (datetime.now() - timedelta(days=TOMBSTONE_RETENTION_DAYS)).strftime("%Y-%m-%d %H:%M:%S")
+            sync_repo.prune_tombstones(min(oldest, retention))
+        self.logger.info(
+            f"Delta for peer '{peer_id}' since {since or 'the beginning'} exported to {file_path}: "
+            f"{counts['rows']} row(s), {counts['deletes']} deletion(s)."
+        )
+        return counts["rows"] + counts["deletes"]
+
+    # --- Import ---
+
+    @staticmethod
+    def _read_header(records: Iterator[Dict[str, Any]]) -> Dict[str, Any]:
+        header = next(records, None)
+        if not header or header.get("kind") != "header" or header.get("format") != DELTA_FORMAT:
+            raise ImportFormatError("Not a delta file.")
+        if header.get("version") != DELTA_VERSION:
+            raise ImportFormatError(f"Unsupported delta version: {header.get('version')}.")
+        return header
+
+    def _apply_chunk(self, chunk: List[Dict[str, Any]], result: ImportResult_Type, deleted_products: List[str]) -> Optional[Dict[str, Any]]:
+        """Applies one chunk in a transaction; returns the trailer record if the chunk holds it."""
+        sync_repo = self.repo_manager.sync_repo
+        trailer = None
+        counts = {"imported": 0, "skipped": 0, "deleted": 0, "invalid": 0}
+        chunk_deleted_products = []
+
+        def execute_apply():
+            nonlocal trailer
+            queries = {}
+            for record in chunk:
+                kind = record.get("kind")
+                table_key = record.get("table")
+                if kind == "end":
+                    trailer = record
+                    continue
+                if table_key not in SYNC_TABLES:
+                    counts["invalid"] += 1
+                    continue
+                if kind == "row":
+                    data = record.get("data") or {}
+                    if not data.get("id") or not data.get("updated_at"):
+                        counts["invalid"] += 1
+                        continue
+                    changed = sync_repo.upsert_row(queries, table_key, data)
+                    if changed is None:
+                        return False, None
+                    counts["imported" if changed else "skipped"] += 1
+                elif kind == "delete":
+                    if not record.get("id") or not record.get("deleted_at"):
+                        counts["invalid"] += 1
+                        continue
+                    deleted = sync_repo.apply_delete(queries, table_key, record["id"], record["deleted_at"])
+                    if deleted is None:
+                        return False, None
+                    counts["deleted" if deleted else "skipped"] += 1
+                    if deleted and table_key in PRODUCT_TABLES:
+                        chunk_deleted_products.append(record["id"])
+                else:
+                    counts["invalid"] += 1
+            return True, None
+
+        success, _ = sync_repo.execute_in_transaction(execute_apply)
+        if success:
+            result.rows_imported += counts["imported"]
+            result.rows_skipped += counts["skipped"]
+            result.rows_deleted += counts["deleted"]
+            result.rows_invalid += counts["invalid"]
+            deleted_products.extend(chunk_deleted_products)
+        else:
+            result.rows_failed += len(chunk) - (1 if trailer else 0)
+            trailer = None
+        return trailer
+
+    def import_delta(
+        self,
+        file_path: str,
+        peer_id: str,
+        chunk_size: int = IMPORT_CHUNK_SIZE,
+        progress_callback: Optional[ImportProgressCallback] = None,
+        is_cancelled: Optional[Callable[[], bool]] = None,
+        allow_gap: bool = False,
+    ) -> ImportResult_Type:
+        """
+        Applies a delta file from `peer_id` chunk by chunk, one committed
+        transaction per chunk. Newer local versions win, so re-importing a
+        delta (after a cancel, a crash or by mistake) is safe. The peer's
+        import watermark is moved forward only once the whole file, up to its
+        trailer, has been applied.
+
+        A delta starting after that watermark means an earlier delta from the
+        peer was never applied; it is refused unless `allow_gap` is set.
+        """
+        result = ImportResult_Type()
+        records_read = 0
+        deleted_products: List[str] = []
+        header = None
+        trailer = None
+        sync_repo = self.repo_manager.sync_repo
+        peer = sync_repo.get_peer(peer_id)
+        imported_until = peer.imported_until if peer else None
+        try:
+            total_bytes = os.path.getsize(file_path)
+            with open_binary_reader(file_path) as (stream, raw):
+                records = iter_jsonl_records(stream)
+                header = self._read_header(records)
+                since = header.get("since")
+                # Delta đầy đủ (since rỗng) luôn áp dụng được; delta nối tiếp phải bắt đầu từ mốc đã nhận
+                if since and (imported_until is None or since > imported_until) and not allow_gap:
+                    raise DeltaGapError(
+                        f"it covers changes since {since}, but changes from peer '{peer_id}' were only applied "
+                        f"until {imported_until or 'never'}. Import the missing delta first, or have the peer "
+                        f"export a full delta (sync-peers --reset)."
+                    )
+                for chunk in iter_chunks(records, chunk_size):
+                    if is_cancelled and is_cancelled():
+                        result.cancelled = True
+                        break
+                    trailer = self._apply_chunk(chunk, result, deleted_products) or trailer
+                    records_read += len(chunk)
+                    if progress_callback:
+                        progress_callback(result.rows_imported + result.rows_deleted, raw.tell(), total_bytes)
+        except FileNotFoundError:
+            result.error = f"Import failed: File not found at {file_path}"
+        except DeltaGapError as e:
+            result.error = f"Import refused: {e}"
+        except CodecUnavailableError as e:
+            result.error = f"Import failed: {e}"
+        except (ImportFormatError, UnicodeDecodeError, EOFError, gzip.BadGzipFile) as e:
+            result.error = f"Import failed: {file_path} is not a valid delta: {e}"
+        except Exception as e:
+            result.error = f"Error importing delta: {e}"
+
+        if deleted_products:
+            image_container = self.repo_manager.setting_repo.get_setting_value_by_name(IMAGE_CONTAINER_DIR)
+            for product_id in deleted_products:
+                self.remove_product_images(image_container, product_id)
+
+        if not result.error and not result.cancelled:
+            if trailer is None:
+                result.error = f"Import failed: {file_path} is truncated (no end record)."
+            elif records_read - 1 != trailer.get("rows", 0) + trailer.get("deletes", 0):
+                result.error = f"Import failed: {file_path} is incomplete (record count does not match its end record)."
+            elif result.rows_failed:
+                result.error = f"{result.rows_failed} change(s) could not be applied (see logs)."
+            elif header.get("until"):
+                sync_repo.set_imported_until(peer_id, header["until"])
+
+        if result.error:
+            self.logger.error(result.error)
+        self.logger.info(
+            f"Delta import of {file_path} {'cancelled' if result.cancelled else 'finished'}: "
+            f"{result.rows_imported} upserted, {result.rows_deleted} deleted, {result.rows_skipped} unchanged, "
+            f"{result.rows_invalid} invalid, {result.rows_failed} failed."
+        )
+        return result
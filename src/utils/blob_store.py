@@ -0,0 +1,226 @@
+# src/utils/blob_store.py
+import hashlib
+import os
+import shutil
+import threading
+import time
+from dataclasses import dataclass
+from typing import Iterator, List, Optional, Tuple
+
+from src.utils.image_handlers import IMAGE_EXTENSIONS, file_digest
+from src.utils.logger import Logger
+
+logger = Logger(__name__)
+
+# Blob folder inside the image container: <container>/.blobs/<hash[:2]>/<hash>
+BLOB_DIR_NAME = ".blobs"
+# Linux FICLONE ioctl (_IOW(0x94, 9, int)): copy-on-write clone on btrfs/XFS.
+FICLONE = 0x40049409
+
+LINK_REFLINK = "reflink"
+LINK_HARDLINK = "hardlink"
+LINK_COPY = "copy"
+
+
+@dataclass
+class StoredFile:
+    """A file materialized from the blob store (`path` shares the bytes of blob `hash`)."""
+    path: str
+    hash: str
+    size: int
+
+
+class BlobStore:
+    """
+    Content-addressed image files, stored once per SHA-256 under `root` and
+    materialized into product folders as reflinks, hardlinks or (as a last
+    resort) copies. Reference counts live in the IMAGE_BLOB table; this class
+    only handles the files.
+    """
+
+    def __init__(self, root: str):
+        self.root = root
+        # None = chưa thử; tránh gọi ioctl thất bại cho mọi file trên ext4/NTFS
+        self._reflink_supported: Optional[bool] = None
+
+    @classmethod
+    def for_container(cls, image_container: str) -> "BlobStore":
+        return cls(os.path.join(image_container, BLOB_DIR_NAME))
+
+    def blob_path(self, digest: str) -> str:
+        return os.path.join(self.root, digest[:2], digest)
+
+    def has(self, digest: str) -> bool:
+        return os.path.exists(self.blob_path(digest))
+
+    # ----------------------------------------------------------------------
+    # Adding blobs
+    # ----------------------------------------------------------------------
+
+    def put_file(self, file_path: str) -> Tuple[str, int]:
+        """Copies a file into the store unless its content is already there; returns (hash, size)."""
+        digest = file_digest(file_path)
+        blob = self.blob_path(digest)
+        if not os.path.exists(blob):
+            os.makedirs(os.path.dirname(blob), exist_ok=True)
+            tmp_path = f"{blob}.{os.getpid()}.tmp"
+            shutil.copyfile(file_path, tmp_path)
+            os.replace(tmp_path, blob)
+        return digest, os.path.getsize(blob)
+
+    def put_bytes(self, data: bytes, expected_digest: Optional[str] = None) -> Tuple[str, int]:
+        """
+        Writes bytes into the store unless their content is already there;
+        returns (hash, size). Raises ValueError if they do not hash to
+        `expected_digest`. Safe to call from several threads.
+        """
+        digest = hashlib.sha256(data).hexdigest()
+        if expected_digest and digest != expected_digest:
+            raise ValueError(f"Content does not match its hash {expected_digest}.")
+        blob = self.blob_path(digest)
+        if not os.path.exists(blob):
+            os.makedirs(os.path.dirname(blob), exist_ok=True)
+            tmp_path = f"{blob}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, blob)
+        return digest, len(data)
+
+    def adopt_file(self, file_path: str) -> StoredFile:
+        """
+        Moves a freshly written file into the store (or drops it if the content
+        is already stored) and leaves a link to the blob at its place.
+        """
+        digest = file_digest(file_path)
+        blob = self.blob_path(digest)
+        if not os.path.exists(blob):
+            os.makedirs(os.path.dirname(blob), exist_ok=True)
+            try:
+                os.replace(file_path, blob)
+            except OSError:
+                # Khác ổ đĩa: copy vào store rồi link lại như bình thường
+                tmp_path = f"{blob}.{os.getpid()}.tmp"
+                shutil.copyfile(file_path, tmp_path)
+                os.replace(tmp_path, blob)
+        self.link(digest, file_path)
+        return StoredFile(file_path, digest, os.path.getsize(blob))
+
+    # ----------------------------------------------------------------------
+    # Materializing blobs
+    # ----------------------------------------------------------------------
+
+    def link(self, digest: str, dest_path: str) -> str:
+        """Makes `dest_path` a reflink/hardlink/copy of a blob; returns the method used."""
+        blob = self.blob_path(digest)
+        if os.path.exists(dest_path) and os.path.samefile(blob, dest_path):
+            # Đã là hardlink tới blob; rename() giữa hai link cùng inode không làm gì và để lại file .tmp
+            return LINK_HARDLINK
+        tmp_path = f"{dest_path}.{os.getpid()}.tmp"
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        method = self._materialize(blob, tmp_path)
+        # os.replace để file đích không bao giờ ở trạng thái ghi dở
+        os.replace(tmp_path, dest_path)
+        return method
+
+    def _materialize(self, blob: str, dest_path: str) -> str:
+        if self._reflink_supported is not False:
+            try:
+                self._reflink(blob, dest_path)
+                self._reflink_supported = True
+                return LINK_REFLINK
+            except OSError:
+                self._reflink_supported = False
+                if os.path.exists(dest_path):
+                    os.remove(dest_path)
+        try:
+            os.link(blob, dest_path)
+            return LINK_HARDLINK
+        except OSError:
+            shutil.copyfile(blob, dest_path)
+            return LINK_COPY
+
+    @staticmethod
+    def _reflink(source_path: str, dest_path: str):
+        try:
+            import fcntl
+        except ImportError:  # Windows
+            raise OSError("reflink is not supported on this platform")
+        with open(source_path, "rb") as source, open(dest_path, "wb") as dest:
+            fcntl.ioctl(dest.fileno(), FICLONE, source.fileno())
+
+    def import_files(self, image_source: List[str], output_dir: str, output_name_prefix: str) -> List[StoredFile]:
+        """
+        Stores source images and links them into `output_dir` as
+        `<output_name_prefix>_<i><ext>` (the naming of copy_source_images).
+        """
+        os.makedirs(output_dir, exist_ok=True)
+        stored = []
+        for index, image_path in enumerate(image_source):
+            try:
+                digest, size = self.put_file(image_path)
+                file_extension = os.path.splitext(image_path)[1]
+                new_path = os.path.join(output_dir, f"{output_name_prefix}_{index}{file_extension}")
+                self.link(digest, new_path)
+                stored.append(StoredFile(new_path, digest, size))
+            except Exception as e:
+                logger.error(f"Error storing source file {image_path}: {e}")
+        return stored
+
+    def adopt_folder(self, image_folder: str) -> List[StoredFile]:
+        """Deduplicates every image written into a folder (e.g. watermark outputs) against the store."""
+        stored = []
+        if not os.path.isdir(image_folder):
+            return stored
+        for file_name in sorted(os.listdir(image_folder)):
+            file_path = os.path.join(image_folder, file_name)
+            if not file_name.lower().endswith(IMAGE_EXTENSIONS) or not os.path.isfile(file_path):
+                continue
+            try:
+                stored.append(self.adopt_file(file_path))
+            except Exception as e:
+                logger.error(f"Error storing image {file_path}: {e}")
+        return stored
+
+    # ----------------------------------------------------------------------
+    # Garbage collection
+    # ----------------------------------------------------------------------
+
+    def iter_blobs(self) -> Iterator[Tuple[str, int, float]]:
+        """Yields (hash, size, mtime) of every stored blob."""
+        if not os.path.isdir(self.root):
+            return
+        with os.scandir(self.root) as shards:
+            for shard in shards:
+                if not shard.is_dir():
+                    continue
+                with os.scandir(shard.path) as blobs:
+                    for blob in blobs:
+                        if blob.name.endswith(".tmp") or not blob.is_file():
+                            continue
+                        stat = blob.stat()
+                        yield blob.name, stat.st_size, stat.st_mtime
+
+    def remove(self, digest: str) -> int:
+        """Deletes a blob file; returns the bytes reclaimed (0 if it was missing)."""
+        blob = self.blob_path(digest)
+        try:
+            size = os.path.getsize(blob)
+            os.remove(blob)
+            return size
+        except FileNotFoundError:
+            return 0
+
+    def remove_stale_tmp_files(self, min_age_s: float) -> int:
+        """Deletes `.tmp` leftovers of interrupted writes older than `min_age_s`."""
+        removed = 0
+        if not os.path.isdir(self.root):
+            return removed
+        cutoff = time.time() - min_age_s
+        for dir_path, _, file_names in os.walk(self.root):
+            for file_name in file_names:
+                file_path = os.path.join(dir_path, file_name)
+                if file_name.endswith(".tmp") and os.path.getmtime(file_path) < cutoff:
+                    os.remove(file_path)
+                    removed += 1
+        return removed
@@ -0,0 +1,186 @@
+# src/utils/bundle_archive.py
+"""
+Sequential zip/tar access for product bundles.
+
+Both formats are written entry by entry straight to disk (files are copied
+in chunks, nothing is assembled in memory) and read back in the order they
+were written, so an import is one forward pass over the archive. Entries
+the reader does not want are skipped without reading their data: tar
+members are seeked over, zip members are never opened.
+
+Entries are stored as-is: images are already compressed and the callers
+compress their own data entries, so both formats hold the same bytes.
+"""
+import io
+import os
+import tarfile
+import zipfile
+from typing import BinaryIO, Iterator, Optional
+
+BUNDLE_FORMATS = ("zip", "tar")
+
+
+class BundleFormatError(ValueError):
+    """The archive is not a bundle (or not a zip/tar file)."""
+
+
+def bundle_format(file_path: str) -> str:
+    """ "zip" or "tar", from the file extension."""
+    extension = os.path.splitext(file_path)[1].lstrip(".").lower()
+    if extension not in BUNDLE_FORMATS:
+        raise BundleFormatError(f"Unsupported bundle file: {file_path}. Use .zip or .tar.")
+    return extension
+
+
+class BundleEntry:
+    """One archive entry; `read()` loads its data (call it only for entries you need)."""
+
+    def __init__(self, name: str, size: int, opener):
+        self.name = name
+        self.size = size
+        self._opener = opener
+
+    def open(self) -> BinaryIO:
+        return self._opener()
+
+    def read(self) -> bytes:
+        try:
+            with self.open() as f:
+                return f.read()
+        except (tarfile.TarError, zipfile.BadZipFile, EOFError) as e:
+            raise BundleFormatError(f"Entry {self.name} is damaged or truncated: {e}") from e
+
+
+class BundleWriter:
+    def __init__(self, file_path: str):
+        self.file_path = file_path
+
+    def add_bytes(self, name: str, data: bytes):
+        raise NotImplementedError
+
+    def add_file(self, name: str, path: str):
+        raise NotImplementedError
+
+    def close(self):
+        raise NotImplementedError
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class ZipBundleWriter(BundleWriter):
+    def __init__(self, file_path: str):
+        super().__init__(file_path)
+        self._zip = zipfile.ZipFile(file_path, "w", compression=zipfile.ZIP_STORED, allowZip64=True)
+
+    def add_bytes(self, name: str, data: bytes):
+        self._zip.writestr(name, data)
+
+    def add_file(self, name: str, path: str):
+        self._zip.write(path, name)
+
+    def close(self):
+        self._zip.close()
+
+
+class TarBundleWriter(BundleWriter):
+    def __init__(self, file_path: str):
+        super().__init__(file_path)
+        self._tar = tarfile.open(file_path, "w", format=tarfile.PAX_FORMAT)
+
+    def add_bytes(self, name: str, data: bytes):
+        info = tarfile.TarInfo(name)
+        info.size = len(data)
+        self._tar.addfile(info, io.BytesIO(data))
+
+    def add_file(self, name: str, path: str):
+        info = tarfile.TarInfo(name)
+        info.size = os.path.getsize(path)
+        with open(path, "rb") as f:
+            self._tar.addfile(info, f)
+
+    def close(self):
+        self._tar.close()
+
+
+class BundleReader:
+    def __init__(self, file_path: str):
+        self.file_path = file_path
+
+    def __iter__(self) -> Iterator[BundleEntry]:
+        raise NotImplementedError
+
+    def position(self) -> int:
+        """Bytes of the archive read so far (for progress)."""
+        raise NotImplementedError
+
+    def close(self):
+        raise NotImplementedError
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class ZipBundleReader(BundleReader):
+    def __init__(self, file_path: str):
+        super().__init__(file_path)
+        try:
+            self._zip = zipfile.ZipFile(file_path, "r")
+        except zipfile.BadZipFile as e:
+            raise BundleFormatError(f"{file_path} is not a zip file: {e}") from e
+        self._position = 0
+
+    def __iter__(self) -> Iterator[BundleEntry]:
+        # infolist() giữ thứ tự ghi: bundle.json, rows/..., blobs/..., end.json
+        for info in self._zip.infolist():
+            if info.is_dir():
+                continue
+            self._position = info.header_offset
+            yield BundleEntry(info.filename, info.file_size, lambda info=info: self._zip.open(info))
+
+    def position(self) -> int:
+        return self._position
+
+    def close(self):
+        self._zip.close()
+
+
+class TarBundleReader(BundleReader):
+    def __init__(self, file_path: str):
+        super().__init__(file_path)
+        try:
+            self._tar = tarfile.open(file_path, "r:")
+        except tarfile.TarError as e:
+            raise BundleFormatError(f"{file_path} is not a tar file: {e}") from e
+
+    def __iter__(self) -> Iterator[BundleEntry]:
+        while True:
+            try:
+                member = self._tar.next()
+            except tarfile.TarError as e:
+                raise BundleFormatError(f"{self.file_path} is damaged or truncated: {e}") from e
+            if member is None:
+                return
+            if member.isfile():
+                yield BundleEntry(member.name, member.size, lambda member=member: self._tar.extractfile(member))
+
+    def position(self) -> int:
+        return self._tar.fileobj.tell()
+
+    def close(self):
+        self._tar.close()
+
+
+def open_bundle_writer(file_path: str, data_format: Optional[str] = None) -> BundleWriter:
+    data_format = data_format or bundle_format(file_path)
+    return ZipBundleWriter(file_path) if data_format == "zip" else TarBundleWriter(file_path)
+
+
+def open_bundle_reader(file_path: str) -> BundleReader:
+    return ZipBundleReader(file_path) if bundle_format(file_path) == "zip" else TarBundleReader(file_path)
@@ -0,0 +1,83 @@
+# src/utils/export_writers.py
+"""
+Incremental writers for table exports.
+
+Rows are written batch by batch as they are read from the database, so an
+export needs memory for one batch only and starts writing immediately:
+
+  * csv   - header from the first row's keys, then one line per row
+  * jsonl - JSON Lines, one object per line
+  * json  - a JSON array, byte-for-byte what json.dump(rows, indent=4) produced
+"""
+import csv
+import json
+from typing import Any, Dict, Iterable, List, TextIO
+
+EXPORT_FORMATS = ("json", "jsonl", "csv")
+JSON_INDENT = 4
+
+
+class ExportWriter:
+    """Base class: `write_rows` any number of times, then `close` (does not close the stream)."""
+
+    def __init__(self, stream: TextIO):
+        self.stream = stream
+        self.rows_written = 0
+
+    def write_rows(self, rows: List[Dict[str, Any]]):
+        for row in rows:
+            self._write_row(row)
+            self.rows_written += 1
+
+    def _write_row(self, row: Dict[str, Any]):
+        raise NotImplementedError
+
+    def close(self):
+        pass
+
+
+class CsvExportWriter(ExportWriter):
+    def __init__(self, stream: TextIO):
+        super().__init__(stream)
+        self._writer = None
+
+    def _write_row(self, row: Dict[str, Any]):
+        if self._writer is None:
+            # Lấy headers (tên cột) từ khóa của bản ghi đầu tiên
+            self._writer = csv.DictWriter(self.stream, fieldnames=list(row.keys()))
+            self._writer.writeheader()
+        self._writer.writerow(row)
+
+
+class JsonLinesExportWriter(ExportWriter):
+    def _write_row(self, row: Dict[str, Any]):
+        self.stream.write(json.dumps(row, ensure_ascii=False))
+        self.stream.write("\n")
+
+
+class JsonArrayExportWriter(ExportWriter):
+    """Streams a JSON array formatted like json.dump(rows, indent=4)."""
+
+    def _write_row(self, row: Dict[str, Any]):
+        self.stream.write(",\n" if self.rows_written else "[\n")
+        encoded = json.dumps(row, ensure_ascii=False, indent=JSON_INDENT)
+        self.stream.write("\n".join(" " * JSON_INDENT + line for line in encoded.split("\n")))
+
+    def close(self):
+        self.stream.write("\n]" if self.rows_written else "[]")
+
+
+EXPORT_WRITERS = {
+    "json": JsonArrayExportWriter,
+    "jsonl": JsonLinesExportWriter,
+    "csv": CsvExportWriter,
+}
+
+
+def write_export(stream: TextIO, batches: Iterable[List[Dict[str, Any]]], data_format: str) -> int:
+    """Writes every batch to `stream` in `data_format`; returns the number of rows written."""
+    writer = EXPORT_WRITERS[data_format](stream)
+    for batch in batches:
+        writer.write_rows(batch)
+    writer.close()
+    return writer.rows_written
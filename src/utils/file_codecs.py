@@ -0,0 +1,121 @@
+# src/utils/file_codecs.py
+"""
+Transparent compression for export/import files, chosen by file extension.
+
+    data.csv / data.jsonl / data.json     plain text
+    data.csv.gz / data.jsonl.gz / ...     gzip (standard library)
+    data.csv.zst / data.jsonl.zst / ...   zstd, if `compression.zstd` (Python 3.14+)
+                                          or the `zstandard` package is available
+
+Streams are compressed and decompressed on the fly: nothing is buffered in
+memory beyond the codec's window and no uncompressed copy is written.
+"""
+import gzip
+import io
+import os
+from contextlib import contextmanager
+from typing import BinaryIO, Iterator, Optional, TextIO, Tuple
+
+# extension -> codec name
+COMPRESSION_EXTENSIONS = {".gz": "gzip", ".zst": "zstd"}
+GZIP_LEVEL = 6
+# zstd level 3 nén gần bằng gzip -9 nhưng nhanh hơn nhiều lần
+ZSTD_LEVEL = 3
+
+
+class CodecUnavailableError(RuntimeError):
+    """The file needs a codec whose library is not installed."""
+
+
+def _zstd_backend():
+    """Returns ("stdlib" | "zstandard", module), or (None, None) if zstd is unavailable."""
+    try:
+        from compression import zstd  # Python 3.14+
+
+        return "stdlib", zstd
+    except ImportError:
+        pass
+    try:
+        import zstandard
+
+        return "zstandard", zstandard
+    except ImportError:
+        return None, None
+
+
+def zstd_available() -> bool:
+    return _zstd_backend()[0] is not None
+
+
+def split_extension(file_path: str) -> Tuple[str, Optional[str]]:
+    """
+    Splits a file name into (data format, codec), e.g. "a.csv.gz" -> ("csv", "gzip"),
+    "a.json" -> ("json", None). The data format is "" if there is none.
+    """
+    root, extension = os.path.splitext(file_path)
+    codec = COMPRESSION_EXTENSIONS.get(extension.lower())
+    if codec:
+        root, extension = os.path.splitext(root)
+    return extension.lstrip(".").lower(), codec
+
+
+def codec_for_path(file_path: str) -> Optional[str]:
+    return split_extension(file_path)[1]
+
+
+def _require_zstd():
+    backend, module = _zstd_backend()
+    if backend is None:
+        raise CodecUnavailableError("zstd support is not available (install the 'zstandard' package).")
+    return backend, module
+
+
+@contextmanager
+def open_binary_reader(file_path: str) -> Iterator[Tuple[BinaryIO, BinaryIO]]:
+    """
+    Opens `file_path` for reading, decompressing according to its extension.
+
+    Yields (stream, raw): read records from `stream`; `raw.tell()` is the
+    position in the file on disk, usable for progress against its size.
+    """
+    codec = codec_for_path(file_path)
+    with open(file_path, "rb") as raw:
+        if codec is None:
+            yield raw, raw
+        elif codec == "gzip":
+            with gzip.GzipFile(fileobj=raw, mode="rb") as stream:
+                yield stream, raw
+        else:
+            backend, zstd = _require_zstd()
+            if backend == "stdlib":
+                with zstd.ZstdFile(raw, "rb") as stream:
+                    yield stream, raw
+            else:
+                reader = zstd.ZstdDecompressor().stream_reader(raw, closefd=False)
+                with io.BufferedReader(reader) as stream:
+                    yield stream, raw
+
+
+@contextmanager
+def open_text_writer(file_path: str, codec: Optional[str] = None) -> Iterator[TextIO]:
+    """Opens `file_path` for writing UTF-8 text, compressed with `codec` (None, "gzip" or "zstd")."""
+    if codec is None:
+        with open(file_path, "w", newline="", encoding="utf-8") as f:
+            yield f
+        return
+
+    with open(file_path, "wb") as raw:
+        if codec == "gzip":
+            # filename="": không ghi tên file tạm vào header gzip
+            compressed = gzip.GzipFile(filename="", mode="wb", fileobj=raw, compresslevel=GZIP_LEVEL)
+        elif codec == "zstd":
+            backend, zstd = _require_zstd()
+            if backend == "stdlib":
+                compressed = zstd.ZstdFile(raw, "wb", level=ZSTD_LEVEL)
+            else:
+                compressed = zstd.ZstdCompressor(level=ZSTD_LEVEL).stream_writer(raw, closefd=False)
+        else:
+            raise ValueError(f"Unknown compression codec: {codec}")
+        # Closing the text wrapper flushes it and ends the compressed stream; `raw` is closed by the outer with.
+        with io.TextIOWrapper(compressed, encoding="utf-8", newline="") as f:
+            yield f
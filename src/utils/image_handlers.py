@@ -1,25 +1,413 @@
 import os
+import math
 import shutil
-from PIL import Image
-from typing import List, Union
-
+import atexit
+import hashlib
+import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+from src.my_constants import CACHE_DIR
 from src.utils.logger import Logger
 
 logger = Logger(__name__)
 
+IMAGE_EXTENSIONS = (".png", ".jpg", ".jpeg", ".webp", ".gif", ".bmp", ".svg")
+HASH_CHUNK_SIZE = 1024 * 1024
+# Logo width relative to the width of the watermarked image.
+LOGO_WIDTH_RATIO = 0.3
+# Prepared (resized + faded) logos, persisted across runs.
+LOGO_CACHE_DIR = os.path.join(CACHE_DIR, "logos")
+PREPARED_LOGO_MEMORY_ITEMS = 16
+# Preview thumbnails, keyed by (image path, mtime, file size, thumbnail size).
+THUMBNAIL_CACHE_DIR = os.path.join(CACHE_DIR, "thumbnails")
 
-def insert_logo_to_images(
+
+# Pillow format name -> file extension of the watermarked outputs.
+OUTPUT_FORMATS = {"PNG": ".png", "JPEG": ".jpg", "WEBP": ".webp"}
+
+
+@dataclass(frozen=True)
+class ImageOutputProfile:
+    """
+    How watermarked images are encoded.
+
+    The default (full-resolution PNG) matches the historical output; JPEG/WebP
+    with a `max_edge` keeps listing images small enough to upload quickly.
+    """
+    format: str = "PNG"
+    quality: int = 85
+    max_edge: int = 0  # longest side in pixels, 0 = keep the source resolution
+    strip_metadata: bool = True
+
+    @property
+    def extension(self) -> str:
+        return OUTPUT_FORMATS[self.format]
+
+    @classmethod
+    def from_values(
+        cls,
+        format: Optional[str] = None,
+        quality: Optional[str] = None,
+        max_edge: Optional[str] = None,
+        strip_metadata: Optional[str] = None,
+    ) -> "ImageOutputProfile":
+        """Builds a profile from raw (setting) strings; missing or invalid values fall back to the defaults."""
+        default = cls()
+        output_format = (format or default.format).strip().upper()
+        if output_format == "JPG":
+            output_format = "JPEG"
+        if output_format not in OUTPUT_FORMATS:
+            logger.warning(f"Unsupported image output format '{format}', using {default.format}.")
+            output_format = default.format
+        try:
+            output_quality = min(100, max(1, int(quality))) if quality else default.quality
+        except ValueError:
+            logger.warning(f"Invalid image output quality '{quality}', using {default.quality}.")
+            output_quality = default.quality
+        try:
+            output_max_edge = max(0, int(max_edge)) if max_edge else default.max_edge
+        except ValueError:
+            logger.warning(f"Invalid image max edge '{max_edge}', using {default.max_edge}.")
+            output_max_edge = default.max_edge
+        if strip_metadata is None or strip_metadata.strip() == "":
+            output_strip = default.strip_metadata
+        else:
+            output_strip = strip_metadata.strip().lower() not in ("0", "false", "no", "off")
+        return cls(output_format, output_quality, output_max_edge, output_strip)
+
+
+@dataclass
+class WatermarkResult:
+    """Outcome of watermarking one image of a batch (`index` is its position in the batch)."""
+    index: int
+    source_path: str
+    output_path: Optional[str]
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+# progress_callback(done, total, result), called on the calling thread.
+ProgressCallback = Callable[[int, int, WatermarkResult], None]
+
+# Opened logo per worker process, keyed by (path, mtime).
+_logo_cache: Dict[Tuple[str, int], Any] = {}
+# (abs logo path, mtime, target width, opacity) -> prepared logo, most recently used last.
+_prepared_logos: "OrderedDict[Tuple[str, int, int, float], Any]" = OrderedDict()
+
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_workers = 0
+_pool_lock = threading.Lock()
+
+
+def get_image_pool(max_workers: int) -> ProcessPoolExecutor:
+    """
+    Returns the shared image-processing process pool, (re)creating it for `max_workers`.
+
+    Workers are spawned rather than forked so they never inherit the Qt threads of the GUI process.
+    """
+    global _pool, _pool_workers
+    with _pool_lock:
+        if _pool is None or _pool_workers != max_workers:
+            if _pool is not None:
+                _pool.shutdown(wait=False, cancel_futures=True)
+            _pool = ProcessPoolExecutor(
+                max_workers=max_workers, mp_context=multiprocessing.get_context("spawn")
+            )
+            _pool_workers = max_workers
+        return _pool
+
+
+def shutdown_image_pool(wait: bool = False):
+    """Stops the shared pool; with `wait`, blocks until the worker processes have exited."""
+    global _pool, _pool_workers
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(wait=wait, cancel_futures=True)
+        _pool = None
+        _pool_workers = 0
+
+
+atexit.register(shutdown_image_pool)
+
+
+# EXIF orientations that rotate the image by 90/270 degrees.
+_TRANSPOSED_ORIENTATIONS = (5, 6, 7, 8)
+
+
+def decode_image(image_path: str, max_size: Optional[Tuple[int, int]] = None, mode: Optional[str] = "RGBA"):
+    """
+    Opens an image upright (EXIF orientation applied) and converted to `mode`.
+
+    With `max_size` (a box in upright pixels), only the resolution needed to
+    fit the box is decoded: JPEGs are decoded at the nearest DCT scale
+    (Image.draft, 1/2 to 1/8) and other formats are box-reduced
+    (Image.reduce) by the largest integer factor that still covers the box.
+    The result is at least as large as the fitted size, so callers still
+    finish with their own LANCZOS resize/thumbnail.
+    """
+    from PIL import Image, ImageOps
+
+    with Image.open(image_path) as source:
+        orientation = source.getexif().get(0x0112)
+        fitted = None
+        if max_size:
+            box_width, box_height = max_size
+            if orientation in _TRANSPOSED_ORIENTATIONS:
+                box_width, box_height = box_height, box_width
+            scale = min(box_width / source.width, box_height / source.height)
+            if scale < 1:
+                fitted = (max(1, math.ceil(source.width * scale)), max(1, math.ceil(source.height * scale)))
+                if source.format == "JPEG":
+                    source.draft(source.mode, fitted)
+                if orientation in _TRANSPOSED_ORIENTATIONS:
+                    fitted = (fitted[1], fitted[0])
+        if orientation and orientation != 1:
+            image = ImageOps.exif_transpose(source)
+        else:
+            # Không cần xoay: dùng luôn ảnh đã decode, tránh một bản copy
+            source.load()
+            image = source
+
+    if fitted:
+        # draft() có thể đã giảm kích thước, nên tính hệ số theo kích thước hiện tại
+        factor = min(image.width // fitted[0], image.height // fitted[1])
+        if factor >= 2:
+            image = image.reduce(factor)
+    if mode and image.mode != mode:
+        image = image.convert(mode)
+    return image
+
+
+def load_thumbnail(image_path: str, size: Tuple[int, int], mode: Optional[str] = "RGBA"):
+    """Returns an upright image fitted (LANCZOS, aspect ratio kept) into `size`, decoded via `decode_image`."""
+    from PIL import Image
+
+    image = decode_image(image_path, size, mode)
+    image.thumbnail(size, Image.LANCZOS)
+    return image
+
+
+def get_cached_thumbnail(
+    image_path: str, size: Tuple[int, int], cache_dir: Optional[str] = THUMBNAIL_CACHE_DIR
+):
+    """
+    Returns an RGBA thumbnail of `image_path` fitted into `size`, reading it from
+    (or writing it to) the on-disk cache. Safe to call from worker threads.
+    """
+    from PIL import Image
+
+    stat = os.stat(image_path)
+    key = f"{os.path.abspath(image_path)}|{stat.st_mtime_ns}|{stat.st_size}|{size[0]}x{size[1]}"
+    cache_file = None
+    if cache_dir:
+        cache_file = os.path.join(cache_dir, f"{hashlib.sha1(key.encode('utf-8')).hexdigest()}.png")
+        try:
+            with Image.open(cache_file) as cached:
+                return cached.convert("RGBA")
+        except (OSError, ValueError):
+            pass
+
+    thumbnail = load_thumbnail(image_path, size)
+    if cache_file:
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            tmp_file = f"{cache_file}.{os.getpid()}.{threading.get_ident()}.tmp"
+            thumbnail.save(tmp_file, "PNG")
+            os.replace(tmp_file, cache_file)
+        except OSError as e:
+            logger.warning(f"Could not write thumbnail cache '{cache_file}': {e}")
+    return thumbnail
+
+
+def _load_logo(logo_path: str):
+    from PIL import Image
+
+    key = (logo_path, os.stat(logo_path).st_mtime_ns)
+    logo = _logo_cache.get(key)
+    if logo is None:
+        logo = Image.open(logo_path).convert("RGBA")
+        _logo_cache.clear()
+        _logo_cache[key] = logo
+    return logo
+
+
+def _opacity_lut(opacity: float) -> List[int]:
+    """Lookup table equivalent to Image.eval(alpha, lambda x: x * opacity)."""
+    return [min(255, max(0, round(x * opacity))) for x in range(256)]
+
+
+def prepare_logo(logo_path: str, target_width: int, opacity: float, cache_dir: Optional[str] = LOGO_CACHE_DIR):
+    """
+    Returns the logo resized (LANCZOS) to `target_width` with its alpha scaled by `opacity`.
+
+    Prepared logos are cached in memory and, unless `cache_dir` is None, as PNG
+    files keyed by (logo path, mtime, target width, opacity), so a batch whose
+    images share a width prepares the logo once.
+    """
+    from PIL import Image
+
+    logo_path = os.path.abspath(logo_path)
+    key = (logo_path, os.stat(logo_path).st_mtime_ns, target_width, round(opacity, 4))
+    logo = _prepared_logos.get(key)
+    if logo is not None:
+        _prepared_logos.move_to_end(key)
+        return logo
+
+    cache_file = None
+    if cache_dir:
+        digest = hashlib.sha1(repr(key).encode("utf-8")).hexdigest()
+        cache_file = os.path.join(cache_dir, f"{digest}.png")
+        try:
+            with Image.open(cache_file) as cached:
+                logo = cached.convert("RGBA")
+        except (OSError, ValueError):
+            logo = None
+
+    if logo is None:
+        source = _load_logo(logo_path)
+        target_height = max(1, int(source.height * (target_width / source.width)))
+        logo = source.resize((target_width, target_height), Image.LANCZOS)
+        logo.putalpha(logo.getchannel("A").point(_opacity_lut(opacity)))
+        if cache_file:
+            try:
+                os.makedirs(cache_dir, exist_ok=True)
+                tmp_file = f"{cache_file}.{os.getpid()}.tmp"
+                logo.save(tmp_file, "PNG")
+                os.replace(tmp_file, cache_file)
+            except OSError as e:
+                logger.warning(f"Could not write logo cache '{cache_file}': {e}")
+
+    _prepared_logos[key] = logo
+    while len(_prepared_logos) > PREPARED_LOGO_MEMORY_ITEMS:
+        _prepared_logos.popitem(last=False)
+    return logo
+
+
+def clear_logo_cache(cache_dir: str = LOGO_CACHE_DIR) -> int:
+    """Deletes the persisted prepared logos; returns the number of files removed."""
+    _prepared_logos.clear()
+    removed = 0
+    if not os.path.isdir(cache_dir):
+        return removed
+    for file_name in os.listdir(cache_dir):
+        try:
+            os.remove(os.path.join(cache_dir, file_name))
+            removed += 1
+        except OSError:
+            continue
+    return removed
+
+
+def _save_image(
+    image,
+    dest_img_path: str,
+    profile: ImageOutputProfile,
+    exif: Optional[bytes],
+    icc_profile: Optional[bytes],
+):
+    """Encodes one watermarked image according to the output profile."""
+    options: Dict[str, Any] = {}
+    if not profile.strip_metadata:
+        if exif:
+            options["exif"] = exif
+        if icc_profile:
+            options["icc_profile"] = icc_profile
+    if profile.format == "JPEG":
+        image = image.convert("RGB")
+        options.update(quality=profile.quality, optimize=True, progressive=True)
+    elif profile.format == "WEBP":
+        image = image.convert("RGB")
+        options.update(quality=profile.quality, method=4)
+    image.save(dest_img_path, profile.format, **options)
+
+
+def _watermark_image(
+    image_path: str,
+    logo_path: str,
+    dest_img_path: str,
+    opacity: float,
+    profile: ImageOutputProfile = ImageOutputProfile(),
+):
+    """
+    Pastes the prepared logo (30% of the image width, faded by `opacity`) at the
+    center of one image and encodes it with `profile`. The image is rotated
+    upright from its EXIF orientation and downscaled to `profile.max_edge`
+    (decoded at reduced resolution when possible) before the logo is applied.
+    """
+    from PIL import Image
+
+    max_size = (profile.max_edge, profile.max_edge) if profile.max_edge else None
+    main_image = decode_image(image_path, max_size, mode=None)
+    exif = main_image.getexif().tobytes() if not profile.strip_metadata else None
+    icc_profile = main_image.info.get("icc_profile")
+    main_image = main_image.convert("RGBA")
+    if profile.max_edge and max(main_image.size) > profile.max_edge:
+        main_image.thumbnail((profile.max_edge, profile.max_edge), Image.LANCZOS)
+    main_width, main_height = main_image.size
+
+    logo = prepare_logo(logo_path, max(1, int(main_width * LOGO_WIDTH_RATIO)), opacity)
+    position = (
+        (main_width - logo.width) // 2,
+        (main_height - logo.height) // 2,
+    )
+    main_image.paste(logo, position, logo)
+    _save_image(main_image, dest_img_path, profile, exif, icc_profile)
+
+
+def _watermark_chunk(
+    tasks: List[Tuple[int, str, str]], logo_path: str, opacity: float, profile: ImageOutputProfile
+) -> List[WatermarkResult]:
+    """Runs in a worker process (or in-process): watermarks (index, source, destination) tasks."""
+    try:
+        # The logo itself is only decoded when no prepared copy is cached.
+        os.stat(logo_path)
+    except Exception as e:
+        return [
+            WatermarkResult(index, image_path, None, f"Error opening logo file: {e}")
+            for index, image_path, _ in tasks
+        ]
+
+    results = []
+    for index, image_path, dest_img_path in tasks:
+        try:
+            _watermark_image(image_path, logo_path, dest_img_path, opacity, profile)
+            results.append(WatermarkResult(index, image_path, dest_img_path))
+        except FileNotFoundError:
+            results.append(
+                WatermarkResult(index, image_path, None, f"Image file not found: '{image_path}'.")
+            )
+        except Exception as e:
+            results.append(
+                WatermarkResult(index, image_path, None, f"Error processing image '{image_path}': {e}")
+            )
+    return results
+
+
+def watermark_images(
     image_source: List[str],
     logo_path: str,
     output_dir: str,
     output_name_prefix: str,
     opacity: float = 0.5,
-) -> List[str]:
+    max_workers: Optional[int] = None,
+    chunk_size: Optional[int] = None,
+    progress_callback: Optional[ProgressCallback] = None,
+    output_profile: Optional[ImageOutputProfile] = None,
+) -> List[WatermarkResult]:
     """
-    Inserts a logo watermark onto a list of source images and saves the results.
+    Watermarks a batch of images on a process pool.
 
-    The logo is resized proportionally to 30% of the main image's width,
-    its opacity is adjusted, and it is placed at the center of the image.
+    Images are submitted in chunks, results are returned in input order
+    (`<output_name_prefix>_<i><ext>` for image i) and failures are reported
+    per image instead of aborting the batch.
 
     Args:
         image_source: A list of file paths to the source images.
@@ -27,50 +415,102 @@ def insert_logo_to_images(
         output_dir: The destination directory to save the watermarked images.
         output_name_prefix: The file name prefix for the output images.
         opacity: The transparency level of the logo (0.0 to 1.0).
+        max_workers: Worker processes (default: all cores); 1 runs in the calling process.
+        chunk_size: Images per submitted task (default: about 4 tasks per worker).
+        progress_callback: Called as (done, total, result) after each image.
+        output_profile: Encoding of the outputs (default: full-resolution PNG).
 
     Returns:
-        A list of file paths to the newly created watermarked images.
+        One WatermarkResult per source image, in the order of `image_source`.
     """
-    new_paths: List[str] = []
     os.makedirs(output_dir, exist_ok=True)
-
-    try:
-        logo = Image.open(logo_path).convert("RGBA")
-    except Exception as e:
-        logger.error(f"Error opening logo file: {e}")
+    profile = output_profile or ImageOutputProfile()
+    tasks = [
+        (i, image_path, os.path.join(output_dir, f"{output_name_prefix}_{i}{profile.extension}"))
+        for i, image_path in enumerate(image_source)
+    ]
+    total = len(tasks)
+    if not total:
         return []
+    workers = max_workers or os.cpu_count() or 1
+    chunk_size = chunk_size or max(1, math.ceil(total / (workers * 4)))
+    chunks = [tasks[start:start + chunk_size] for start in range(0, total, chunk_size)]
+
+    results: List[Optional[WatermarkResult]] = [None] * total
+    done = 0
+
+    def collect(chunk_results: List[WatermarkResult]):
+        nonlocal done
+        for result in chunk_results:
+            results[result.index] = result
+            done += 1
+            if progress_callback:
+                progress_callback(done, total, result)
+
+    if workers == 1 or total == 1:
+        for chunk in chunks:
+            collect(_watermark_chunk(chunk, logo_path, opacity, profile))
+        return results
+
+    pool = get_image_pool(workers)
+    futures = {pool.submit(_watermark_chunk, chunk, logo_path, opacity, profile): chunk for chunk in chunks}
+    for future in as_completed(futures):
+        try:
+            collect(future.result())
+        except Exception as e:
+            if isinstance(e, BrokenProcessPool):
+                shutdown_image_pool()
+            collect([
+                WatermarkResult(index, image_path, None, f"Worker failed: {e!r}")
+                for index, image_path, _ in futures[future]
+            ])
+    return results
 
-    for i, image_path in enumerate(image_source):
-        dest_img_path = os.path.join(output_dir, f"{output_name_prefix}_{i}.png")
 
-        try:
-            main_image = Image.open(image_path).convert("RGBA")
-            main_width, main_height = main_image.size
-
-            new_logo_width = int(main_width * 0.3)
-            logo_width, logo_height = logo.size
-            new_logo_height = int(logo_height * (new_logo_width / logo_width))
-            resized_logo = logo.resize((new_logo_width, new_logo_height), Image.LANCZOS)
-
-            alpha = resized_logo.split()[-1]
-            alpha = Image.eval(alpha, lambda x: x * opacity)
-            resized_logo.putalpha(alpha)
-            position = (
-                (main_width - resized_logo.width) // 2,
-                (main_height - resized_logo.height) // 2,
-            )
-            main_image.paste(resized_logo, position, resized_logo)
-            main_image.save(dest_img_path, "PNG")
-            new_paths.append(dest_img_path)
+def insert_logo_to_images(
+    image_source: List[str],
+    logo_path: str,
+    output_dir: str,
+    output_name_prefix: str,
+    opacity: float = 0.5,
+    max_workers: Optional[int] = None,
+    progress_callback: Optional[ProgressCallback] = None,
+    output_profile: Optional[ImageOutputProfile] = None,
+) -> List[str]:
+    """
+    Inserts a logo watermark onto a list of source images and saves the results.
 
-        except FileNotFoundError:
-            logger.error(f"Image file not found: '{image_path}'. Skipping.")
-            continue
-        except Exception as e:
-            logger.error(f"Error processing image '{image_path}': {e}")
-            continue
+    The logo is resized proportionally to 30% of the main image's width,
+    its opacity is adjusted, and it is placed at the center of the image.
+    Images are processed in parallel (see `watermark_images`).
 
-    return new_paths
+    Args:
+        image_source: A list of file paths to the source images.
+        logo_path: The file path to the logo image.
+        output_dir: The destination directory to save the watermarked images.
+        output_name_prefix: The file name prefix for the output images.
+        opacity: The transparency level of the logo (0.0 to 1.0).
+        max_workers: Worker processes (default: all cores); 1 processes on the calling thread.
+        progress_callback: Called as (done, total, result) after each image.
+        output_profile: Format, quality, max size and metadata handling of the outputs.
+
+    Returns:
+        A list of file paths to the newly created watermarked images.
+    """
+    results = watermark_images(
+        image_source,
+        logo_path,
+        output_dir,
+        output_name_prefix,
+        opacity=opacity,
+        max_workers=max_workers,
+        progress_callback=progress_callback,
+        output_profile=output_profile,
+    )
+    for result in results:
+        if not result.ok:
+            logger.error(f"{result.error} Skipping.")
+    return [result.output_path for result in results if result.ok]
 
 
 def copy_source_images(
@@ -141,17 +581,54 @@ def get_images(image_folder: str) -> List[str]:
         logger.warning(f"Image directory path not found: '{image_folder}'.")
         return []
 
-    image_extensions = (".png", ".jpg", ".jpeg", ".gif", ".bmp", ".svg")
     image_files = []
 
     for file_name in os.listdir(image_folder):
-        if file_name.lower().endswith(image_extensions):
+        if file_name.lower().endswith(IMAGE_EXTENSIONS):
             full_path = os.path.join(image_folder, file_name)
             image_files.append(full_path)
 
     return sorted(image_files)
 
 
+def file_digest(file_path: str) -> str:
+    """Returns the SHA-256 hex digest of a file, read in 1 MiB chunks."""
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def scan_image_folder(
+    image_folder: str, with_hash: bool = False
+) -> Optional[Tuple[int, List[Tuple[str, int, Optional[str]]]]]:
+    """
+    Lists the images of a folder together with the folder's mtime.
+
+    Args:
+        image_folder: The directory to scan.
+        with_hash: Also compute the SHA-256 of every image (reads each file).
+
+    Returns:
+        (folder mtime in ns, [(file_name, size, hash_or_None), ...] sorted by name),
+        or None if the folder does not exist.
+    """
+    try:
+        mtime_ns = os.stat(image_folder).st_mtime_ns
+        entries = []
+        with os.scandir(image_folder) as it:
+            for entry in it:
+                if not entry.name.lower().endswith(IMAGE_EXTENSIONS) or not entry.is_file():
+                    continue
+                file_hash = file_digest(entry.path) if with_hash else None
+                entries.append((entry.name, entry.stat().st_size, file_hash))
+    except FileNotFoundError:
+        return None
+    entries.sort()
+    return mtime_ns, entries
+
+
 # --- Coordinating Function ---
 
 
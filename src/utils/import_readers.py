@@ -0,0 +1,129 @@
+# src/utils/import_readers.py
+"""
+Incremental readers for table imports, the counterpart of export_writers.
+
+Records are parsed one at a time from a binary stream, so an import needs
+memory for the current chunk only, and the stream position tells how far
+the import has got:
+
+  * csv   - csv.DictReader over the decoded lines (quoted newlines allowed)
+  * jsonl - one JSON object per line, blank lines skipped
+  * json  - a top-level JSON array, decoded element by element
+"""
+import codecs
+import csv
+import json
+from typing import Any, BinaryIO, Dict, Iterator, List
+
+IMPORT_FORMATS = ("json", "jsonl", "csv")
+READ_CHUNK_SIZE = 64 * 1024
+
+
+class ImportFormatError(ValueError):
+    """The file does not match its declared format (reported with the record number)."""
+
+
+def _iter_lines(stream: BinaryIO) -> Iterator[str]:
+    for line in stream:
+        yield line.decode("utf-8-sig") if line.startswith(codecs.BOM_UTF8) else line.decode("utf-8")
+
+
+def iter_csv_records(stream: BinaryIO) -> Iterator[Dict[str, Any]]:
+    for row in csv.DictReader(_iter_lines(stream)):
+        yield dict(row)
+
+
+def iter_jsonl_records(stream: BinaryIO) -> Iterator[Dict[str, Any]]:
+    for line_number, line in enumerate(_iter_lines(stream), 1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError as e:
+            raise ImportFormatError(f"Invalid JSON on line {line_number}: {e}") from e
+        if not isinstance(record, dict):
+            raise ImportFormatError(f"Line {line_number} is not a record.")
+        yield record
+
+
+def iter_json_array_records(stream: BinaryIO) -> Iterator[Dict[str, Any]]:
+    """Yields the elements of a top-level JSON array without loading the whole document."""
+    decoder = json.JSONDecoder()
+    text_decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    buffer = ""
+    position = 0
+    eof = False
+    started = False
+    index = 0
+
+    def fill() -> bool:
+        nonlocal buffer, position, eof
+        if eof:
+            return False
+        data = stream.read(READ_CHUNK_SIZE)
+        eof = not data
+        buffer = buffer[position:] + text_decoder.decode(data, final=eof)
+        position = 0
+        return True
+
+    def skip_whitespace() -> str:
+        nonlocal position
+        while True:
+            while position < len(buffer) and buffer[position].isspace():
+                position += 1
+            if position < len(buffer):
+                return buffer[position]
+            if not fill():
+                return ""
+
+    if skip_whitespace() != "[":
+        raise ImportFormatError("JSON file does not contain a list of records.")
+    position += 1
+    while True:
+        token = skip_whitespace()
+        if token == "]":
+            return
+        if started:
+            if token != ",":
+                raise ImportFormatError(f"Expected ',' or ']' after record {index}.")
+            position += 1
+            skip_whitespace()
+        while True:
+            try:
+                record, end = decoder.raw_decode(buffer, position)
+                # Một số (number) ở cuối buffer có thể còn bị cắt dở: đọc thêm để chắc chắn
+                if end == len(buffer) and not eof:
+                    raise ValueError("value may continue in the next chunk")
+                break
+            except ValueError as e:
+                if not fill():
+                    raise ImportFormatError(f"Invalid JSON in record {index + 1}: {e}") from e
+        position = end
+        started = True
+        index += 1
+        if not isinstance(record, dict):
+            raise ImportFormatError(f"Record {index} is not an object.")
+        yield record
+
+
+IMPORT_READERS = {
+    "json": iter_json_array_records,
+    "jsonl": iter_jsonl_records,
+    "csv": iter_csv_records,
+}
+
+
+def iter_records(stream: BinaryIO, data_format: str) -> Iterator[Dict[str, Any]]:
+    """Yields the records of `stream` (opened in binary mode) in `data_format`."""
+    return IMPORT_READERS[data_format](stream)
+
+
+def iter_chunks(records: Iterator[Dict[str, Any]], chunk_size: int) -> Iterator[List[Dict[str, Any]]]:
+    chunk: List[Dict[str, Any]] = []
+    for record in records:
+        chunk.append(record)
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
@@ -1,10 +1,12 @@
 # src/utils/proxy_handler.py
-import io, pycurl, json
+import io, json
 from typing import Dict, Optional
 from urllib.parse import urlparse
 
 
 def get_proxy(proxy_api: str) -> Optional[Dict[str, str]]:
+    import pycurl
+
     try:
         buffer = io.BytesIO()
         curl = pycurl.Curl()
@@ -0,0 +1,96 @@
+# src/utils/startup_profiler.py
+import os
+import subprocess
+import sys
+from dataclasses import dataclass
+from typing import List, Optional
+
+from src.utils.logger import Logger
+
+logger = Logger(__name__)
+
+# Passing this flag to src.main logs an import-time breakdown before the window opens.
+STARTUP_PROFILE_FLAG = "--profile-startup"
+# Heavy third-party packages that must stay out of the startup import graph.
+DEFERRED_PACKAGES = ("playwright", "undetected_playwright", "pycurl", "PIL", "fake_useragent")
+DEFAULT_TOP_N = 25
+
+
+@dataclass
+class ImportTiming:
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+def parse_importtime(output: str) -> List[ImportTiming]:
+    """
+    Parses the stderr produced by `python -X importtime`.
+
+    Lines look like `import time:       123 |        456 |   package.module`,
+    the indentation of the module name encodes its nesting depth.
+    """
+    timings: List[ImportTiming] = []
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3:
+            continue
+        try:
+            self_us = int(parts[0].strip())
+            cumulative_us = int(parts[1].strip())
+        except ValueError:
+            continue  # header line
+        raw_name = parts[2].rstrip()
+        name = raw_name.lstrip()
+        depth = (len(raw_name) - len(name) - 1) // 2
+        timings.append(ImportTiming(name, self_us, cumulative_us, max(depth, 0)))
+    return timings
+
+
+def collect_import_times(module: str = "src.app") -> List[ImportTiming]:
+    """Imports `module` in a fresh interpreter with -X importtime and returns the timings."""
+    env = dict(os.environ)
+    env.setdefault("QT_QPA_PLATFORM", "offscreen")
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=os.getcwd(),
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        logger.error(f"Import of '{module}' failed while profiling: {result.stderr.strip().splitlines()[-1:]}")
+    return parse_importtime(result.stderr)
+
+
+def format_import_report(timings: List[ImportTiming], top_n: int = DEFAULT_TOP_N) -> str:
+    """Formats the slowest imports (by cumulative time) and the deferred-package check."""
+    if not timings:
+        return "No import timings collected."
+    total_us = sum(t.self_us for t in timings)
+    lines = [
+        f"Startup imports: {len(timings)} modules, {total_us / 1000:.1f} ms total",
+        f"{'cumulative ms':>14} {'self ms':>9}  module",
+    ]
+    for timing in sorted(timings, key=lambda t: t.cumulative_us, reverse=True)[:top_n]:
+        lines.append(
+            f"{timing.cumulative_us / 1000:>14.1f} {timing.self_us / 1000:>9.1f}  "
+            f"{'  ' * timing.depth}{timing.module}"
+        )
+    loaded = {t.module.split(".")[0] for t in timings}
+    eager = [package for package in DEFERRED_PACKAGES if package in loaded]
+    if eager:
+        lines.append(f"Imported at startup but expected to be deferred: {', '.join(eager)}")
+    else:
+        lines.append("Deferred packages not imported at startup: " + ", ".join(DEFERRED_PACKAGES))
+    return "\n".join(lines)
+
+
+def log_startup_profile(module: str = "src.app", top_n: Optional[int] = None) -> List[ImportTiming]:
+    """Collects and logs the import-time breakdown of `module`."""
+    timings = collect_import_times(module)
+    logger.info("\n" + format_import_report(timings, top_n or DEFAULT_TOP_N))
+    return timings
@@ -7,16 +7,12 @@ from PyQt6.QtCore import (
     pyqtSignal,
     QPoint,
     QItemSelection,
-    QItemSelectionModel,
 )
 from PyQt6.QtGui import QAction, QShortcut, QKeySequence
 
 from src.controllers._controller_manager import Controller_Manager
 from src.models._model_manager import Model_Manager
-from src.views.utils.display_order_filter import (
-    apply_display_order_filter,
-    prune_hidden_selection,
-)
+from src.views.utils.display_order_filter import DisplayOrderProxyModel
 
 from src.my_constants import LAUNCH
 from src.views.profiles.create_new_profile_dialog import CreateNewProfileDialog
@@ -39,6 +35,7 @@ class PageProfiles(QWidget, Ui_PageProfiles):
         self.model_manager = model_manager
         self.proxy_model = self.model_manager.profile()
         self.base_model = self.proxy_model.get_source_model()
+        self.display_order_model = DisplayOrderProxyModel(self.proxy_model, self)
         self.import_export_handler = ImportExportHandler(self.controller_manager.profile_controller, self.profiles_table)
 
         self.setup_table()
@@ -48,7 +45,7 @@ class PageProfiles(QWidget, Ui_PageProfiles):
 
     
     def setup_table(self):
-        self.profiles_table.setModel(self.proxy_model)
+        self.profiles_table.setModel(self.display_order_model)
         self.profiles_table.setSortingEnabled(True)
         created_at_col_index = self.base_model.fieldIndex("created_at")
         if created_at_col_index != -1:
@@ -85,10 +82,10 @@ class PageProfiles(QWidget, Ui_PageProfiles):
             self.username_input: self.base_model.fieldIndex("username"),
             self.uid_input: self.base_model.fieldIndex("uid"),
             self.phone_number_input: self.base_model.fieldIndex("phone_number"),
-            self.note_input: self.base_model.fieldIndex("account_note"),
-            self.type_input: self.base_model.fieldIndex("account_type"),
-            self.group_input: self.base_model.fieldIndex("account_group"),
-            self.name_input: self.base_model.fieldIndex("account_name"),
+            self.note_input: self.base_model.fieldIndex("profile_note"),
+            self.type_input: self.base_model.fieldIndex("profile_type"),
+            self.group_input: self.base_model.fieldIndex("profile_group"),
+            self.name_input: self.base_model.fieldIndex("profile_name"),
         }
         for widget, col_index in filter_widgets.items():
             if col_index is None or col_index == -1:
@@ -96,12 +93,7 @@ class PageProfiles(QWidget, Ui_PageProfiles):
 
             def make_handler(c_idx):
                 def _on_text_changed(text: str):
-                    try:
-                        self.proxy_model.set_filter_column(c_idx)
-                        self.proxy_model.filter_by_text(text)
-                        prune_hidden_selection(self.profiles_table)
-                    except Exception:
-                        pass
+                    self.proxy_model.set_column_filter(c_idx, text)
 
                 return _on_text_changed
 
@@ -118,28 +110,15 @@ class PageProfiles(QWidget, Ui_PageProfiles):
                 pass
 
         if hasattr(self, "display_order_input"):
-            try:
-                def _on_display_order_changed(text: str):
-                    try:
-                        apply_display_order_filter(self.profiles_table, text)
-                        prune_hidden_selection(self.profiles_table)
-                    except Exception:
-                        pass
-
-                self.display_order_input.textChanged.connect(_on_display_order_changed)
-            except Exception:
-                pass
-        try:
-            if hasattr(self, "filter_input") and isinstance(
-                self.filter_input, QLineEdit
-            ):
-                self.filter_input.textChanged.connect(
-                    lambda text: apply_display_order_filter(
-                        self.profiles_table, text
-                    )
-                )
-        except Exception:
-            pass
+            self.display_order_input.textChanged.connect(
+                self.display_order_model.set_expression
+            )
+        if hasattr(self, "filter_input") and isinstance(
+            self.filter_input, QLineEdit
+        ):
+            self.filter_input.textChanged.connect(
+                self.display_order_model.set_expression
+            )
 
     def setup_shortcuts(self):
         create_new = QShortcut(QKeySequence("Ctrl+N"), self)
@@ -185,10 +164,8 @@ class PageProfiles(QWidget, Ui_PageProfiles):
         id_col = self.base_model.fieldIndex("id")
         if id_col == -1:
             return []
-        for proxy_index in selected_rows_indexes:
-            if self.profiles_table.isRowHidden(proxy_index.row()):
-                continue
-            source_index = self.proxy_model.mapToSource(proxy_index)
+        for view_index in selected_rows_indexes:
+            source_index = self.display_order_model.map_to_base(view_index)
             id_index = self.base_model.index(source_index.row(), id_col)
             id_value = self.base_model.data(id_index, Qt.ItemDataRole.DisplayRole)
             if id_value:
@@ -202,11 +179,9 @@ class PageProfiles(QWidget, Ui_PageProfiles):
         if id_col == -1 or uid_col == -1:
             return ids_uids_selected
 
-        for proxy_index in self.profiles_table.selectionModel().selectedRows():
+        for view_index in self.profiles_table.selectionModel().selectedRows():
             try:
-                if self.profiles_table.isRowHidden(proxy_index.row()):
-                    continue
-                source_index = self.proxy_model.mapToSource(proxy_index)
+                source_index = self.display_order_model.map_to_base(view_index)
                 id_index = self.base_model.index(source_index.row(), id_col)
                 uid_index = self.base_model.index(source_index.row(), uid_col)
                 id_value = self.base_model.data(id_index, Qt.ItemDataRole.DisplayRole)
@@ -255,29 +230,8 @@ class PageProfiles(QWidget, Ui_PageProfiles):
     def _on_selection_changed(
         self, selected: QItemSelection, deselected: QItemSelection
     ):
-        sel_model = self.profiles_table.selectionModel()
-        hidden_to_deselect = []
-        for proxy_index in sel_model.selectedRows():
-            try:
-                if self.profiles_table.isRowHidden(proxy_index.row()):
-                    hidden_to_deselect.append(proxy_index)
-            except Exception:
-                pass
-
-        if hidden_to_deselect:
-            for idx in hidden_to_deselect:
-                sel_model.select(
-                    idx,
-                    QItemSelectionModel.SelectionFlag.Deselect
-                    | QItemSelectionModel.SelectionFlag.Rows,
-                )
-        currently_selected_rows_indexes = self.profiles_table.selectionModel().selectedRows()
-        selected_row_keys = set()
-        for index in currently_selected_rows_indexes:
-            row_number = index.row()
-            selected_row_keys.add(row_number)
-
-        self.status_msg.emit(f"Selected: {len(selected_row_keys)}")
+        selected_rows = self.profiles_table.selectionModel().selectedRows()
+        self.status_msg.emit(f"Selected: {len(selected_rows)}")
         
     
     @pyqtSlot()
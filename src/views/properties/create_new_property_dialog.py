@@ -1,11 +1,12 @@
 # src/views/properties/create_new_property_dialog.py
 from typing import List
 from PyQt6.QtWidgets import QDialog, QMessageBox
-from PyQt6.QtCore import Qt, pyqtSignal
-from PyQt6.QtGui import QDragEnterEvent, QDropEvent, QPixmap
+from PyQt6.QtCore import Qt, pyqtSignal, pyqtSlot
+from PyQt6.QtGui import QDragEnterEvent, QDropEvent, QPixmap, QImage
 
 from src.ui.dialog_properties_ui import Ui_Dialog_Properties
 from src.utils.validators import FloatValidator
+from src.views.utils.thumbnail_loader import shared_thumbnail_loader
 from src.my_constants import (
     PROPERTY_PRODUCT__STATUS_OPTIONS,
     PROPERTY_PRODUCT__TRANSACTION_OPTIONS,
@@ -27,6 +28,10 @@ class CreateNewPropertyDialog(QDialog, Ui_Dialog_Properties):
         self.setWindowTitle("Create new property".title())
         self.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
         self.setModal(False)
+        self.preview_image_path = None
+        self.thumbnail_loader = shared_thumbnail_loader()
+        self.thumbnail_loader.thumbnail_ready.connect(self._on_thumbnail_ready)
+        self.thumbnail_loader.thumbnail_failed.connect(self._on_thumbnail_failed)
         self.setup_data()
         self.setup_validator()
         self.setup_image_drop()
@@ -90,17 +95,24 @@ class CreateNewPropertyDialog(QDialog, Ui_Dialog_Properties):
             self.image_input.setText("No images dropped.")
 
     def _display_image(self, image_path):
-        pixmap = QPixmap(image_path)
-        if not pixmap.isNull():
-            self.image_input.setPixmap(
-                pixmap.scaled(
-                    self.image_input.size(),
-                    Qt.AspectRatioMode.KeepAspectRatio,
-                    Qt.TransformationMode.SmoothTransformation,
-                )
-            )
-        else:
-            self.image_input.setText("Failed to load image.")
+        # Thumbnail được decode (và cache) ở worker thread, dialog không bị treo
+        self.preview_image_path = image_path
+        self.image_input.setText("Loading image...")
+        self.thumbnail_loader.request(
+            image_path, (self.image_input.width(), self.image_input.height())
+        )
+
+    @pyqtSlot(str, tuple, QImage)
+    def _on_thumbnail_ready(self, image_path: str, size: tuple, image: QImage):
+        if image_path != self.preview_image_path:
+            return
+        self.image_input.setPixmap(QPixmap.fromImage(image))
+
+    @pyqtSlot(str, tuple, str)
+    def _on_thumbnail_failed(self, image_path: str, size: tuple, error_message: str):
+        if image_path != self.preview_image_path:
+            return
+        self.image_input.setText("Failed to load image.")
 
     def accept(self):
         area = float(
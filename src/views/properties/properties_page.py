@@ -5,21 +5,19 @@ from PyQt6.QtCore import (
     Qt,
     pyqtSlot,
     QPoint,
-    QItemSelection,
-    QItemSelectionModel,
+    QTimer,
 )
 from PyQt6.QtGui import QAction, QShortcut, QKeySequence
 
 from src.controllers._controller_manager import Controller_Manager
 from src.models._model_manager import Model_Manager
-from src.views.utils.display_order_filter import (
-    apply_display_order_filter,
-    prune_hidden_selection,
-)
 from src.views.utils.import_export_handler import ImportExportHandler
 
 from src.ui.page_properties_ui import Ui_PageProperties
 
+# Gom nhiều thay đổi trạng thái job ảnh liên tiếp thành một lần tải lại bảng
+IMAGE_STATE_RELOAD_MS = 500
+
 class PageProperties(QWidget, Ui_PageProperties):
     def __init__(self, controller_manager: Controller_Manager, model_manager: Model_Manager, parent = None):
         super(PageProperties, self).__init__(parent=None)
@@ -52,9 +50,6 @@ class PageProperties(QWidget, Ui_PageProperties):
         self.properties_table.setEditTriggers(
             self.properties_table.EditTrigger.NoEditTriggers
         )
-        self.properties_table.selectionModel().selectionChanged.connect(
-            self._on_selection_changed
-        )
         self.properties_table.setContextMenuPolicy(
             Qt.ContextMenuPolicy.CustomContextMenu
         )
@@ -64,15 +59,17 @@ class PageProperties(QWidget, Ui_PageProperties):
     
     def display_table_columns(self):
         columns_to_display = [
-            "uid",
-            "username",
-            "password",
-            "two_fa",
-            "profile_note",
-            "profile_type",
-            "profile_group",
-            "profile_name",
+            "pid",
+            "status",
+            "transaction_type",
+            "ward",
+            "street",
+            "category",
+            "area",
+            "price",
+            "unit",
             "created_at",
+            "image_state",
         ]
 
         for col in range(self.base_model.columnCount()):
@@ -91,8 +88,6 @@ class PageProperties(QWidget, Ui_PageProperties):
         if id_col == -1:
             return []
         for proxy_index in selected_rows_indexes:
-            if self.properties_table.isRowHidden(proxy_index.row()):
-                continue
             source_index = self.proxy_model.mapToSource(proxy_index)
             id_index = self.base_model.index(source_index.row(), id_col)
             id_value = self.base_model.data(id_index, Qt.ItemDataRole.DisplayRole)
@@ -115,6 +110,7 @@ class PageProperties(QWidget, Ui_PageProperties):
         change_to_live = QAction("Change to live", self)
         change_to_dead = QAction("Change to dead", self)
         update = QAction("Update", self)
+        retry_images = QAction("Retry failed images", self)
         delete = QAction("Delete", self)
         menu.addAction(launch_as_desktop)
         menu.addAction(launch_as_mobile)
@@ -122,6 +118,7 @@ class PageProperties(QWidget, Ui_PageProperties):
         menu.addAction(change_to_live)
         menu.addAction(change_to_dead)
         menu.addAction(update)
+        menu.addAction(retry_images)
         menu.addAction(delete)
         launch_as_desktop.triggered.connect(self._on_launch_as_desktop)
         launch_as_mobile.triggered.connect(self._on_launch_as_mobile)
@@ -129,30 +126,10 @@ class PageProperties(QWidget, Ui_PageProperties):
         change_to_live.triggered.connect(self._on_change_to_live)
         change_to_dead.triggered.connect(self._on_change_to_dead)
         update.triggered.connect(self._on_update)
+        retry_images.triggered.connect(self._on_retry_failed_images)
         delete.triggered.connect(self._on_delete)
         menu.popup(global_pos)
     
-    @pyqtSlot(QItemSelection, QItemSelection)
-    def _on_selection_changed(
-        self, selected: QItemSelection, deselected: QItemSelection
-    ):
-        sel_model = self.properties_table.selectionModel()
-        hidden_to_deselect = []
-        for proxy_index in sel_model.selectedRows():
-            try:
-                if self.properties_table.isRowHidden(proxy_index.row()):
-                    hidden_to_deselect.append(proxy_index)
-            except Exception:
-                pass
-
-        if hidden_to_deselect:
-            for idx in hidden_to_deselect:
-                sel_model.select(
-                    idx,
-                    QItemSelectionModel.SelectionFlag.Deselect
-                    | QItemSelectionModel.SelectionFlag.Rows,
-                )
-   
     def setup_connections(self):
         self.action_create_btn.clicked.connect(self._on_create_btn_clicked)
         self.action_import_btn.clicked.connect(self._handle_import)
@@ -160,6 +137,14 @@ class PageProperties(QWidget, Ui_PageProperties):
         self.action_default_btn.clicked.connect(self._on_default_btn_clicked)
         self.action_random_btn.clicked.connect(self._on_random_btn_clicked)
         self.action_rewrite_by_ai_btn.clicked.connect(self._on_rewrite_by_ai_btn_clicked)
+
+        self._image_state_timer = QTimer(self)
+        self._image_state_timer.setSingleShot(True)
+        self._image_state_timer.setInterval(IMAGE_STATE_RELOAD_MS)
+        self._image_state_timer.timeout.connect(self.base_model.reload_db)
+        self.controller_manager.image_job_controller.job_state_changed.connect(
+            self._on_image_job_state_changed
+        )
     
     def setup_filters(self):pass
     def setup_shortcuts(self):
@@ -178,6 +163,15 @@ class PageProperties(QWidget, Ui_PageProperties):
         _export.activated.connect(self._handle_export)
 
 
+    @pyqtSlot(str, str)
+    def _on_image_job_state_changed(self, product_id: str, state: str):
+        self._image_state_timer.start()
+
+    @pyqtSlot()
+    def _on_retry_failed_images(self):
+        self.controller_manager.image_job_controller.retry_failed()
+        self._image_state_timer.start()
+
     @pyqtSlot()
     def _on_delete(self): pass
     @pyqtSlot()
@@ -8,10 +8,12 @@ from PyQt6.QtCore import (
     Qt,
     pyqtSlot,
     QUrl,
+    QSize,
 )
-from PyQt6.QtGui import QDragEnterEvent
+from PyQt6.QtGui import QDragEnterEvent, QIcon, QImage, QPixmap
 
 from src.ui.robot_action_ui import Ui_RobotAction
+from src.views.utils.thumbnail_loader import shared_thumbnail_loader
 
 from src.my_constants import (
     ROBOT_ACTION_OPTIONS,
@@ -29,6 +31,8 @@ from src.my_constants import (
     GET_COOKIES,
 )
 
+IMAGE_ICON_SIZE = 64
+
 ACTION_OPTIONS = {
     "random": "random pid",
     "pid": "pid",
@@ -44,6 +48,8 @@ class RobotAction(QWidget, Ui_RobotAction):
         self.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
 
         self.image_paths: List[str] = []
+        self.thumbnail_loader = shared_thumbnail_loader()
+        self.thumbnail_loader.thumbnail_ready.connect(self._on_thumbnail_ready)
         self.setup_UI()
         self.setup_data()
         self.setup_conections()
@@ -61,6 +67,7 @@ class RobotAction(QWidget, Ui_RobotAction):
         self.product_title_input.setText("")
         self.product_description_input.setPlainText("")
         self.product_images_list.clear()
+        self.product_images_list.setIconSize(QSize(IMAGE_ICON_SIZE, IMAGE_ICON_SIZE))
 
     def setup_data(self):
         self.action_name.clear()
@@ -138,9 +145,8 @@ class RobotAction(QWidget, Ui_RobotAction):
             self.image_paths = image_paths
             # populate the product images list widget
             try:
-                self.product_images_list.clear()
                 self.product_images_list.setVisible(True)
-                self.product_images_list.addItems(self.image_paths)
+                self.show_image_list(self.image_paths)
             except Exception:
                 pass
         event.acceptProposedAction()
@@ -159,9 +165,22 @@ class RobotAction(QWidget, Ui_RobotAction):
         if files:
             # store selected paths and update list widget
             self.image_paths = files
-            self.product_images_list.clear()
             self.product_images_list.setVisible(True)
-            self.product_images_list.addItems(self.image_paths)
+            self.show_image_list(self.image_paths)
+
+    def show_image_list(self, image_paths: List[str]):
+        """Lists the images at once; their thumbnails are filled in as the loader delivers them."""
+        self.product_images_list.clear()
+        self.product_images_list.addItems(image_paths)
+        for image_path in image_paths:
+            self.thumbnail_loader.request(image_path, (IMAGE_ICON_SIZE, IMAGE_ICON_SIZE))
+
+    @pyqtSlot(str, tuple, QImage)
+    def _on_thumbnail_ready(self, image_path: str, size: tuple, image: QImage):
+        if size != (IMAGE_ICON_SIZE, IMAGE_ICON_SIZE):
+            return
+        for item in self.product_images_list.findItems(image_path, Qt.MatchFlag.MatchExactly):
+            item.setIcon(QIcon(QPixmap.fromImage(image)))
 
     @pyqtSlot(int)
     def on_name_option_changed(self, idx: int):
@@ -7,7 +7,6 @@ from PyQt6.QtCore import (
     pyqtSignal,
     QPoint,
     QItemSelection,
-    QItemSelectionModel,
 )
 from PyQt6.QtGui import QAction, QShortcut, QKeySequence, QMouseEvent
 
@@ -15,10 +14,7 @@ from src.my_constants import SETTING_NAME_OPTIONS, ROBOT_ACTION_OPTIONS
 from src.my_types import Setting_Type
 from src.controllers._controller_manager import Controller_Manager
 from src.models._model_manager import Model_Manager
-from src.views.utils.display_order_filter import (
-    apply_display_order_filter,
-    prune_hidden_selection,
-)
+from src.views.utils.display_order_filter import DisplayOrderProxyModel
 from src.ui.page_robot_ui import Ui_PageFacebookRobot
 from src.views.robot.robot_action import RobotAction
 from src.views.robot.robot_run_dialog import RobotRun
@@ -37,6 +33,7 @@ class PageRobot(QWidget, Ui_PageFacebookRobot):
 
         self.proxy_model = self.model_manager.profile()
         self.base_model = self.proxy_model.get_source_model()
+        self.display_order_model = DisplayOrderProxyModel(self.proxy_model, self)
 
         self.dict_robot_tasks: Dict[str, Any] = {}
         self.tasks = []
@@ -49,7 +46,7 @@ class PageRobot(QWidget, Ui_PageFacebookRobot):
         self.results_container.setHidden(True)
 
     def setup_table(self):
-        self.profiles_table.setModel(self.proxy_model)
+        self.profiles_table.setModel(self.display_order_model)
         self.profiles_table.setSortingEnabled(True)
         created_at_col_index = self.base_model.fieldIndex("created_at")
         if created_at_col_index != -1:
@@ -80,10 +77,10 @@ class PageRobot(QWidget, Ui_PageFacebookRobot):
         filter_widgets = {
             self.username_input: self.base_model.fieldIndex("username"),
             self.uid_input: self.base_model.fieldIndex("uid"),
-            self.note_input: self.base_model.fieldIndex("account_note"),
-            self.type_input: self.base_model.fieldIndex("account_type"),
-            self.group_input: self.base_model.fieldIndex("account_group"),
-            self.name_input: self.base_model.fieldIndex("account_name"),
+            self.note_input: self.base_model.fieldIndex("profile_note"),
+            self.type_input: self.base_model.fieldIndex("profile_type"),
+            self.group_input: self.base_model.fieldIndex("profile_group"),
+            self.name_input: self.base_model.fieldIndex("profile_name"),
         }
         for widget, col_index in filter_widgets.items():
             if col_index is None or col_index == -1:
@@ -91,12 +88,7 @@ class PageRobot(QWidget, Ui_PageFacebookRobot):
 
             def make_handler(c_idx):
                 def _on_text_changed(text: str):
-                    try:
-                        self.proxy_model.set_filter_column(c_idx)
-                        self.proxy_model.filter_by_text(text)
-                        prune_hidden_selection(self.profiles_table)
-                    except Exception:
-                        pass
+                    self.proxy_model.set_column_filter(c_idx, text)
 
                 return _on_text_changed
 
@@ -114,29 +106,13 @@ class PageRobot(QWidget, Ui_PageFacebookRobot):
                 pass
 
         if hasattr(self, "display_order_input"):
-            try:
-                def _on_display_order_changed(text: str):
-                    try:
-                        apply_display_order_filter(self.profiles_table, text)
-                        prune_hidden_selection(self.profiles_table)
-                    except Exception:
-                        pass
-
-                self.display_order_input.textChanged.connect(
-                    _on_display_order_changed)
-            except Exception:
-                pass
-        try:
-            if hasattr(self, "filter_input") and isinstance(
-                self.filter_input, QLineEdit
-            ):
-                self.filter_input.textChanged.connect(
-                    lambda text: apply_display_order_filter(
-                        self.profiles_table, text
-                    )
-                )
-        except Exception:
-            pass
+            self.display_order_input.textChanged.connect(
+                self.display_order_model.set_expression)
+        if hasattr(self, "filter_input") and isinstance(
+            self.filter_input, QLineEdit
+        ):
+            self.filter_input.textChanged.connect(
+                self.display_order_model.set_expression)
 
     def setup_shortcuts(self):
         reload = QShortcut(QKeySequence(Qt.Modifier.CTRL | Qt.Key.Key_R), self)
@@ -164,10 +140,8 @@ class PageRobot(QWidget, Ui_PageFacebookRobot):
         id_col = self.base_model.fieldIndex("id")
         if id_col == -1:
             return []
-        for proxy_index in selected_rows_indexes:
-            if self.profiles_table.isRowHidden(proxy_index.row()):
-                continue
-            source_index = self.proxy_model.mapToSource(proxy_index)
+        for view_index in selected_rows_indexes:
+            source_index = self.display_order_model.map_to_base(view_index)
             id_index = self.base_model.index(source_index.row(), id_col)
             id_value = self.base_model.data(
                 id_index, Qt.ItemDataRole.DisplayRole)
@@ -182,11 +156,9 @@ class PageRobot(QWidget, Ui_PageFacebookRobot):
         if id_col == -1 or uid_col == -1:
             return ids_uids_selected
 
-        for proxy_index in self.profiles_table.selectionModel().selectedRows():
+        for view_index in self.profiles_table.selectionModel().selectedRows():
             try:
-                if self.profiles_table.isRowHidden(proxy_index.row()):
-                    continue
-                source_index = self.proxy_model.mapToSource(proxy_index)
+                source_index = self.display_order_model.map_to_base(view_index)
                 id_index = self.base_model.index(source_index.row(), id_col)
                 uid_index = self.base_model.index(source_index.row(), uid_col)
                 id_value = self.base_model.data(
@@ -254,29 +226,8 @@ class PageRobot(QWidget, Ui_PageFacebookRobot):
     def _on_selection_changed(
         self, selected: QItemSelection, deselected: QItemSelection
     ):
-        sel_model = self.profiles_table.selectionModel()
-        hidden_to_deselect = []
-        for proxy_index in sel_model.selectedRows():
-            try:
-                if self.profiles_table.isRowHidden(proxy_index.row()):
-                    hidden_to_deselect.append(proxy_index)
-            except Exception:
-                pass
-
-        if hidden_to_deselect:
-            for idx in hidden_to_deselect:
-                sel_model.select(
-                    idx,
-                    QItemSelectionModel.SelectionFlag.Deselect
-                    | QItemSelectionModel.SelectionFlag.Rows,
-                )
-        currently_selected_rows_indexes = self.profiles_table.selectionModel().selectedRows()
-        selected_row_keys = set()
-        for index in currently_selected_rows_indexes:
-            row_number = index.row()
-            selected_row_keys.add(row_number)
-
-        self.status_msg.emit(f"Selected: {len(selected_row_keys)}")
+        selected_rows = self.profiles_table.selectionModel().selectedRows()
+        self.status_msg.emit(f"Selected: {len(selected_rows)}")
 
     @pyqtSlot()
     def _on_add_action_clicked(self):
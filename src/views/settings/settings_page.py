@@ -1,5 +1,5 @@
 # src/views/settings/settings_page.py
-from PyQt6.QtWidgets import QWidget, QMenu, QFileDialog
+from PyQt6.QtWidgets import QWidget, QMenu, QFileDialog, QInputDialog
 from PyQt6.QtCore import (
     Qt,
     pyqtSlot,
@@ -20,6 +20,19 @@ PROFILE_OPTION = "profile_container_dir"
 IMAGE_OPTION = "image_container_dir"
 LOGO_OPTION = "logo_file"
 PROXY_OPTION = "proxy"
+IMAGE_OUTPUT_FORMAT_OPTION = "image_output_format"
+IMAGE_OUTPUT_QUALITY_OPTION = "image_output_quality"
+IMAGE_OUTPUT_MAX_EDGE_OPTION = "image_output_max_edge"
+IMAGE_OUTPUT_STRIP_METADATA_OPTION = "image_output_strip_metadata"
+# Giá trị gợi ý cho các setting dạng lựa chọn
+CHOICE_OPTIONS = {
+    IMAGE_OUTPUT_FORMAT_OPTION: ["JPEG", "WEBP", "PNG"],
+    IMAGE_OUTPUT_STRIP_METADATA_OPTION: ["true", "false"],
+}
+PLACEHOLDERS = {
+    IMAGE_OUTPUT_QUALITY_OPTION: "e.g. 85",
+    IMAGE_OUTPUT_MAX_EDGE_OPTION: "e.g. 2048 (0 = original size)",
+}
 
 class PageSettings(QWidget, Ui_PageSettings):
     def __init__(self, controller_manager: Controller_Manager, model_manager:Model_Manager, parent = None):
@@ -138,6 +151,17 @@ class PageSettings(QWidget, Ui_PageSettings):
                 if dialog.exec():
                     selected_file = dialog.selectedFiles()[0]
                     self.setting_value.setText(selected_file)
+            elif self.current_setting_option in CHOICE_OPTIONS:
+                value, ok = QInputDialog.getItem(
+                    self,
+                    "Select value",
+                    SETTING_NAME_OPTIONS.get(self.current_setting_option),
+                    CHOICE_OPTIONS[self.current_setting_option],
+                    0,
+                    False,
+                )
+                if ok:
+                    self.setting_value.setText(value)
             else:
                 return
 
@@ -197,7 +221,9 @@ class PageSettings(QWidget, Ui_PageSettings):
             self.setting_is_selected.setChecked(True)
         self.current_setting_option = self.setting_option.currentData(Qt.ItemDataRole.UserRole)
         self.setting_input.setTitle(f"Add new {SETTING_NAME_OPTIONS.get(self.current_setting_option)}")
-        self.setting_value.setPlaceholderText("Double click to select")
+        self.setting_value.setPlaceholderText(
+            PLACEHOLDERS.get(self.current_setting_option, "Double click to select")
+        )
 
         if self.base_model and self.current_setting_option:
             filter_string = f"name = '{self.current_setting_option}'"
@@ -1,8 +1,13 @@
 # src/views/utils/display_order_filter.py
 import re
 from typing import Optional, Tuple
-from PyQt6.QtCore import QItemSelectionModel
-from PyQt6.QtWidgets import QTableView
+from PyQt6.QtCore import (
+    Qt,
+    QAbstractItemModel,
+    QAbstractProxyModel,
+    QModelIndex,
+    QSortFilterProxyModel,
+)
 
 # Regex used by both pages
 _MODULO_RE = re.compile(r"^(?P<op>==|!=|>=|<=|>|<)?(?P<mod>%?)(?P<num>\d+)$")
@@ -63,56 +68,49 @@ def _eval_index_filter(op: str, mode: str, n: int, stt: int) -> bool:
         return False
 
 
-def apply_display_order_filter(table_view: QTableView, text: str) -> None:
-    """Apply display-order filter expression to a QTableView.
+class DisplayOrderProxyModel(QSortFilterProxyModel):
+    """Filters rows by their 1-based display position (STT).
 
-    This function operates on the model currently set on the view (proxy model),
-    so row indexes are in view/proxy space (reflect current sorting).
-    It hides rows that do not satisfy the expression using `setRowHidden`.
+    Sits on top of the page's proxy model, whose rows are already filtered and
+    sorted, so the display position of a source row is simply `source_row + 1`.
+    The expression is parsed once in `set_expression`; the view only ever sees
+    accepted rows, so selections never contain filtered-out rows.
+    Sorting requests are forwarded to the underlying proxy.
     """
-    parsed = parse_filter_expr(text)
-    model = table_view.model()
-    if model is None:
-        return
-    row_count = model.rowCount()
 
-    if parsed is None:
-        # show all
-        for r in range(row_count):
-            table_view.setRowHidden(r, False)
-        return
-
-    op, mode, n = parsed
-    for proxy_row in range(row_count):
-        stt = proxy_row + 1
-        keep = _eval_index_filter(op, mode, n, stt)
-        table_view.setRowHidden(proxy_row, not keep)
-
-
-def prune_hidden_selection(table_view: QTableView) -> None:
-    """Deselect any selected rows that are currently hidden in the view.
-
-    Use this after selection changes (or before acting on selection) to ensure
-    hidden rows are not mistakenly treated as selected.
-    """
-    sel_model = table_view.selectionModel()
-    if sel_model is None:
-        return
-    to_deselect = []
-    for proxy_index in sel_model.selectedRows():
-        try:
-            if table_view.isRowHidden(proxy_index.row()):
-                to_deselect.append(proxy_index)
-        except Exception:
-            # ignore any error checking row visibility
-            pass
-
-    if not to_deselect:
-        return
-
-    for idx in to_deselect:
-        sel_model.select(
-            idx,
-            QItemSelectionModel.SelectionFlag.Deselect
-            | QItemSelectionModel.SelectionFlag.Rows,
-        )
+    def __init__(self, source_model: QAbstractItemModel, parent=None):
+        super().__init__(parent)
+        self._parsed: Optional[Tuple[str, str, int]] = None
+        self.setSourceModel(source_model)
+        # Inserting/removing rows shifts the display position of every row after them.
+        source_model.rowsInserted.connect(self._on_source_rows_moved)
+        source_model.rowsRemoved.connect(self._on_source_rows_moved)
+
+    def set_expression(self, text: str) -> None:
+        """Parse and apply a display-order expression such as '==%3' or '>=10'."""
+        parsed = parse_filter_expr(text)
+        if parsed == self._parsed:
+            return
+        self._parsed = parsed
+        self.invalidateRowsFilter()
+
+    def filterAcceptsRow(self, source_row: int, source_parent: QModelIndex) -> bool:
+        if self._parsed is None:
+            return True
+        op, mode, n = self._parsed
+        return _eval_index_filter(op, mode, n, source_row + 1)
+
+    def sort(self, column: int, order: Qt.SortOrder = Qt.SortOrder.AscendingOrder):
+        self.sourceModel().sort(column, order)
+
+    def map_to_base(self, index: QModelIndex) -> QModelIndex:
+        """Map a view index down through every proxy layer to the base (SQL) model."""
+        model = self
+        while isinstance(model, QAbstractProxyModel) and index.isValid():
+            index = model.mapToSource(index)
+            model = model.sourceModel()
+        return index
+
+    def _on_source_rows_moved(self, *args):
+        if self._parsed is not None:
+            self.invalidateRowsFilter()
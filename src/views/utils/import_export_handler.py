@@ -1,14 +1,39 @@
 # src/views/utils/export_import_handler.py
 import os
 from typing import Union
-from PyQt6.QtWidgets import QFileDialog, QMessageBox, QTableView
+from PyQt6.QtCore import Qt
+from PyQt6.QtWidgets import QFileDialog, QMessageBox, QProgressDialog, QTableView
 from src.utils.logger import Logger
+from src.utils.export_writers import EXPORT_FORMATS
+from src.utils.file_codecs import split_extension, zstd_available
+from src.my_types import ImportResult_Type
+from src.controllers.import_task import ImportWorker
 from src.controllers.misc_product_controller import MiscProduct_Controller
 from src.controllers.profile_controller import Profile_Controller
 from src.controllers.property_product_controller import PropertyProduct_Controller
 from src.controllers.property_template_controller import PropertyTemplate_Controller
 from src.controllers.setting_controller import Setting_Controller
 
+# Độ phân giải của thanh tiến trình (theo số byte đã đọc)
+PROGRESS_STEPS = 1000
+IMPORT_FILTERS = [
+    "All supported files (*.json *.jsonl *.csv *.gz *.zst)",
+    "JSON file (*.json)",
+    "JSON Lines file (*.jsonl *.jsonl.gz *.jsonl.zst)",
+    "CSV File (*.csv *.csv.gz *.csv.zst)",
+]
+
+
+def export_filters():
+    """Save dialog filters; compressed formats first (profile exports are large)."""
+    filters = [
+        "Compressed CSV Files (*.csv.gz)",
+        "Compressed JSON Lines Files (*.jsonl.gz)",
+    ]
+    if zstd_available():
+        filters += ["Zstd CSV Files (*.csv.zst)", "Zstd JSON Lines Files (*.jsonl.zst)"]
+    return filters + ["CSV Files (*.csv)", "JSON Lines Files (*.jsonl)", "JSON Files (*.json)"]
+
 class ImportExportHandler:
     def __init__(self, controller: Union[MiscProduct_Controller, Profile_Controller, PropertyProduct_Controller, PropertyTemplate_Controller, Setting_Controller], table_view: QTableView):
         self.controller = controller
@@ -19,30 +44,18 @@ class ImportExportHandler:
         file_path, _ = QFileDialog.getOpenFileName(
             self.table_view,
             "Import data", "",
-            "JSON file (*.json);; CSV File (*.csv)"
+            ";;".join(IMPORT_FILTERS),
         )
         if file_path:
-            file_format = os.path.splitext(file_path)[1].lstrip(".").lower()
-            if file_format not in ["json", "csv"]:
-                QMessageBox.critical(
-                    self.table_view,
-                    "Error",
-                    "Unsupported file format. Use .json or .csv.",
-                )
+            file_format = self._file_format(file_path)
+            if not file_format:
                 return
             try:
-                if self.controller.import_data(file_path, file_format):
-                    QMessageBox.information(
-                        self.table_view,
-                        "Success",
-                        f"Data imported successfully.",
-                    )
-                else:
-                    QMessageBox.critical(
-                        self.table_view,
-                        "Error",
-                        f"Failed to import data. Check logs for details.",
-                    )
+                worker, error_msg = self.controller.start_import(file_path, file_format)
+                if worker is None:
+                    QMessageBox.critical(self.table_view, "Error", f"Failed to import data: {error_msg}")
+                    return
+                self._show_import_progress(worker, file_path)
             except Exception as e:
                 self.logger.error(
                     f"Critical error during import: {e}"
@@ -52,32 +65,88 @@ class ImportExportHandler:
                     "Fatal Error",
                     f"A critical error occurred during import: {e}",
                 )
-    
+
+    def _show_import_progress(self, worker: ImportWorker, file_path: str):
+        """Shows the progress of a background import; Cancel stops it after the current chunk."""
+        dialog = QProgressDialog(
+            f"Importing {os.path.basename(file_path)}...", "Cancel", 0, PROGRESS_STEPS, self.table_view
+        )
+        dialog.setWindowTitle("Import data")
+        dialog.setWindowModality(Qt.WindowModality.WindowModal)
+        dialog.setMinimumDuration(0)
+        dialog.setAutoClose(False)
+        dialog.setAutoReset(False)
+        dialog.canceled.connect(worker.cancel)
+
+        def on_progress(rows_imported: int, bytes_read: int, total_bytes: int):
+            if total_bytes:
+                dialog.setValue(min(PROGRESS_STEPS, bytes_read * PROGRESS_STEPS // total_bytes))
+            dialog.setLabelText(f"Importing {os.path.basename(file_path)}... {rows_imported} row(s) imported.")
+
+        def on_finished(result: ImportResult_Type):
+            dialog.canceled.disconnect(worker.cancel)
+            dialog.close()
+            dialog.deleteLater()
+            self._reload_table()
+            summary = f"{result.rows_imported} row(s) imported"
+            if result.rows_invalid or result.rows_failed:
+                summary += f", {result.rows_invalid} invalid and {result.rows_failed} failed (see logs)"
+            if result.error:
+                QMessageBox.critical(self.table_view, "Error", f"{result.error}\n{summary}.")
+            elif result.cancelled:
+                QMessageBox.warning(self.table_view, "Import cancelled", f"Import cancelled: {summary}.")
+            else:
+                QMessageBox.information(self.table_view, "Success", f"Data imported successfully: {summary}.")
+
+        worker.signals.progress.connect(on_progress)
+        worker.signals.finished.connect(on_finished)
+        dialog.show()
+
+    def _file_format(self, file_path: str) -> str:
+        """Data format of `file_path` from its extension (the codec is picked by the service), or "" after an error."""
+        file_format, codec = split_extension(file_path)
+        if file_format not in EXPORT_FORMATS:
+            QMessageBox.critical(
+                self.table_view,
+                "Error",
+                "Unsupported file format. Use .json, .jsonl or .csv, optionally compressed (.gz, .zst).",
+            )
+            return ""
+        if codec == "zstd" and not zstd_available():
+            QMessageBox.critical(
+                self.table_view,
+                "Error",
+                "zstd support is not available. Install the 'zstandard' package or use .gz.",
+            )
+            return ""
+        return file_format
+
+    def _reload_table(self):
+        model = self.table_view.model()
+        if hasattr(model, "get_source_model"):
+            model.get_source_model().reload_db()
+
     def handleExport(self):
         """Handles the dialog and calls the Controller to export data."""
-        default_file_name = f"untitled_export.csv"
+        default_file_name = f"untitled_export.csv.gz"
         file_path, _ = QFileDialog.getSaveFileName(
             self.table_view,
             "Export Data",
             default_file_name,
-            "CSV Files (*.csv);;JSON Files (*.json)",
+            ";;".join(export_filters()),
         )
         if file_path:
-            file_format = os.path.splitext(file_path)[1].lstrip(".").lower()
-            if file_format not in ["json", "csv"]:
-                QMessageBox.critical(
-                    self.table_view,
-                    "Error",
-                    "Unsupported file format. Use .json or .csv.",
-                )
+            file_format = self._file_format(file_path)
+            if not file_format:
                 return
 
             try:
                 # Call the export_data method on the controller
-                if self.controller.export_data(
+                success, _ = self.controller.export_data(
                     file_path=file_path,
                     data_format=file_format,
-                ):
+                )
+                if success:
                     QMessageBox.information(
                         self.table_view,
                         "Success",
@@ -0,0 +1,125 @@
+# src/views/utils/thumbnail_loader.py
+import os
+from typing import Dict, Optional, Set, Tuple
+
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal, pyqtSlot
+from PyQt6.QtGui import QImage
+
+from src.utils.image_handlers import get_cached_thumbnail
+from src.utils.logger import Logger
+
+# Decoding is CPU/IO bound; a couple of threads keep the GUI responsive without
+# competing with the robot workers on the global pool.
+THUMBNAIL_THREADS = 2
+THUMBNAIL_MEMORY_ITEMS = 256
+
+# (st_mtime_ns, st_size) of the source file, as in the disk cache key
+FileStamp = Tuple[int, int]
+
+
+class ThumbnailWorkerSignals(QObject):
+    """
+    loaded: Emits image_path, (width, height), file stamp, QImage when the thumbnail is ready.
+    failed: Emits image_path, (width, height), file stamp, error_message.
+    """
+
+    loaded = pyqtSignal(str, tuple, tuple, QImage)
+    failed = pyqtSignal(str, tuple, tuple, str)
+
+
+class ThumbnailWorker(QRunnable):
+    """Decodes (or reads from the disk cache) one thumbnail off the GUI thread."""
+
+    def __init__(self, image_path: str, size: Tuple[int, int], stamp: FileStamp):
+        super().__init__()
+        self.image_path = image_path
+        self.size = size
+        self.stamp = stamp
+        self.signals = ThumbnailWorkerSignals()
+        self.setAutoDelete(True)
+
+    @pyqtSlot()
+    def run(self):
+        try:
+            thumbnail = get_cached_thumbnail(self.image_path, self.size)
+            # QImage (không phải QPixmap) được phép tạo ngoài GUI thread
+            qimage = QImage(
+                thumbnail.tobytes("raw", "RGBA"),
+                thumbnail.width,
+                thumbnail.height,
+                thumbnail.width * 4,
+                QImage.Format.Format_RGBA8888,
+            ).copy()
+            self.signals.loaded.emit(self.image_path, self.size, self.stamp, qimage)
+        except Exception as e:
+            self.signals.failed.emit(self.image_path, self.size, self.stamp, str(e))
+
+
+class ThumbnailLoader(QObject):
+    """
+    Loads preview thumbnails asynchronously. Results are delivered on the GUI
+    thread through `thumbnail_ready` / `thumbnail_failed`; identical requests
+    in flight are merged and recent thumbnails are kept in memory. Both are
+    keyed by the file's mtime and size too, so a replaced file is decoded again.
+    """
+
+    thumbnail_ready = pyqtSignal(str, tuple, QImage)
+    thumbnail_failed = pyqtSignal(str, tuple, str)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.logger = Logger(self.__class__.__name__)
+        self.threadpool = QThreadPool(self)
+        self.threadpool.setMaxThreadCount(THUMBNAIL_THREADS)
+        self._in_progress: Set[Tuple[str, Tuple[int, int], FileStamp]] = set()
+        self._memory: Dict[Tuple[str, Tuple[int, int]], Tuple[FileStamp, QImage]] = {}
+
+    def request(self, image_path: str, size: Tuple[int, int]):
+        """Asks for a thumbnail; emits `thumbnail_ready` (immediately if it is in memory)."""
+        size = (max(1, int(size[0])), max(1, int(size[1])))
+        try:
+            stat = os.stat(image_path)
+        except OSError as e:
+            self._on_failed(image_path, size, (), str(e))
+            return
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        cached = self._memory.get((image_path, size))
+        if cached is not None:
+            if cached[0] == stamp:
+                self.thumbnail_ready.emit(image_path, size, cached[1])
+                return
+            # File đã bị thay trong phiên làm việc: bỏ thumbnail cũ
+            del self._memory[(image_path, size)]
+        key = (image_path, size, stamp)
+        if key in self._in_progress:
+            return
+        self._in_progress.add(key)
+        worker = ThumbnailWorker(image_path, size, stamp)
+        worker.signals.loaded.connect(self._on_loaded)
+        worker.signals.failed.connect(self._on_failed)
+        self.threadpool.start(worker)
+
+    @pyqtSlot(str, tuple, tuple, QImage)
+    def _on_loaded(self, image_path: str, size: tuple, stamp: tuple, image: QImage):
+        self._in_progress.discard((image_path, size, stamp))
+        self._memory[(image_path, size)] = (stamp, image)
+        if len(self._memory) > THUMBNAIL_MEMORY_ITEMS:
+            self._memory.pop(next(iter(self._memory)))
+        self.thumbnail_ready.emit(image_path, size, image)
+
+    @pyqtSlot(str, tuple, tuple, str)
+    def _on_failed(self, image_path: str, size: tuple, stamp: tuple, error_message: str):
+        self._in_progress.discard((image_path, size, stamp))
+        self.logger.warning(f"Could not load thumbnail for '{image_path}': {error_message}")
+        self.thumbnail_failed.emit(image_path, size, error_message)
+
+
+_shared_loader: Optional[ThumbnailLoader] = None
+
+
+def shared_thumbnail_loader() -> ThumbnailLoader:
+    """The loader shared by all widgets (created on first use, on the GUI thread)."""
+    global _shared_loader
+    if _shared_loader is None:
+        _shared_loader = ThumbnailLoader()
+    return _shared_loader
@@ -0,0 +1,60 @@
+# tests/test_base_proxy_model.py
+import os
+import sys
+import unittest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtCore import QCoreApplication
+from PyQt6.QtSql import QSqlDatabase, QSqlQuery
+
+from src.models._base_model import BaseModel, BaseProxyModel
+
+
+class BaseProxyModelFilterTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QCoreApplication.instance() or QCoreApplication(sys.argv[:1])
+        cls.db = QSqlDatabase.addDatabase("QSQLITE", "test_base_proxy_model")
+        cls.db.setDatabaseName(":memory:")
+        assert cls.db.open()
+        query = QSqlQuery(cls.db)
+        query.exec("CREATE TABLE item (id TEXT PRIMARY KEY, a TEXT, b TEXT)")
+        for row_id, a, b in (("1", "x", "y"), ("2", "x", "z"), ("3", "w", "y"), ("4", "w", "z")):
+            query.exec(f"INSERT INTO item VALUES ('{row_id}', '{a}', '{b}')")
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.db.close()
+        del cls.db
+        QSqlDatabase.removeDatabase("test_base_proxy_model")
+
+    def setUp(self):
+        self.model = BaseModel(self.db, "item")
+        self.model.reload_db()
+        self.proxy = BaseProxyModel(self.model, server_side=False)
+
+    def filter(self, column: int, text: str) -> int:
+        self.proxy.set_column_filter(column, text)
+        self.proxy.apply_filters_now()
+        return self.proxy.rowCount()
+
+    def test_other_column_after_clearing_filter(self):
+        self.assertEqual(self.filter(1, "x"), 2)
+        self.assertEqual(self.filter(1, ""), 4)
+        self.assertEqual(self.filter(2, "y"), 2)
+
+    def test_other_column_after_clear_column_filters(self):
+        self.assertEqual(self.filter(1, "x"), 2)
+        self.proxy.clear_column_filters()
+        self.assertEqual(self.proxy.rowCount(), 4)
+        self.assertEqual(self.filter(2, "y"), 2)
+
+    def test_narrowing_filter(self):
+        self.assertEqual(self.filter(1, "x"), 2)
+        self.assertEqual(self.filter(2, "y"), 1)
+        self.assertEqual(self.filter(2, ""), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,72 @@
+# tests/test_import_worker.py
+import json
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtCore import QCoreApplication
+from PyQt6.QtSql import QSqlDatabase
+
+from src.benchmarks.generate_dataset import generate_dataset
+from src.controllers.import_task import ImportWorker
+from src.database.qt_database import QtDatabase
+from src.my_constants import DB_TABLES
+from src.models._base_model import BaseModel
+
+
+class ImportWorkerLazyModelTest(unittest.TestCase):
+    """A background import must commit while the GUI connection has a partly fetched SELECT open."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QCoreApplication.instance() or QCoreApplication(sys.argv[:1])
+        cls.workdir = tempfile.mkdtemp(prefix="test_import_worker_")
+        cls.previous_db_path = QtDatabase.db_path
+        generate_dataset(os.path.join(cls.workdir, "database.db"), profiles=1000, products=0)
+        cls.db = QtDatabase().get_db()
+
+    @classmethod
+    def tearDownClass(cls):
+        del cls.db
+        QtDatabase().close_connection()
+        QtDatabase._instance = None
+        QtDatabase._db = None
+        QSqlDatabase.removeDatabase("qt_sql_default_connection")
+        QtDatabase.db_path = cls.previous_db_path
+        shutil.rmtree(cls.workdir, ignore_errors=True)
+
+    def write_profiles(self, count: int) -> str:
+        file_path = os.path.join(self.workdir, "profiles.jsonl")
+        with open(file_path, "w", encoding="utf-8") as f:
+            for index in range(count):
+                record = {"mobile_ua": "m", "desktop_ua": "d", "status": 0, "username": f"import_{index}"}
+                f.write(json.dumps(record) + "\n")
+        return file_path
+
+    def test_import_while_model_is_partly_fetched(self):
+        model = BaseModel(self.db, DB_TABLES["profile"])
+        model.fetch_all = False
+        model.reload_db()
+        self.assertTrue(model.canFetchMore())
+
+        results = []
+        worker = ImportWorker("profile_service", self.write_profiles(300), "jsonl", 100)
+        worker.setAutoDelete(False)
+        worker.signals.finished.connect(results.append)
+        worker.run()
+
+        self.assertEqual(len(results), 1)
+        self.assertIsNone(results[0].error)
+        self.assertEqual(results[0].rows_imported, 300)
+        self.assertEqual(results[0].rows_failed, 0)
+        # Truy vấn đang đọc dở giữ snapshot cũ; select lại thì thấy các dòng vừa import
+        model.reload_db()
+        self.assertEqual(model.count_rows(), 1300)
+
+
+if __name__ == "__main__":
+    unittest.main()